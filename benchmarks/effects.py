@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Effect pipeline cache benchmark.
+
+Runs effect pipelines over a screenful of text for a number of frames,
+with the shared result cache and without it, and reports the time per
+frame and the cache hit rate. The cases are:
+
+- static: one tile whose content doesn't change, with a pulse, whose
+  output only depends on the pulse level, so every level is computed once
+- tiles: several tiles showing the same content with the same effects on
+  the same frame, so one tile computes each frame and the others look it up
+- scrolling: content that changes every frame, as in HexScroll, where
+  nothing ever hits and the cache only adds the cost of the lookup
+
+Usage:
+    python benchmarks/effects.py
+    python benchmarks/effects.py --size 200x60 --frames 300 --tiles 4 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.segment import Segment  # noqa: E402
+from textual.strip import Strip  # noqa: E402
+
+from hollywoodos.plugins.effects import EffectCache, EffectPipeline, MatrixFadeEffect, PulseEffect, WaveEffect  # noqa: E402
+
+
+def parse_size(value):
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def random_rows(width, height):
+    return [Strip([Segment(os.urandom(width // 2).hex())]) for _ in range(height)]
+
+
+def frames_static(width, height, frames, tiles):
+    rows = random_rows(width, height)
+    for frame in range(frames):
+        yield frame, [rows]
+
+
+def frames_tiles(width, height, frames, tiles):
+    rows = random_rows(width, height)
+    for frame in range(frames):
+        yield frame, [rows] * tiles
+
+
+def frames_scrolling(width, height, frames, tiles):
+    rows = random_rows(width, height)
+    for frame in range(frames):
+        rows = rows[1:] + random_rows(width, 1)
+        yield frame, [rows]
+
+
+CASES = {
+    "static": (frames_static, lambda: [PulseEffect(speed=0.05)]),
+    "tiles": (frames_tiles, lambda: [WaveEffect(), MatrixFadeEffect()]),
+    "scrolling": (frames_scrolling, lambda: [WaveEffect(), MatrixFadeEffect()]),
+}
+
+
+def run_case(name, width, height, frames, tiles, cached):
+    make_frames, make_effects = CASES[name]
+    cache = EffectCache() if cached else None
+    pipelines = [EffectPipeline(make_effects(), cache) for _ in range(tiles)]
+    elapsed = 0.0
+    for frame, screens in make_frames(width, height, frames, tiles):
+        start = time.perf_counter()
+        for pipeline, rows in zip(pipelines, screens):
+            pipeline.apply(rows, frame)
+        elapsed += time.perf_counter() - start
+    result = {"ms_per_frame": 1000 * elapsed / frames}
+    if cache is not None:
+        result["hit_rate"] = cache.hit_rate
+    return result
+
+
+def run(width, height, frames, tiles):
+    results = []
+    for name in CASES:
+        cached = run_case(name, width, height, frames, tiles, True)
+        uncached = run_case(name, width, height, frames, tiles, False)
+        results.append({
+            "case": name,
+            "width": width,
+            "height": height,
+            "frames": frames,
+            "hit_rate": cached["hit_rate"],
+            "ms_per_frame": cached["ms_per_frame"],
+            "uncached_ms_per_frame": uncached["ms_per_frame"],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Effect pipeline cache benchmark")
+    parser.add_argument('--size', type=parse_size, default=(200, 60), help='Tile size as WIDTHxHEIGHT')
+    parser.add_argument('--frames', type=int, default=300, help='Frames to run per case')
+    parser.add_argument('--tiles', type=int, default=4, help='Tiles showing the same content in the tiles case')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    width, height = args.size
+    results = run(width, height, args.frames, args.tiles)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        speedup = result['uncached_ms_per_frame'] / result['ms_per_frame']
+        print(f"{result['case']:<10} {result['width']}x{result['height']}"
+              f"  hit rate {result['hit_rate']:6.1%}"
+              f"  {result['ms_per_frame']:8.3f} ms/frame"
+              f"  (uncached: {result['uncached_ms_per_frame']:.3f} ms/frame, {speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
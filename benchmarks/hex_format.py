@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Hex formatting micro-benchmark.
+
+Measures rows/sec of HexFormatter at several terminal widths and word
+groupings, next to the old one-f-string-per-byte approach as a baseline.
+A full-screen HexScroll at a 4K terminal is roughly 480 columns by 130 rows.
+
+Usage:
+    python benchmarks/hex_format.py
+    python benchmarks/hex_format.py --width 200 --width 480 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hollywoodos.utils.hexfmt import HexFormatter  # noqa: E402
+
+DEFAULT_WIDTHS = [80, 200, 480]
+# (group, endian, with offset column and ASCII gutter)
+CASES = [
+    (1, "big", False),
+    (1, "big", True),
+    (2, "little", True),
+    (4, "little", True),
+    (8, "big", True),
+]
+
+
+def baseline_rows(data, bytes_per_row, offset=0):
+    """Per-byte formatting, as HexScroll used to do it"""
+    rows = []
+    for start in range(0, len(data), bytes_per_row):
+        chunk = data[start:start + bytes_per_row]
+        hex_part = " ".join(f"{b:02X}" for b in chunk)
+        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+        rows.append(f"{offset + start:08X}: {hex_part}  {ascii_part}")
+    return rows
+
+
+def rows_per_sec(func, rows, duration):
+    """Call func repeatedly for about duration seconds; rows is the rows per call"""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls * rows / elapsed
+
+
+def run(widths, height, duration):
+    results = []
+    for width in widths:
+        for group, endian, dump in CASES:
+            formatter = HexFormatter(group, endian, offset_width=8 if dump else 0, gutter=dump)
+            bytes_per_row = formatter.fit(width)
+            data = os.urandom(bytes_per_row * height)
+            result = {
+                "width": width,
+                "group": group,
+                "endian": endian,
+                "dump": dump,
+                "bytes_per_row": bytes_per_row,
+                "rows_per_sec": rows_per_sec(
+                    lambda: formatter.format_rows(data, bytes_per_row), height, duration
+                ),
+            }
+            if group == 1 and dump:
+                result["baseline_rows_per_sec"] = rows_per_sec(
+                    lambda: baseline_rows(data, bytes_per_row), height, duration
+                )
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hex formatting micro-benchmark")
+    parser.add_argument('--width', type=int, action='append', dest='widths',
+                        help='Terminal width in columns (repeatable)')
+    parser.add_argument('--height', type=int, default=60, help='Rows formatted per call')
+    parser.add_argument('--duration', type=float, default=0.5, help='Seconds per case')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.widths or DEFAULT_WIDTHS, args.height, args.duration)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        label = f"{result['group']}-byte {result['endian']}{' dump' if result['dump'] else ''}"
+        line = (f"{result['width']:4d} cols  {label:<18} {result['bytes_per_row']:4d} B/row"
+                f"  {result['rows_per_sec']:12,.0f} rows/s")
+        if "baseline_rows_per_sec" in result:
+            speedup = result['rows_per_sec'] / result['baseline_rows_per_sec']
+            line += f"  (per-byte: {result['baseline_rows_per_sec']:,.0f} rows/s, {speedup:.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
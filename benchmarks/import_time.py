@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Import-time report for HollywoodOS entry points.
+
+Runs each entry point in a fresh interpreter under ``python -X importtime``
+and reports its total import cost and slowest modules. CLI-only entry points
+must not import Textual; the script exits non-zero if one does, or if any
+entry point exceeds --max-ms.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --json --max-ms 150
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+# label -> (code to run, whether Textual may be imported)
+ENTRY_POINTS = {
+    "package": ("import hollywoodos", False),
+    "list_plugins": (
+        "from hollywoodos.plugins.registry import PluginRegistry; PluginRegistry().list_plugins()",
+        False,
+    ),
+    "config": ("from hollywoodos.core.config_manager import ConfigManager", False),
+    "app": ("from hollywoodos.app import HollywoodOS", True),
+}
+
+FORBIDDEN_FOR_CLI = ("textual",)
+
+
+def measure(code):
+    """Run code under -X importtime and return {module: (self_us, cumulative_us)}"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nesting is shown by indentation; top-level imports have none
+        modules[name.strip()] = (int(self_us), int(cumulative_us), not name[1:].startswith(" "))
+    return modules
+
+
+def report(label, code, allow_textual, top):
+    modules = measure(code)
+    total_us = sum(cumulative for _, cumulative, top_level in modules.values() if top_level)
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    forbidden = [] if allow_textual else sorted(
+        name for name in modules if name.split(".")[0] in FORBIDDEN_FOR_CLI
+    )
+    return {
+        "entry_point": label,
+        "total_ms": total_us / 1000,
+        "modules": len(modules),
+        "slowest": [{"module": name, "self_ms": self_us / 1000} for name, (self_us, _, _) in slowest],
+        "forbidden_imports": forbidden,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time report for HollywoodOS")
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--top', type=int, default=5, help='Number of slowest modules to show')
+    parser.add_argument('--max-ms', type=float, help='Fail if any entry point takes longer')
+    args = parser.parse_args()
+
+    results = [
+        report(label, code, allow_textual, args.top)
+        for label, (code, allow_textual) in ENTRY_POINTS.items()
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(f"{result['entry_point']:<14} {result['total_ms']:8.1f} ms  {result['modules']:4d} modules")
+            for module in result['slowest']:
+                print(f"    {module['self_ms']:8.1f} ms  {module['module']}")
+            if result['forbidden_imports']:
+                print(f"    !! imports {', '.join(result['forbidden_imports'][:5])}")
+
+    failed = False
+    for result in results:
+        if result['forbidden_imports']:
+            print(f"FAIL: {result['entry_point']} imports Textual", file=sys.stderr)
+            failed = True
+        if args.max_ms is not None and result['total_ms'] > args.max_ms:
+            print(f"FAIL: {result['entry_point']} took {result['total_ms']:.1f} ms", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+MatrixRain simulation benchmark.
+
+Steps and renders a rain field of a given size for a number of frames,
+without a terminal, and reports the cost per frame and the share of one
+core it takes at the requested frame rate. The target is 500x200 at 10 FPS
+in under 10% of a core.
+
+Usage:
+    python benchmarks/matrix_rain.py
+    python benchmarks/matrix_rain.py --size 500x200 --fps 10 --max-percent 10
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hollywoodos.plugins.builtin.matrix_rain import RainField, RainRenderer  # noqa: E402
+from hollywoodos.utils.entropy import EntropyPool  # noqa: E402
+
+
+def parse_size(value):
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def run(width, height, density, frames, fps):
+    field = RainField(width, height, density, EntropyPool(seed=0))
+    renderer = RainRenderer()
+    # Let the drops fall onto the screen first
+    for _ in range(height):
+        field.step()
+
+    step_time = render_time = 0.0
+    dirty_rows = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        field.step()
+        middle = time.perf_counter()
+        dirty_rows += len(renderer.update(field))
+        end = time.perf_counter()
+        step_time += middle - start
+        render_time += end - middle
+
+    frame_ms = (step_time + render_time) * 1000 / frames
+    return {
+        "size": [width, height],
+        "drops": len(field.xs),
+        "frames": frames,
+        "step_ms": step_time * 1000 / frames,
+        "render_ms": render_time * 1000 / frames,
+        "dirty_rows": dirty_rows / frames,
+        "frame_ms": frame_ms,
+        "fps": fps,
+        "core_percent": frame_ms * fps / 10,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MatrixRain simulation benchmark")
+    parser.add_argument('--size', type=parse_size, default=(500, 200), help='Field size as WxH')
+    parser.add_argument('--density', type=float, default=0.1, help='Drops per column')
+    parser.add_argument('--frames', type=int, default=200, help='Frames to measure')
+    parser.add_argument('--fps', type=float, default=10, help='Frame rate to report core usage at')
+    parser.add_argument('--max-percent', type=float, help='Fail if core usage exceeds this')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    result = run(*args.size, args.density, args.frames, args.fps)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['size'][0]}x{result['size'][1]}, {result['drops']} drops, {result['frames']} frames")
+        print(f"  step    {result['step_ms']:8.3f} ms/frame")
+        print(f"  render  {result['render_ms']:8.3f} ms/frame ({result['dirty_rows']:.1f} rows rebuilt)")
+        print(f"  total   {result['frame_ms']:8.3f} ms/frame = {result['core_percent']:.1f}% of a core at {args.fps:g} FPS")
+
+    if args.max_percent is not None and result['core_percent'] > args.max_percent:
+        print(f"FAIL: {result['core_percent']:.1f}% > {args.max_percent:g}%", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ Usage:
     python run.py --test-plugin PLUGIN      # Test a single plugin fullscreen
     python run.py --test-plugin PLUGIN --plugin-config key=value key2=value2
     python run.py --list-plugins            # List available plugins
+    python run.py --check-config            # Validate the config file and exit
+    python run.py --bench                   # Benchmark plugins and layouts headlessly
 """
 
 import sys
@@ -106,6 +108,62 @@ def list_plugins():
     print("  python run.py --test-plugin MatrixRain --plugin-config density=0.2")
 
 
+def check_config(config_path):
+    """Validate a configuration file without starting the UI"""
+    from src.hollywoodos.core.config_manager import ConfigManager, LAYOUT_TYPES
+    from src.hollywoodos.plugins.registry import PluginRegistry
+    
+    if not Path(config_path).exists():
+        print(f"Config file not found: {config_path}")
+        return False
+        
+    config_manager = ConfigManager(config_path)
+    registry = PluginRegistry()
+    available = set(registry.list_plugins())
+    problems = []
+    
+    layout_type = config_manager.layout.layout_type
+    if layout_type not in LAYOUT_TYPES:
+        problems.append(f"unknown layout_type '{layout_type}' (expected one of {', '.join(LAYOUT_TYPES)})")
+        
+    for window in config_manager.windows:
+        for plugin_config in window.plugins:
+            if plugin_config.type not in available:
+                problems.append(f"window '{window.id}': unknown plugin '{plugin_config.type}'")
+                
+    print(f"Config: {config_manager.config_path}")
+    print(f"Layout: {layout_type}, {len(config_manager.windows)} windows")
+    for problem in problems:
+        print(f"  error: {problem}")
+    if not problems:
+        print("OK")
+    return not problems
+
+
+def parse_size(value):
+    """Parse a WIDTHxHEIGHT terminal size"""
+    try:
+        width, height = value.lower().split('x', 1)
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size '{value}' (expected WIDTHxHEIGHT)")
+
+
+def bench_mode(config_path, frames, sizes, plugins, layouts):
+    """Run the headless benchmark and print the results as JSON"""
+    import json
+    from src.hollywoodos.bench import benchmark, DEFAULT_SIZES
+    
+    results = benchmark(
+        config_path=config_path,
+        sizes=sizes or DEFAULT_SIZES,
+        frames=frames,
+        plugins=plugins,
+        layouts=layouts,
+    )
+    print(json.dumps(results, indent=2))
+
+
 def main():
     """Main entry point with argument parsing"""
     parser = argparse.ArgumentParser(
@@ -117,6 +175,7 @@ Examples:
   python run.py --test-plugin TacticalMap
   python run.py --test-plugin TacticalMap --plugin-config target_interval=2.0 num_coordinates=5
   python run.py --list-plugins     # Show available plugins
+  python run.py --bench --bench-size 80x24 --bench-frames 200
         """
     )
     
@@ -145,6 +204,47 @@ Examples:
         help='List all available plugins and exit'
     )
     
+    parser.add_argument(
+        '--check-config',
+        action='store_true',
+        help='Validate the configuration file and exit'
+    )
+    
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Benchmark every plugin and layout headlessly and print JSON results'
+    )
+    
+    parser.add_argument(
+        '--bench-frames',
+        type=int,
+        default=100,
+        help='Number of frame clock ticks to measure per run (default: 100)'
+    )
+    
+    parser.add_argument(
+        '--bench-size',
+        type=parse_size,
+        action='append',
+        metavar='WxH',
+        help='Terminal size to benchmark at; repeatable (default: 80x24 and 200x60)'
+    )
+    
+    parser.add_argument(
+        '--bench-plugin',
+        action='append',
+        metavar='PLUGIN',
+        help='Only benchmark these plugins; repeatable (default: all)'
+    )
+    
+    parser.add_argument(
+        '--bench-layout',
+        action='append',
+        metavar='LAYOUT',
+        help='Only benchmark these layouts; repeatable (default: all)'
+    )
+    
     args = parser.parse_args()
     
     # Handle list plugins
@@ -152,6 +252,21 @@ Examples:
         list_plugins()
         sys.exit(0)
     
+    # Handle config validation
+    if args.check_config:
+        sys.exit(0 if check_config(args.config) else 1)
+    
+    # Handle benchmark mode
+    if args.bench:
+        bench_mode(
+            args.config,
+            args.bench_frames,
+            args.bench_size,
+            args.bench_plugin,
+            args.bench_layout
+        )
+        sys.exit(0)
+    
     # Handle test plugin mode
     if args.test_plugin:
         plugin_config = parse_plugin_config(args.plugin_config)
@@ -160,7 +275,7 @@ Examples:
     
     # Normal mode - run the full app
     from src.hollywoodos.app import HollywoodOS
-    app = HollywoodOS()
+    app = HollywoodOS(args.config)
     app.run()
 
 
@@ -7,10 +7,23 @@ __version__ = "0.1.0"
 __author__ = "thraal"
 __email__ = "thraal@gmail.com"
 
-# Import main classes for convenient access
-from .app import HollywoodOS
-from .core.config_manager import ConfigManager
-from .plugins.registry import PluginRegistry
+# Main classes are imported on first access, so that CLI-only paths
+# (listing plugins, checking configs) never pay for importing Textual
+_LAZY_ATTRIBUTES = {
+    "HollywoodOS": ".app",
+    "ConfigManager": ".core.config_manager",
+    "PluginRegistry": ".plugins.registry",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 # Define what gets imported with "from hollywoodos import *"
 __all__ = [
@@ -2,6 +2,9 @@
 from textual.app import App
 
 from .core.config_manager import ConfigManager
+from .core.frame_clock import FrameClock, schedule_interval
+from .core.governor import FrameGovernor
+from .core.search_prompt import SearchPrompt
 from .core.window_manager import WindowManager
 from .plugins.registry import PluginRegistry
 
@@ -15,6 +18,7 @@ class HollywoodOS(App):
 
     /* Style each tile with a visible border */
     TileWindow {
+        layers: default overlay;
         background: $surface;
         overflow: hidden;
         width: 100%;
@@ -22,6 +26,19 @@ class HollywoodOS(App):
         border: solid $surface-lighten-1;
     }
 
+    /* Performance HUD, drawn over the plugin and toggled with "p" */
+    PerfOverlay {
+        layer: overlay;
+        dock: bottom;
+        height: auto;
+        display: none;
+        background: $panel 80%;
+    }
+
+    WindowManager.show-perf PerfOverlay {
+        display: block;
+    }
+
     /* Plugin widgets fill their tile container */
     .plugin-widget {
         width: 100%;
@@ -30,11 +47,43 @@ class HollywoodOS(App):
     }
     """
 
-    def __init__(self):
+    BINDINGS = [
+        ("p", "toggle_perf_overlay", "Performance overlay"),
+        ("slash", "filter_logs", "Filter logs"),
+    ]
+
+    def __init__(self, config_path: str = "config/default.yaml"):
         super().__init__()
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager(config_path)
         self.plugin_registry = PluginRegistry()
+        self.frame_clock = FrameClock(self.config_manager.layout.frame_interval)
         self.window_manager = None
+        self.governor = None
+        self._config_watch = None
+
+    def on_mount(self):
+        # One shared timer drives every plugin's updates
+        self.frame_clock.start(self)
+        # Throttle expensive tiles when the frame budget is exceeded
+        self.governor = FrameGovernor(self.config_manager, self.frame_clock, self.window_manager)
+        self.governor.start(self)
+        self._schedule_config_watch()
+
+    def _schedule_config_watch(self):
+        """(Re)start polling the config file if layout.watch_interval is set"""
+        interval = self.config_manager.layout.watch_interval
+        if self._config_watch is not None:
+            if self._config_watch.interval == interval:
+                return
+            self._config_watch.stop()
+            self._config_watch = None
+        if interval > 0:
+            self._config_watch = schedule_interval(self, interval, self._check_config)
+
+    def _check_config(self):
+        """Reload when the config file's contents changed"""
+        if self.config_manager.has_changed():
+            self.action_reload_config()
 
     def compose(self):
         # Mount the WindowManager so it fills all available space
@@ -46,10 +95,36 @@ class HollywoodOS(App):
 
     def action_reload_config(self):
         self.config_manager.reload()
+        self.frame_clock.set_frame_interval(self.config_manager.layout.frame_interval)
+        self._schedule_config_watch()
         if self.window_manager is not None:
             self.window_manager.reload_layout()
         self.notify("Configuration reloaded")
 
+    def action_toggle_perf_overlay(self):
+        """Show or hide the performance HUD on every tile"""
+        if self.window_manager is not None:
+            self.window_manager.toggle_class("show-perf")
+
+    def action_filter_logs(self):
+        """Ask for a term to filter log panes by (empty clears the filter)"""
+        self.push_screen(SearchPrompt("Filter logs (empty to clear)"), self._apply_log_filter)
+
+    def _apply_log_filter(self, term):
+        """Filter the focused tile if it supports it, otherwise every tile that does"""
+        if term is None or self.window_manager is None:
+            return
+        tiles = self.window_manager.tiles
+        widgets = [tile.current_widget for tile in tiles if hasattr(tile.current_widget, "set_filter")]
+        if tiles:
+            focused = tiles[self.window_manager.focused_index].current_widget
+            if focused in widgets:
+                widgets = [focused]
+        if not widgets:
+            self.notify("No log pane to filter", severity="warning")
+        for widget in widgets:
+            widget.set_filter(term)
+
     # Note: split_horizontal, split_vertical, and close_window actions 
     # have been removed as they are not supported with fixed layouts
     
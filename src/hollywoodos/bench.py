@@ -0,0 +1,134 @@
+# bench.py
+"""
+Headless benchmark harness for HollywoodOS plugins and layouts.
+
+Drives HollywoodOS through Textual's test pilot at fixed terminal sizes for a
+fixed number of frames of the shared frame clock, and reports per-plugin
+tick/render cost, achieved vs. requested update rate and process CPU usage.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .app import HollywoodOS
+from .core.config_manager import PluginConfig, WindowConfig
+from .core.metrics import get_metrics
+from .core.window_manager import WindowManager
+from .plugins.effects import get_effect_registry
+from .plugins.registry import PluginRegistry
+
+DEFAULT_SIZES: List[Tuple[int, int]] = [(80, 24), (200, 60)]
+DEFAULT_FRAMES = 100
+WARMUP_SECONDS = 0.5
+
+
+def _tile_report(tile) -> List[Dict[str, Any]]:
+    """Collect metrics of every plugin widget mounted in a tile"""
+    report = []
+    for plugin in tile.plugins:
+        widget = plugin._widget
+        metrics = get_metrics(widget) if widget is not None else None
+        if metrics is None:
+            continue
+        refresh_rate = plugin.get_config('refresh_rate')
+        entry = {
+            "tile": tile.id,
+            "plugin": type(plugin).__name__,
+            "refresh_rate": refresh_rate,
+            "requested_fps": 1 / refresh_rate if refresh_rate else None,
+        }
+        entry.update(metrics.snapshot())
+        report.append(entry)
+    return report
+
+
+async def _measure(app: HollywoodOS, size: Tuple[int, int], frames: int) -> Dict[str, Any]:
+    """Run an app headlessly for a number of clock frames and collect metrics"""
+    async with app.run_test(headless=True, size=size) as pilot:
+        clock = app.frame_clock
+        # Let the layout mount and settle before measuring
+        await pilot.pause(WARMUP_SECONDS)
+        tiles = app.window_manager.tiles
+        for tile in tiles:
+            for plugin in tile.plugins:
+                metrics = get_metrics(plugin._widget) if plugin._widget is not None else None
+                if metrics is not None:
+                    metrics.reset()
+        get_effect_registry().cache.clear()
+
+        start_frame = clock.frame
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        while clock.frame - start_frame < frames:
+            await pilot.pause(clock.frame_interval)
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        measured_frames = clock.frame - start_frame
+
+        plugins = []
+        for tile in tiles:
+            plugins.extend(_tile_report(tile))
+
+    return {
+        "size": list(size),
+        "frames": measured_frames,
+        "wall_s": wall,
+        "cpu_percent": 100 * cpu / wall if wall > 0 else 0.0,
+        "clock_fps": measured_frames / wall if wall > 0 else 0.0,
+        "requested_clock_fps": 1 / clock.frame_interval,
+        "plugins": plugins,
+        "effect_cache": get_effect_registry().cache.stats(),
+    }
+
+
+def _plugin_app(config_path: str, plugin_name: str) -> HollywoodOS:
+    """Build an app showing a single plugin fullscreen"""
+    app = HollywoodOS(config_path)
+    app.config_manager._layout.layout_type = "single"
+    app.config_manager._windows = [
+        WindowConfig(id="bench", plugins=[PluginConfig(type=plugin_name)])
+    ]
+    return app
+
+
+def _layout_app(config_path: str, layout_type: str) -> HollywoodOS:
+    """Build an app using the configured windows in the given layout"""
+    app = HollywoodOS(config_path)
+    app.config_manager._layout.layout_type = layout_type
+    return app
+
+
+async def run_benchmark(
+    config_path: str = "config/default.yaml",
+    sizes: Iterable[Tuple[int, int]] = DEFAULT_SIZES,
+    frames: int = DEFAULT_FRAMES,
+    plugins: Optional[List[str]] = None,
+    layouts: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Benchmark every plugin fullscreen and every layout at each size"""
+    sizes = list(sizes)
+    if plugins is None:
+        plugins = sorted(PluginRegistry().list_plugins())
+    if layouts is None:
+        layouts = list(WindowManager.LAYOUT_TYPES)
+
+    runs = []
+    for size in sizes:
+        for plugin_name in plugins:
+            result = await _measure(_plugin_app(config_path, plugin_name), size, frames)
+            runs.append({"kind": "plugin", "name": plugin_name, **result})
+        for layout_type in layouts:
+            result = await _measure(_layout_app(config_path, layout_type), size, frames)
+            runs.append({"kind": "layout", "name": layout_type, **result})
+
+    return {
+        "config": config_path,
+        "frames": frames,
+        "runs": runs,
+    }
+
+
+def benchmark(**kwargs) -> Dict[str, Any]:
+    """Synchronous wrapper around run_benchmark"""
+    return asyncio.run(run_benchmark(**kwargs))
@@ -1,8 +1,20 @@
 # config_manager.py
-import yaml
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from ..utils.helpers import cache_dir
+
+# Bump when the snapshot layout changes so stale caches are ignored
+SNAPSHOT_VERSION = 3
+
+LAYOUT_TYPES = ("single", "2x2", "2x2_big", "3x3")
+
+# Plugin config keys holding file paths (or lists of them); relative paths
+# are taken relative to the config file's directory
+PATH_KEYS = ("source", "sources", "replay", "retention_path")
 
 @dataclass
 class PluginConfig:
@@ -16,6 +28,8 @@ class WindowConfig:
     plugins: list[PluginConfig] = field(default_factory=list)
     cycle_interval: float = 0
     min_size: tuple[int, int] = (10, 3)
+    effects: list = field(default_factory=list)  # post-processing applied to the tile's output
+    effect_interval: float = 0.1  # seconds between effect animation frames
 
 @dataclass
 class LayoutConfig:
@@ -23,6 +37,10 @@ class LayoutConfig:
     border_style: str = "solid"
     focus_color: str = "$primary"
     unfocus_color: str = "$surface-lighten-1"
+    frame_interval: float = 0.05  # seconds per tick of the shared frame clock
+    frame_budget: float = 0  # ms of plugin work per frame; 0 disables the governor
+    max_slowdown: float = 4.0  # largest factor the governor may stretch a refresh_rate by
+    watch_interval: float = 0  # seconds between config file change checks; 0 disables
 
 class ConfigManager:
     def __init__(self, config_path: str = "config/default.yaml"):
@@ -32,10 +50,18 @@ class ConfigManager:
         self._windows = []
         self._plugin_defaults = {}
         self._global_defaults = {}
+        # Merged plugin configs: (type, id(instance config)) -> (instance config, merged)
+        self._merged: Dict[Tuple[str, int], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
         self.load()
 
     def load(self):
-        """Load configuration from file"""
+        """Load configuration from file.
+
+        The parsed and merged result is cached on disk keyed by the file's
+        content hash, so an unchanged file is never YAML-parsed twice.
+        """
         if not self.config_path.exists():
             # Try alternative paths
             alt_paths = [
@@ -52,23 +78,120 @@ class ConfigManager:
                 self._create_default_config()
         
         try:
-            with open(self.config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+            data = self.config_path.read_bytes()
+        except OSError as e:
+            print(f"Error loading config: {e}")
+            self._create_default_config()
+            self._parse_config()
+            return
+
+        self._stamp = self._stat_stamp()
+        self._digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if self._load_snapshot():
+            return
+
+        try:
+            import yaml
+            self._config = yaml.safe_load(data) or {}
         except Exception as e:
             print(f"Error loading config: {e}")
             self._create_default_config()
-        
+            self._parse_config()
+            return
+
         self._parse_config()
+        self._save_snapshot()
 
-    def _parse_config(self):
-        """Parse configuration into structured objects"""
+    def _stat_stamp(self) -> Optional[Tuple[int, int]]:
+        """Cheap change marker for the config file: (mtime_ns, size)"""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def has_changed(self) -> bool:
+        """Check whether the config file's contents changed since the last load.
+
+        Only stats the file unless its mtime or size moved, in which case the
+        contents are hashed so a mere touch doesn't count as a change.
+        """
+        stamp = self._stat_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            data = self.config_path.read_bytes()
+        except OSError:
+            return False
+        return hashlib.blake2b(data, digest_size=16).hexdigest() != self._digest
+
+    def _snapshot_path(self) -> Path:
+        key = hashlib.blake2b(str(self.config_path.resolve()).encode(), digest_size=8).hexdigest()
+        return cache_dir() / f"config-{key}.json"
+
+    def _load_snapshot(self) -> bool:
+        """Restore the compiled config from disk if it matches the file.
+
+        The snapshot is plain JSON, so a tampered cache can at worst hold a
+        wrong config, never run code.
+        """
+        try:
+            with open(self._snapshot_path(), encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot["version"] != SNAPSHOT_VERSION or snapshot["digest"] != self._digest:
+                return False
+            self._config = snapshot["config"]
+            self._parse_config(snapshot["merged"])
+            return True
+        except Exception:
+            return False
+
+    def _save_snapshot(self):
+        """Write the compiled config to disk; failures only cost the cache"""
+        merged = [
+            [self.get_plugin_config(p.type, p.config) for p in window.plugins]
+            for window in self._windows
+        ]
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "digest": self._digest,
+            "config": self._config,
+            "merged": merged,
+        }
+        path = self._snapshot_path()
+        try:
+            text = json.dumps(snapshot)
+            # YAML can hold what JSON can't give back as it was (dates,
+            # non-string keys); such a config is parsed every time
+            if json.loads(text) != snapshot:
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+
+    def _parse_config(self, merged: Optional[list] = None):
+        """Parse configuration into structured objects.
+
+        merged optionally holds precomputed plugin configs per window, as
+        stored in the compiled snapshot.
+        """
+        self._merged = {}
         # Layout config
         layout_data = self._config.get('layout', {})
         self._layout = LayoutConfig(
             layout_type=layout_data.get('layout_type', '2x2'),
             border_style=layout_data.get('border_style', 'solid'),
             focus_color=layout_data.get('focus_color', '$primary'),
-            unfocus_color=layout_data.get('unfocus_color', '$surface-lighten-1')
+            unfocus_color=layout_data.get('unfocus_color', '$surface-lighten-1'),
+            frame_interval=layout_data.get('frame_interval', 0.05),
+            frame_budget=layout_data.get('frame_budget', 0),
+            max_slowdown=layout_data.get('max_slowdown', 4.0),
+            watch_interval=layout_data.get('watch_interval', 0)
         )
         
         # Global defaults
@@ -99,9 +222,16 @@ class ConfigManager:
                 min_size=(
                     window_data.get('min_width', 10),
                     window_data.get('min_height', 3)
-                )
+                ),
+                effects=window_data.get('effects', []),
+                effect_interval=window_data.get('effect_interval', 0.1)
             ))
 
+        if merged is not None:
+            for window, window_merged in zip(self._windows, merged):
+                for plugin, plugin_merged in zip(window.plugins, window_merged):
+                    self._merged[(plugin.type, id(plugin.config))] = (plugin.config, plugin_merged)
+
     def _create_default_config(self):
         """Create default configuration"""
         default = {
@@ -130,6 +260,7 @@ class ConfigManager:
                     'refresh_rate': 0.5
                 },
                 'TacticalMap': {
+                    'refresh_rate': 0.1,
                     'target_interval': 5.0,
                     'num_coordinates': 3
                 }
@@ -165,6 +296,7 @@ class ConfigManager:
         # Create config directory if it doesn't exist
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
+        import yaml
         with open(self.config_path, 'w') as f:
             yaml.dump(default, f, default_flow_style=False, indent=2)
         
@@ -176,10 +308,35 @@ class ConfigManager:
 
     def get_plugin_config(self, plugin_type: str, instance_config: Dict[str, Any]) -> Dict[str, Any]:
         """Get merged configuration for a plugin instance"""
-        config = self._global_defaults.copy()
-        config.update(self._plugin_defaults.get(plugin_type, {}))
-        config.update(instance_config)
-        return config
+        key = (plugin_type, id(instance_config))
+        cached = self._merged.get(key)
+        # The cache holds the instance dict itself, so its id can't be reused
+        if cached is None or cached[0] is not instance_config:
+            config = self._global_defaults.copy()
+            config.update(self._plugin_defaults.get(plugin_type, {}))
+            config.update(instance_config)
+            self._resolve_paths(config)
+            cached = (instance_config, config)
+            self._merged[key] = cached
+        # Plugins may update their config, so never hand out the cached dict
+        return cached[1].copy()
+
+    def _resolve_paths(self, config: Dict[str, Any]):
+        """Make relative file paths in a plugin config relative to the config file"""
+        base = self.config_path.resolve().parent
+
+        def resolve(value):
+            if not isinstance(value, str) or not value:
+                return value
+            path = Path(value).expanduser()
+            return str(path) if path.is_absolute() else os.path.normpath(base / path)
+
+        for key in PATH_KEYS:
+            value = config.get(key)
+            if isinstance(value, list):
+                config[key] = [resolve(item) for item in value]
+            elif value is not None:
+                config[key] = resolve(value)
 
     @property
     def layout(self) -> LayoutConfig:
@@ -0,0 +1,172 @@
+# frame_clock.py
+import time
+from typing import Any, Callable, List, Optional
+from weakref import WeakKeyDictionary, WeakSet
+from .metrics import get_metrics
+
+
+class FrameSubscription:
+    """A periodic callback driven by the shared FrameClock.
+
+    Mirrors the pause/resume/stop API of Textual's Timer so plugins can
+    treat both the same way.
+    """
+
+    def __init__(self, owner: Any, interval: float, callback: Callable[[], Any]):
+        self.owner = owner
+        self.base_interval = interval
+        self.interval = interval
+        self.callback = callback
+        self.next_due = time.monotonic() + interval
+        self.paused = False
+        self.active = True
+        self.late_ticks = 0
+
+    def pause(self):
+        """Stop firing until resumed"""
+        self.paused = True
+
+    def resume(self):
+        """Start firing again, one interval from now"""
+        if self.paused:
+            self.paused = False
+            self.next_due = time.monotonic() + self.interval
+
+    def reset(self):
+        """Restart the interval from now"""
+        self.next_due = time.monotonic() + self.interval
+
+    def stop(self):
+        """Permanently remove this subscription from the clock"""
+        self.active = False
+
+    def set_scale(self, scale: float):
+        """Stretch the interval by scale relative to the requested one"""
+        self.interval = self.base_interval * scale
+
+
+class FrameClock:
+    """Single app-wide timer that ticks every plugin on a common frame grid.
+
+    Plugins subscribe with their desired rate; on every frame the clock runs
+    all subscriptions that are due inside one batch update, so they share a
+    single repaint instead of each timer triggering its own.
+    """
+
+    def __init__(self, frame_interval: float = 0.05):
+        self.frame_interval = frame_interval
+        self.frame = 0
+        self._subscriptions: List[FrameSubscription] = []
+        self._app = None
+        self._timer = None
+
+    def start(self, app):
+        """Start ticking on the given app"""
+        self._app = app
+        if self._timer is None:
+            self._timer = app.set_interval(self.frame_interval, self._tick)
+
+    def stop(self):
+        """Stop ticking"""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def set_frame_interval(self, frame_interval: float):
+        """Change the frame interval, restarting the timer if running"""
+        if frame_interval == self.frame_interval:
+            return
+        self.frame_interval = frame_interval
+        if self._timer is not None:
+            self.stop()
+            self.start(self._app)
+
+    def subscribe(self, owner: Any, interval: float, callback: Callable[[], Any]) -> FrameSubscription:
+        """Run callback every interval seconds, rounded to the frame grid"""
+        subscription = FrameSubscription(owner, max(interval, self.frame_interval), callback)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def set_rate_scale(self, owner: Any, scale: float):
+        """Slow down (scale > 1) or restore every subscription of an owner"""
+        for subscription in self._subscriptions:
+            if subscription.owner is owner:
+                subscription.set_scale(scale)
+
+    def _is_alive(self, subscription: FrameSubscription) -> bool:
+        """Check whether a subscription should stay registered"""
+        if not subscription.active:
+            return False
+        owner = subscription.owner
+        # Widgets drop out once they are removed from the DOM
+        return getattr(owner, "is_attached", True)
+
+    def _tick(self):
+        """Run every subscription that is due in this frame"""
+        self.frame += 1
+        now = time.monotonic()
+        # Anything due within half a frame fires now, so rates that are not
+        # exact multiples of the frame interval don't drift a frame late
+        horizon = now + self.frame_interval / 2
+
+        self._subscriptions = [s for s in self._subscriptions if self._is_alive(s)]
+        due = [s for s in self._subscriptions if not s.paused and s.next_due <= horizon]
+        if not due:
+            return
+
+        with self._app.batch_update():
+            for subscription in due:
+                metrics = get_metrics(subscription.owner)
+                subscription.next_due += subscription.interval
+                if subscription.next_due <= now:
+                    # Fell behind by at least a full interval; skip the
+                    # backlog rather than firing several times in one frame
+                    missed = int((now - subscription.next_due) / subscription.interval) + 1
+                    subscription.late_ticks += missed
+                    subscription.next_due += missed * subscription.interval
+                    if metrics is not None:
+                        metrics.record_late(missed)
+
+                if metrics is None:
+                    subscription.callback()
+                else:
+                    start = time.perf_counter()
+                    subscription.callback()
+                    metrics.record_tick(time.perf_counter() - start)
+
+
+# Handles created by schedule_interval, per widget, so they can be paused
+# together when the widget is hidden
+_schedules: "WeakKeyDictionary[Any, list]" = WeakKeyDictionary()
+_suspended: "WeakSet[Any]" = WeakSet()
+
+
+def schedule_interval(widget, interval: float, callback: Callable[[], Any]):
+    """Call callback every interval seconds on behalf of a widget.
+
+    Uses the app's shared frame clock when there is one, and falls back to a
+    plain widget timer otherwise (e.g. in the single-plugin test app).
+    """
+    clock: Optional[FrameClock] = getattr(widget.app, "frame_clock", None)
+    if clock is None:
+        handle = widget.set_interval(interval, callback)
+    else:
+        handle = clock.subscribe(widget, interval, callback)
+    if widget in _suspended:
+        handle.pause()
+    _schedules.setdefault(widget, []).append(handle)
+    return handle
+
+
+def suspend_schedules(widget):
+    """Pause every interval the widget registered via schedule_interval"""
+    _suspended.add(widget)
+    for handle in _schedules.get(widget, []):
+        handle.pause()
+
+
+def resume_schedules(widget):
+    """Resume intervals paused by suspend_schedules"""
+    _suspended.discard(widget)
+    for handle in _schedules.get(widget, []):
+        handle.resume()
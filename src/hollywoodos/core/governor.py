@@ -0,0 +1,88 @@
+# governor.py
+from typing import Any, Dict
+from weakref import WeakKeyDictionary
+from .config_manager import ConfigManager
+from .frame_clock import FrameClock, schedule_interval
+from .metrics import get_metrics
+
+
+class FrameGovernor:
+    """Adapts plugin update rates to a per-frame cost budget.
+
+    Once a second it measures how much tick+render time each visible tile
+    spent per frame of the shared clock. When the total exceeds
+    ``layout.frame_budget`` (ms), every tile that is over its share of the
+    budget (shares are proportional to ``PluginConfig.weight``) has its
+    refresh interval stretched, up to ``layout.max_slowdown``. When there is
+    headroom again, stretched tiles are gradually sped back up.
+    """
+
+    SAMPLE_INTERVAL = 1.0
+    # Fraction of the budget below which throttled tiles speed back up
+    HEADROOM = 0.7
+    # Factor a throttled tile's interval shrinks by per sample with headroom
+    RECOVERY = 1.25
+
+    def __init__(self, config_manager: ConfigManager, clock: FrameClock, window_manager):
+        self.config_manager = config_manager
+        self.clock = clock
+        self.window_manager = window_manager
+        self.scales: "WeakKeyDictionary[Any, float]" = WeakKeyDictionary()
+        self._work: "WeakKeyDictionary[Any, float]" = WeakKeyDictionary()
+
+    def start(self, owner):
+        """Start sampling on behalf of owner (normally the app)"""
+        schedule_interval(owner, self.SAMPLE_INTERVAL, self._sample)
+
+    def _set_scale(self, widget, scale: float):
+        self.scales[widget] = scale
+        self.clock.set_rate_scale(widget, scale)
+
+    def _sample(self):
+        """Measure the last sample period and rebalance rates"""
+        layout = self.config_manager.layout
+        budget = layout.frame_budget
+
+        if budget <= 0:
+            # Governor disabled: put back any rates it had changed
+            for widget, scale in list(self.scales.items()):
+                if scale != 1.0:
+                    self._set_scale(widget, 1.0)
+            return
+
+        frames = self.SAMPLE_INTERVAL / self.clock.frame_interval
+        costs: Dict[Any, float] = {}
+        weights: Dict[Any, float] = {}
+        for tile in self.window_manager.tiles:
+            widget = tile.current_widget
+            metrics = get_metrics(widget) if widget is not None else None
+            if metrics is None:
+                continue
+            work = metrics.tick_total + metrics.render_total
+            previous = self._work.get(widget)
+            self._work[widget] = work
+            if previous is None or work < previous:
+                # First sample, or the metrics were reset in between
+                continue
+            costs[widget] = (work - previous) * 1000 / frames
+            weights[widget] = max(tile.current_weight, 0.0)
+
+        total_weight = sum(weights.values())
+        if not costs or total_weight <= 0:
+            return
+
+        total_cost = sum(costs.values())
+        if total_cost > budget:
+            for widget, cost in costs.items():
+                share = budget * weights[widget] / total_weight
+                if cost > share:
+                    # Cost scales roughly with update rate, so stretching the
+                    # interval by cost/share brings the tile back to its share
+                    scale = self.scales.get(widget, 1.0)
+                    scale *= cost / share if share > 0 else layout.max_slowdown
+                    self._set_scale(widget, min(scale, layout.max_slowdown))
+        elif total_cost < budget * self.HEADROOM:
+            for widget in costs:
+                scale = self.scales.get(widget, 1.0)
+                if scale > 1.0:
+                    self._set_scale(widget, max(1.0, scale / self.RECOVERY))
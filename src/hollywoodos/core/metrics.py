@@ -0,0 +1,118 @@
+# metrics.py
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from weakref import WeakKeyDictionary
+
+
+# Number of recent ticks used to compute the effective frame rate
+FPS_WINDOW = 20
+
+
+class PluginMetrics:
+    """Tick and render timings for a single plugin widget"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all counters and restart the measurement window"""
+        self.started = time.perf_counter()
+        self.ticks = 0
+        self.tick_total = 0.0
+        self.tick_last = 0.0
+        self.late_ticks = 0
+        self.tick_times = deque(maxlen=FPS_WINDOW)
+        self.renders = 0
+        self.render_total = 0.0
+        self.render_last = 0.0
+        self.chars_last = 0
+
+    def record_tick(self, duration: float):
+        self.ticks += 1
+        self.tick_total += duration
+        self.tick_last = duration
+        self.tick_times.append(time.perf_counter())
+
+    def record_late(self, missed: int):
+        self.late_ticks += missed
+
+    def record_render(self, duration: float, chars: int = 0):
+        self.renders += 1
+        self.render_total += duration
+        self.render_last = duration
+        self.chars_last = chars
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def tick_avg(self) -> float:
+        return self.tick_total / self.ticks if self.ticks else 0.0
+
+    @property
+    def render_avg(self) -> float:
+        return self.render_total / self.renders if self.renders else 0.0
+
+    @property
+    def fps(self) -> float:
+        """Updates per second achieved since the last reset"""
+        elapsed = self.elapsed
+        return self.ticks / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def recent_fps(self) -> float:
+        """Updates per second over the last FPS_WINDOW ticks"""
+        if len(self.tick_times) < 2:
+            return 0.0
+        span = self.tick_times[-1] - self.tick_times[0]
+        return (len(self.tick_times) - 1) / span if span > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view of the counters, with durations in milliseconds"""
+        return {
+            "ticks": self.ticks,
+            "tick_ms_last": self.tick_last * 1000,
+            "tick_ms_avg": self.tick_avg * 1000,
+            "late_ticks": self.late_ticks,
+            "renders": self.renders,
+            "render_ms_last": self.render_last * 1000,
+            "render_ms_avg": self.render_avg * 1000,
+            "chars_last": self.chars_last,
+            "fps": self.fps,
+        }
+
+
+_metrics: "WeakKeyDictionary[Any, PluginMetrics]" = WeakKeyDictionary()
+
+
+def get_metrics(widget) -> Optional[PluginMetrics]:
+    """Return the metrics of an instrumented widget, if any"""
+    return _metrics.get(widget)
+
+
+def instrument(widget) -> PluginMetrics:
+    """Time every render of a widget and count the cells it emits.
+
+    Wraps render_lines on the instance, which covers both render() based
+    and line API widgets. Ticks are timed by the FrameClock for widgets
+    that have metrics attached.
+    """
+    metrics = _metrics.get(widget)
+    if metrics is not None:
+        return metrics
+
+    metrics = PluginMetrics()
+    _metrics[widget] = metrics
+    render_lines = widget.render_lines
+
+    def timed_render_lines(crop):
+        start = time.perf_counter()
+        strips = render_lines(crop)
+        duration = time.perf_counter() - start
+        metrics.record_render(duration, sum(strip.cell_length for strip in strips))
+        return strips
+
+    widget.render_lines = timed_render_lines
+    return metrics
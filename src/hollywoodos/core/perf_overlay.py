@@ -0,0 +1,44 @@
+# perf_overlay.py
+from textual.widgets import Static
+from .frame_clock import schedule_interval
+from .metrics import get_metrics
+
+
+class PerfOverlay(Static):
+    """Performance HUD drawn over a tile's plugin widget.
+
+    Hidden by default; shown for every tile when the WindowManager has the
+    ``show-perf`` class.
+    """
+
+    REFRESH_RATE = 0.5
+
+    def __init__(self, tile, **kwargs):
+        super().__init__(markup=False, **kwargs)
+        self.tile = tile
+
+    def on_mount(self):
+        schedule_interval(self, self.REFRESH_RATE, self._update)
+
+    def _update(self):
+        """Refresh the numbers of the tile's visible plugin"""
+        if not self.display:
+            return
+
+        plugin = self.tile.current_plugin
+        widget = self.tile.current_widget
+        metrics = get_metrics(widget) if widget is not None else None
+        if plugin is None or metrics is None:
+            self.update("no plugin metrics")
+            return
+
+        refresh_rate = plugin.get_config('refresh_rate')
+        requested = f"{1 / refresh_rate:.1f}" if refresh_rate else "-"
+        self.update(
+            f"{type(plugin).__name__} "
+            f"fps {metrics.recent_fps:.1f}/{requested} "
+            f"late {metrics.late_ticks} "
+            f"chars {metrics.chars_last}\n"
+            f"tick {metrics.tick_last * 1000:.2f}/{metrics.tick_avg * 1000:.2f}ms "
+            f"render {metrics.render_last * 1000:.2f}/{metrics.render_avg * 1000:.2f}ms"
+        )
@@ -0,0 +1,36 @@
+# search_prompt.py
+from typing import Optional
+from textual.app import ComposeResult
+from textual.screen import ModalScreen
+from textual.widgets import Input
+
+
+class SearchPrompt(ModalScreen[Optional[str]]):
+    """One-line prompt for a search term; dismisses with the term, or None if cancelled"""
+
+    DEFAULT_CSS = """
+    SearchPrompt {
+        align: center bottom;
+        background: $background 30%;
+    }
+    SearchPrompt > Input {
+        width: 60%;
+        margin-bottom: 2;
+    }
+    """
+
+    BINDINGS = [("escape", "cancel", "Cancel")]
+
+    def __init__(self, placeholder: str = "Search", value: str = ""):
+        super().__init__()
+        self.placeholder = placeholder
+        self.value = value
+
+    def compose(self) -> ComposeResult:
+        yield Input(value=self.value, placeholder=self.placeholder)
+
+    def on_input_submitted(self, event: Input.Submitted):
+        self.dismiss(event.value)
+
+    def action_cancel(self):
+        self.dismiss(None)
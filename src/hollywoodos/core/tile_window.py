@@ -1,14 +1,23 @@
 # tile_window.py
 from textual.containers import Container
 from textual.widget import Widget
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from ..core.config_manager import ConfigManager, WindowConfig, PluginConfig
 from ..plugins.registry import PluginRegistry
 from ..plugins.base import BlinkenPlugin
+from ..plugins.effects import get_effect_registry
+from .frame_clock import schedule_interval
+from .metrics import instrument
+from .perf_overlay import PerfOverlay
 import random
 
 class TileWindow(Container):
-    """A single tile window that can host plugins"""
+    """A single tile window that can host plugins.
+
+    The window's ``effects`` are applied to whatever its plugins render, as
+    a post-processing stage on their final strips, so any plugin gets them
+    without knowing about effects.
+    """
     
     def __init__(
         self,
@@ -24,30 +33,53 @@ class TileWindow(Container):
         
         self.plugins: List[BlinkenPlugin] = []
         self.current_plugin_index = 0
+        self.current_plugin: Optional[BlinkenPlugin] = None
         self.current_widget: Optional[Widget] = None
+        self.merged_configs: List[Dict[str, Any]] = []
+        self.weights: List[float] = []
+
+        self.effects = get_effect_registry().pipeline(window_config.effects)
+        self.effect_frame = 0
+        self._effects_were_active = False
         
         self._load_plugins()
         
     def _load_plugins(self):
         """Load all configured plugins"""
-        for plugin_config in self.window_config.plugins:
+        self.merged_configs = self._merge_plugin_configs(self.window_config)
+        for plugin_config, merged_config in zip(self.window_config.plugins, self.merged_configs):
             plugin_class = self.plugin_registry.get_plugin(plugin_config.type)
             if plugin_class:
-                merged_config = self.config_manager.get_plugin_config(
-                    plugin_config.type,
-                    plugin_config.config
-                )
                 plugin = plugin_class(merged_config)
                 self.plugins.append(plugin)
+                self.weights.append(plugin_config.weight)
+
+    def _merge_plugin_configs(self, window_config: WindowConfig) -> List[Dict[str, Any]]:
+        """Resolve the effective config of every plugin in a window"""
+        return [
+            self.config_manager.get_plugin_config(plugin_config.type, plugin_config.config)
+            for plugin_config in window_config.plugins
+        ]
+
+    def matches(self, window_config: WindowConfig) -> bool:
+        """Check whether this tile would be rebuilt identically from window_config"""
+        return (
+            window_config == self.window_config
+            and self._merge_plugin_configs(window_config) == self.merged_configs
+        )
                 
     def on_mount(self):
         """Initialize the window after mounting"""
+        self.mount(PerfOverlay(self))
         if self.plugins:
             self._show_current_plugin()
+            if self.effects:
+                schedule_interval(self, self.window_config.effect_interval, self._advance_effects)
             
             # Start cycling if configured
             if self.window_config.cycle_interval > 0 and len(self.plugins) > 1:
-                self.set_interval(
+                schedule_interval(
+                    self,
                     self.window_config.cycle_interval,
                     self._cycle_plugin
                 )
@@ -56,14 +88,57 @@ class TileWindow(Container):
             self._show_placeholder()
             
     def _show_current_plugin(self):
-        """Display the current plugin"""
-        if self.current_widget:
-            self.current_widget.remove()
-            
+        """Display the current plugin, hiding and suspending the previous one.
+
+        Each plugin keeps its widget for the lifetime of the tile, so cycling
+        back to a plugin resumes its simulation instead of rebuilding it.
+        """
         plugin = self.plugins[self.current_plugin_index]
-        self.current_widget = plugin.create_widget()
-        self.current_widget.add_class("plugin-widget")
-        self.mount(self.current_widget)
+        if plugin is self.current_plugin:
+            return
+
+        if self.current_plugin is not None:
+            self.current_widget.display = False
+            self.current_plugin.suspend()
+
+        widget = plugin.get_widget()
+        if widget.parent is None:
+            widget.add_class("plugin-widget")
+            if self.effects:
+                self._post_process(widget)
+            instrument(widget)
+            self.mount(widget)
+        else:
+            widget.display = True
+            plugin.resume()
+
+        self.current_plugin = plugin
+        self.current_widget = widget
+
+    def _post_process(self, widget: Widget):
+        """Run the window effects over everything the widget renders"""
+        render_lines = widget.render_lines
+
+        def processed_render_lines(crop):
+            return self.effects.apply(render_lines(crop), self.effect_frame)
+
+        widget.render_lines = processed_render_lines
+
+    def _advance_effects(self):
+        """Step the effect animation and re-render if the effects changed anything"""
+        self.effect_frame += 1
+        active = bool(self.effects.active(self.effect_frame))
+        # Also re-render once after the effects go quiet, to clear them
+        if (active or self._effects_were_active) and self.current_widget is not None:
+            self.current_widget.refresh()
+        self._effects_were_active = active
+
+    @property
+    def current_weight(self) -> float:
+        """Priority of the visible plugin"""
+        if self.current_plugin is None:
+            return 0.0
+        return self.weights[self.current_plugin_index]
         
     def _show_placeholder(self):
         """Show placeholder when no plugins available"""
@@ -80,10 +155,9 @@ class TileWindow(Container):
             return
             
         # Weighted random selection
-        weights = [pc.weight for pc in self.window_config.plugins]
         self.current_plugin_index = random.choices(
             range(len(self.plugins)),
-            weights=weights
+            weights=self.weights
         )[0]
         
         self._show_current_plugin()
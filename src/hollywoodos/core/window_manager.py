@@ -1,12 +1,14 @@
 # window_manager.py
 from textual.containers import Container
-from typing import List
+from typing import List, Tuple
 from .tile_window import TileWindow
-from .config_manager import ConfigManager, WindowConfig
+from .config_manager import ConfigManager, WindowConfig, LAYOUT_TYPES
 from ..plugins.registry import PluginRegistry
 
 class WindowManager(Container):
     """Manages tiled windows with predefined layouts"""
+
+    LAYOUT_TYPES = LAYOUT_TYPES
     
     def __init__(self, config_manager: ConfigManager, plugin_registry: PluginRegistry):
         super().__init__()
@@ -14,21 +16,35 @@ class WindowManager(Container):
         self.plugin_registry = plugin_registry
         self.tiles: List[TileWindow] = []
         self.focused_index = 0
+        self.layout_type = None
         
     def on_mount(self):
         """Initialize layout when mounted"""
         self.reload_layout()
         
     def reload_layout(self):
-        """Reload the entire layout from config"""
-        # Clear existing tiles
-        for tile in self.tiles:
-            tile.remove()
+        """Reload the layout from config.
+
+        If the layout type is unchanged, tiles are reconciled against the new
+        window configs and only the ones that differ are rebuilt; otherwise
+        the whole layout is recreated.
+        """
+        layout_type = self.config_manager.layout.layout_type
+        if layout_type not in self.LAYOUT_TYPES:
+            # Default to 2x2
+            layout_type = "2x2"
+
+        if layout_type == self.layout_type and self.tiles:
+            self._reconcile_tiles()
+            return
+
+        # Clear existing tiles along with their row/column containers
+        self.remove_children()
         self.tiles.clear()
+        self.focused_index = 0
+        self.layout_type = layout_type
         
         # Create layout based on type
-        layout_type = self.config_manager.layout.layout_type
-        
         if layout_type == "single":
             self._create_single_layout()
         elif layout_type == "2x2":
@@ -37,10 +53,53 @@ class WindowManager(Container):
             self._create_2x2_big_layout()
         elif layout_type == "3x3":
             self._create_3x3_layout()
-        else:
-            # Default to 2x2
-            self._create_2x2_layout()
-            
+
+    def _reconcile_tiles(self):
+        """Rebuild only the tiles whose configuration changed"""
+        configs = self._get_window_configs(len(self.tiles))
+        changed = []
+        for index, (tile, window_config) in enumerate(zip(self.tiles, configs)):
+            if tile.matches(window_config):
+                tile.window_config = window_config
+            else:
+                changed.append((index, window_config))
+        if changed:
+            self.call_later(self._replace_tiles, changed)
+
+    async def _replace_tiles(self, changed: List[Tuple[int, WindowConfig]]):
+        """Swap the tiles at the given indexes for new ones, keeping their places in the layout"""
+        slots = []
+        for index, window_config in changed:
+            old_tile = self.tiles[index]
+            parent = old_tile.parent
+            position = parent.children.index(old_tile)
+
+            tile = TileWindow(
+                window_config=window_config,
+                config_manager=self.config_manager,
+                plugin_registry=self.plugin_registry,
+                id=window_config.id
+            )
+            # Inherit the slot's size/dock rules and focus state
+            tile.styles.merge_rules(old_tile.styles.inline.get_rules())
+            tile.set_class(old_tile.has_class("focused"), "focused")
+            tile.set_class(old_tile.has_class("unfocused"), "unfocused")
+            self.tiles[index] = tile
+            slots.append((old_tile, parent, position, tile))
+
+        # Remove every old tile first: a window id can move to another
+        # slot, and its new tile can't be mounted while the old one is there
+        for old_tile, _, _, _ in slots:
+            await old_tile.remove()
+        # Refill each container's slots from the front, so every position
+        # counts the siblings restored before it
+        slots.sort(key=lambda slot: slot[2])
+        for _, parent, position, tile in slots:
+            if position < len(parent.children):
+                await parent.mount(tile, before=position)
+            else:
+                await parent.mount(tile)
+
     def _get_window_configs(self, count: int) -> List[WindowConfig]:
         """Get window configs, padding with defaults if needed"""
         configs = self.config_manager.windows[:count]
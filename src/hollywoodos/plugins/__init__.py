@@ -3,8 +3,20 @@
 Plugin system for HollywoodOS.
 """
 
-from .registry import PluginRegistry
-from .base import BlinkenPlugin
+_LAZY_ATTRIBUTES = {
+    "PluginRegistry": ".registry",
+    "BlinkenPlugin": ".base",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "PluginRegistry",
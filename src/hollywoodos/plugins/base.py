@@ -1,19 +1,52 @@
 # plugin_interface.py
 from abc import ABC, abstractmethod
-from textual.widget import Widget
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from ..core.frame_clock import suspend_schedules, resume_schedules
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps Textual out of CLI-only imports
+    from textual.widget import Widget
 
 class BlinkenPlugin(ABC):
     """Base class for all HollywoodOS plugins"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self._widget: Optional[Widget] = None
+        self._widget: Optional["Widget"] = None
+        self._suspended = False
         
     @abstractmethod
-    def create_widget(self) -> Widget:
+    def create_widget(self) -> "Widget":
         """Create and return the widget for this plugin"""
         pass
+
+    def get_widget(self) -> "Widget":
+        """Return this plugin's widget, creating it on first use"""
+        if self._widget is None:
+            self._widget = self.create_widget()
+        return self._widget
+
+    @property
+    def suspended(self) -> bool:
+        return self._suspended
+
+    def suspend(self):
+        """Pause the plugin while its widget is hidden"""
+        if self._suspended:
+            return
+        self._suspended = True
+        if self._widget is not None:
+            suspend_schedules(self._widget)
+        self.on_suspend()
+
+    def resume(self):
+        """Resume a suspended plugin when its widget is shown again"""
+        if not self._suspended:
+            return
+        self._suspended = False
+        if self._widget is not None:
+            resume_schedules(self._widget)
+        self.on_resume()
         
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
@@ -28,3 +61,11 @@ class BlinkenPlugin(ABC):
     def on_config_changed(self):
         """Called when configuration changes"""
         pass
+
+    def on_suspend(self):
+        """Called after the plugin has been suspended"""
+        pass
+
+    def on_resume(self):
+        """Called after the plugin has been resumed"""
+        pass
@@ -1,97 +1,178 @@
 # plugins/hex_scroll.py
-from textual.widgets import Static
-from textual.reactive import reactive
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
 from textual.widget import Widget
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from ..base import BlinkenPlugin
-from ..effects import EffectRegistry
-import random
-import math
-
-class HexScrollWidget(Static):
-    """Scrolling hexadecimal display"""
-    
-    lines = reactive([])
-    
+from ...core.frame_clock import schedule_interval
+from ..effects import get_effect_registry
+from ...utils.entropy import get_entropy
+from ...utils.hexfmt import HexFormatter
+from ...utils.mmap_reader import MappedFileReader
+
+COLOR_SCHEMES = {
+    'matrix': Style(color="green"),
+    'amber': Style(color="yellow"),
+    'blue': Style(color="cyan"),
+}
+
+
+class HexScrollWidget(Widget):
+    """Scrolling hexadecimal display.
+
+    Rows live in a fixed-size ring buffer of pre-rendered strips: a scroll
+    formats only the new bottom row and moves the head, and render_line is a
+    lookup.
+
+    Shows random bytes by default. With a ``source`` path it streams that
+    file through a memory-mapped reader instead, xxd style, with an offset
+    column and an ASCII gutter (``source_offset``, ``loop`` and ``follow``
+    control where it starts and what happens at the end of the file).
+    Bytes are shown in ``group``-byte words (1, 2, 4 or 8) in ``endian``
+    byte order.
+    """
+
     def __init__(self, config: Dict[str, Any], **kwargs):
         super().__init__(**kwargs)
         self.config = config
-        self.effect_registry = EffectRegistry()
+        self.effects = get_effect_registry().pipeline(config.get('effects'))
+        self.entropy = get_entropy(config.get('seed'))
+        self.reader: Optional[MappedFileReader] = None
+        self.formatter = self._make_formatter(source=False)
         self.frame = 0
-        
-        # Initialize lines
+
+        # Ring buffer of rendered rows; rows[head] is the top line
         self.line_count = 0
         self.column_count = 16  # default
-        self.lines = []
-        
+        self.rows: List[Strip] = []
+        self.head = 0
+        # Visible rows after effects, or None when no effect is active
+        self._display: Optional[List[Strip]] = None
+
     def on_mount(self):
         """Start scrolling when mounted"""
-        # Calculate how many lines we can fit
-        self.line_count = self.size.height
-        # Each hex value takes 3 characters (2 hex + 1 space)
-        # Last value doesn't need trailing space, so we can fit (width + 1) / 3 values
-        self.column_count = max(1, self.size.width // 3)
-        
-        # Initialize with random data
-        self.lines = [self._generate_hex_line() for _ in range(self.line_count)]
-        
+        source = self.config.get('source')
+        if source:
+            try:
+                self.reader = MappedFileReader(
+                    source,
+                    offset=self.config.get('source_offset', 0),
+                    loop=self.config.get('loop', True),
+                    follow=self.config.get('follow', False)
+                )
+            except OSError as e:
+                self.notify(f"HexScroll: cannot open {source}: {e}", severity="error")
+            else:
+                self.formatter = self._make_formatter(source=True)
+        self._fill()
+
         # Start animation
         refresh_rate = self.config.get('refresh_rate', 0.2)
-        self.set_interval(refresh_rate, self._update)
-        
+        schedule_interval(self, refresh_rate, self._update)
+
+    def on_unmount(self):
+        if self.reader is not None:
+            self.reader.close()
+
+    def _make_formatter(self, source: bool) -> HexFormatter:
+        """Row formatter; file rows get an offset column and ASCII gutter"""
+        try:
+            return HexFormatter(
+                group=self.config.get('group', 1),
+                endian=self.config.get('endian', 'big'),
+                offset_width=8 if source else 0,
+                gutter=source
+            )
+        except ValueError as e:
+            self.notify(f"HexScroll: {e}", severity="error")
+            return HexFormatter(offset_width=8 if source else 0, gutter=source)
+
+    def _bytes_per_row(self) -> int:
+        """Bytes per row that fit the current width"""
+        # Random data fills the whole width; file rows are capped at 'columns'
+        limit = self.config.get('columns', 16) if self.reader is not None else None
+        return self.formatter.fit(self.size.width, limit)
+
     def on_resize(self):
         """Handle resize events"""
         new_line_count = self.size.height
-        new_column_count = max(1, self.size.width // 3)
-        
+        new_column_count = self._bytes_per_row()
+
         if new_line_count != self.line_count or new_column_count != self.column_count:
-            self.line_count = new_line_count
-            self.column_count = new_column_count
-            
-            # Regenerate all lines with new width
-            self.lines = [self._generate_hex_line() for _ in range(self.line_count)]
-            
-    def _generate_hex_line(self) -> str:
-        """Generate a line of hex values"""
-        values = []
-        for _ in range(self.column_count):
-            values.append(f"{random.randint(0, 255):02X}")
-        return " ".join(values)
-        
+            self._fill()
+
+    def _fill(self):
+        """Regenerate every row for the current size"""
+        self.line_count = self.size.height
+        self.column_count = self._bytes_per_row()
+        if self.reader is not None:
+            lines = [self._read_source_line() or "" for _ in range(self.line_count)]
+        else:
+            # Format the whole screen of random data in one go
+            data = self.entropy.bytes(self.column_count * self.line_count)
+            lines = self.formatter.format_rows(data, self.column_count)
+        self.rows = [self._make_row(line) for line in lines]
+        self.head = 0
+        self._display = None
+
+    def _generate_hex_line(self) -> Optional[str]:
+        """Generate the next line, or None if the source has no new data"""
+        if self.reader is not None:
+            return self._read_source_line()
+        return self.formatter.hex(self.entropy.bytes(self.column_count))
+
+    def _read_source_line(self) -> Optional[str]:
+        """Format the next chunk of the source file as an xxd-style row"""
+        offset, chunk = self.reader.read(self.column_count)
+        if not chunk:
+            return None
+        return self.formatter.format_row(chunk, offset, self.column_count)
+
+    def _make_row(self, text: str) -> Strip:
+        """Render one line of text into a strip the width of the widget"""
+        color = COLOR_SCHEMES.get(self.config.get('color_scheme', 'matrix'))
+        style = self.rich_style + color if color else self.rich_style
+        return Strip([Segment(text, style)]).extend_cell_length(self.size.width, self.rich_style)
+
     def _update(self):
         """Update the display"""
         self.frame += 1
-        
-        # Scroll lines
-        self.lines = self.lines[1:] + [self._generate_hex_line()]
-        
+
+        # Scroll: overwrite the top slot with a new row and advance the head
+        line = self._generate_hex_line() if self.rows else None
+        if line is not None:
+            self.rows[self.head] = self._make_row(line)
+            self.head = (self.head + 1) % len(self.rows)
+        if self.effects:
+            self._apply_effects(scrolled=line is not None)
+
         # Refresh display
         self.refresh()
-        
-    def render(self) -> str:
-        """Render the hex display"""
-        text = '\n'.join(self.lines)
-        
-        # Apply effects
-        effects = self.config.get('effects', [])
-        if 'glitch' in effects:
-            text = self.effect_registry.apply('glitch', text, self.frame)
-        if 'pulse' in effects:
-            text = self.effect_registry.apply('pulse', text, self.frame)
-            
-        # Apply color scheme
-        color_scheme = self.config.get('color_scheme', 'matrix')
-        if color_scheme == 'matrix':
-            text = f"[green]{text}[/green]"
-        elif color_scheme == 'amber':
-            text = f"[yellow]{text}[/yellow]"
-        elif color_scheme == 'blue':
-            text = f"[cyan]{text}[/cyan]"
-            
-        return text
+
+    def _apply_effects(self, scrolled: bool = True):
+        """Run this frame's effects over the visible rows, so render_line stays a lookup"""
+        if self.effects.active(self.frame):
+            # Rows that just scrolled are never seen again, so only look
+            # them up in the cache while the source is idle
+            self._display = self.effects.apply(self._visible_rows(), self.frame, cache=not scrolled)
+        else:
+            self._display = None
+
+    def _visible_rows(self) -> List[Strip]:
+        return self.rows[self.head:] + self.rows[:self.head]
+
+    def render_line(self, y: int) -> Strip:
+        """Render one row from the ring buffer"""
+        if y >= len(self.rows):
+            return Strip.blank(self.size.width, self.rich_style)
+
+        if self._display is not None:
+            return self._display[y]
+        return self.rows[(self.head + y) % len(self.rows)]
 
 class HexScroll(BlinkenPlugin):
     """Hexadecimal scrolling plugin"""
-    
+
     def create_widget(self) -> Widget:
         return HexScrollWidget(self.config)
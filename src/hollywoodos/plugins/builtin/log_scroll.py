@@ -1,118 +1,356 @@
 # src/hollywoodos/plugins/builtin/log_scroll.py
 
-from textual.widgets import Static
-from textual.reactive import reactive
+from collections import deque
+from rich.segment import Segment
+from textual.strip import Strip
 from textual.widget import Widget
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
 from ..base import BlinkenPlugin
-import random
-import time
+from ...core.frame_clock import schedule_interval
+from ...utils.entropy import EntropyPool, get_entropy
+from ...utils.highlight import Highlighter
+from ...utils.history import LogHistory, term_matcher
+from ...utils.replay import LogReplay
+from ...utils.tail import FileTailer
 from datetime import datetime
+import re
+import time
+
+LOG_TEMPLATES = [
+    "INFO: Connection established from {ip}",
+    "WARNING: High memory usage detected: {percent}%",
+    "ERROR: Failed to connect to database",
+    "DEBUG: Processing request #{id}",
+    "INFO: User {user} logged in",
+    "WARNING: Disk space low on /dev/{disk}",
+    "INFO: Backup completed successfully",
+    "ERROR: Permission denied for file {file}",
+    "INFO: Service {service} started",
+    "WARNING: SSL certificate expires in {days} days",
+    "DEBUG: Cache hit ratio: {ratio}%",
+    "INFO: Scheduled maintenance completed",
+    "ERROR: Network timeout on port {port}",
+    "INFO: {count} new messages in queue",
+    "WARNING: CPU temperature: {temp}°C",
+    "INFO: Database optimization complete",
+    "ERROR: Invalid authentication token",
+    "DEBUG: Memory allocation: {size}MB",
+    "INFO: System update available",
+    "WARNING: Unusual activity detected from {ip}",
+]
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+# A template compiled to a format string with positional fields, plus the
+# generator that fills each field
+CompiledTemplate = Tuple[str, Tuple[Callable[[], str], ...]]
+
+
+class LogGenerator:
+    """Produces synthetic log lines from templates.
+
+    Templates are compiled once: each becomes a format string plus the list
+    of generators for the placeholders it actually contains, so a line costs
+    one call per placeholder and a single format. Unknown placeholders are
+    kept literally. Timestamps are formatted at most once per second.
+    """
+
+    def __init__(self, templates: Optional[Sequence[str]] = None, entropy: Optional[EntropyPool] = None):
+        self.entropy = entropy or get_entropy()
+        entropy = self.entropy
+        # Placeholder generators, only called for placeholders a template uses
+        self.placeholders: Dict[str, Callable[[], str]] = {
+            "ip": self._generate_ip,
+            "percent": lambda: str(entropy.randint(80, 99)),
+            "id": lambda: str(entropy.randint(1000, 9999)),
+            "user": lambda: entropy.choice(["admin", "user1", "guest", "root", "service"]),
+            "disk": lambda: entropy.choice(["sda1", "sdb2", "nvme0n1", "hda3"]),
+            "file": lambda: entropy.choice(["/etc/config", "/var/log/app.log", "/tmp/data", "/home/user/file"]),
+            "service": lambda: entropy.choice(["nginx", "mysql", "redis", "docker", "sshd"]),
+            "days": lambda: str(entropy.randint(1, 30)),
+            "ratio": lambda: str(entropy.randint(0, 100)),
+            "port": lambda: str(entropy.choice([80, 443, 3306, 5432, 6379, 8080])),
+            "count": lambda: str(entropy.randint(1, 100)),
+            "temp": lambda: str(entropy.randint(60, 85)),
+            "size": lambda: str(entropy.randint(100, 2000)),
+        }
+        self.templates = [self.compile(template) for template in templates or LOG_TEMPLATES]
+        self._stamp_second = None
+        self._stamp = ""
+
+    def _generate_ip(self) -> str:
+        """Generate random IP address"""
+        a, b, c, d = self.entropy.bytes(4)
+        return f"{a or 1}.{b}.{c}.{d or 1}"
+
+    def compile(self, template: str) -> CompiledTemplate:
+        """Compile a template into a format string and its generators"""
+        generators = []
+        parts = []
+        pos = 0
+        for match in PLACEHOLDER.finditer(template):
+            generate = self.placeholders.get(match.group(1))
+            if generate is None:
+                continue
+            parts.append(self._escape(template[pos:match.start()]))
+            parts.append("{}")
+            generators.append(generate)
+            pos = match.end()
+        parts.append(self._escape(template[pos:]))
+        return "".join(parts), tuple(generators)
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace("{", "{{").replace("}", "}}")
+
+    def timestamp(self) -> str:
+        """Current time as "[YYYY-MM-DD HH:MM:SS]", reformatted once per second"""
+        second = int(time.time())
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = datetime.fromtimestamp(second).strftime("[%Y-%m-%d %H:%M:%S]")
+        return self._stamp
+
+    def lines(self, count: int) -> List[str]:
+        """Generate count log lines at once"""
+        if count <= 0:
+            return []
+        stamp = self.timestamp()
+        return [
+            f"{stamp} {fmt.format(*[generate() for generate in generators])}"
+            for fmt, generators in self.entropy.choices(self.templates, count)
+        ]
+
+    def line(self) -> str:
+        """Generate a single log line"""
+        return self.lines(1)[0]
+
+
+class LogLine:
+    """A log line with its highlighted segments and last rendered strip"""
+
+    __slots__ = ("text", "segments", "strip")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.segments: Optional[List[Segment]] = None
+        self.strip: Optional[Strip] = None
+
+
+class LogScrollWidget(Widget):
+    """Scrolling log display.
+
+    Lines are kept in a bounded deque (``history`` lines, default 1000).
+    By default a random burst of 0-3 lines arrives per update; with
+    ``lines_per_second`` set, lines arrive at that rate instead, generated
+    in batches, for scenes that need thousands of lines per second.
+
+    With a ``sources`` list of file paths the widget follows those files
+    instead, like ``tail -F``, showing the last ``backlog`` lines of each
+    first. Files are read on a background thread; lines that arrive faster
+    than the widget updates are queued up to ``max_pending``, beyond which
+    the oldest are dropped.
 
+    With ``replay`` set to a recorded log file, its lines are played back
+    on their original timing instead, scaled by ``replay_speed``, starting
+    ``replay_start`` seconds in and skipping pauses longer than
+    ``replay_max_gap`` seconds. Lines are released by the time elapsed
+    since the widget was mounted, checked every clock frame, so a recording
+    scrolls by at the same moments on every run. ``replay_loop`` (default
+    true) starts over at the end.
 
-class LogScrollWidget(Static):
-    """Scrolling log display"""
+    Lines are highlighted (``highlight`` config, see Highlighter) once, as
+    they arrive, and drawn from the cached segments after that. Lines of a
+    large batch that scroll out of view before being shown are only
+    highlighted if they are ever displayed.
+
+    ``retention`` keeps up to that many lines in a searchable LogHistory
+    (on disk under ``retention_path`` if set), on top of the ``history``
+    lines kept for display. set_filter() shows only the lines matching a
+    term (see term_matcher: its words must be whole words of the line),
+    searched in the retained history when there is one.
+    """
 
     def __init__(self, config: Dict[str, Any], **kwargs):
-        # Disable markup so raw [ ] in logs render literally
-        super().__init__(markup=False, **kwargs)
+        super().__init__(**kwargs)
         self.config = config
-        self.logs: List[str] = []
-        self.log_templates = [
-            "INFO: Connection established from {ip}",
-            "WARNING: High memory usage detected: {percent}%",
-            "ERROR: Failed to connect to database",
-            "DEBUG: Processing request #{id}",
-            "INFO: User {user} logged in",
-            "WARNING: Disk space low on /dev/{disk}",
-            "INFO: Backup completed successfully",
-            "ERROR: Permission denied for file {file}",
-            "INFO: Service {service} started",
-            "WARNING: SSL certificate expires in {days} days",
-            "DEBUG: Cache hit ratio: {ratio}%",
-            "INFO: Scheduled maintenance completed",
-            "ERROR: Network timeout on port {port}",
-            "INFO: {count} new messages in queue",
-            "WARNING: CPU temperature: {temp}°C",
-            "INFO: Database optimization complete",
-            "ERROR: Invalid authentication token",
-            "DEBUG: Memory allocation: {size}MB",
-            "INFO: System update available",
-            "WARNING: Unusual activity detected from {ip}",
-        ]
+        self.entropy = get_entropy(config.get('seed'))
+        self.logs: deque = deque(maxlen=config.get('history', 1000))
+        highlight = config.get('highlight', {})
+        self.highlighter = Highlighter(highlight if isinstance(highlight, dict) else {
+            'levels': highlight, 'ips': highlight, 'paths': highlight, 'timestamps': highlight
+        })
+        self.generator = LogGenerator(config.get('log_templates'), self.entropy)
+        self._pending_lines = 0.0
+        self._last_update = time.monotonic()
+        self.tailer: Optional[FileTailer] = None
+        self.replay: Optional[LogReplay] = None
+        retention = config.get('retention', 0)
+        self.history = LogHistory(retention, config.get('retention_path')) if retention else None
+        # Active filter term and the matching lines shown while it is set
+        self.filter: Optional[str] = None
+        self._filtered: deque = deque()
         
     def on_mount(self):
         """Start log generation when mounted"""
-        # Generate initial logs
-        for _ in range(20):
-            self._add_log()
+        for error in self.highlighter.errors:
+            self.notify(f"LogScroll highlight rule {error}", severity="warning")
+        sources = self.config.get('sources')
+        replay = self.config.get('replay')
+        if replay:
+            try:
+                self.replay = LogReplay(
+                    replay,
+                    speed=self.config.get('replay_speed', 1.0),
+                    start=self.config.get('replay_start', 0.0),
+                    loop=self.config.get('replay_loop', True),
+                    max_gap=self.config.get('replay_max_gap')
+                )
+            except OSError as e:
+                self.notify(f"LogScroll replay: {e}", severity="warning")
+        if self.replay is not None:
+            # Release lines every frame for accurate timing
+            self._last_update = time.monotonic()
+            schedule_interval(self, self.config.get('replay_interval', 0.05), self._update_replay)
+            return
+        if sources:
+            self.tailer = FileTailer(
+                [sources] if isinstance(sources, str) else sources,
+                poll_interval=self.config.get('poll_interval', 0.25),
+                max_pending=self.config.get('max_pending', 1000),
+                backlog=self.config.get('backlog', 10)
+            )
+            self.tailer.start()
+        else:
+            # Generate initial logs
+            self.add_logs(20)
             
         # Start updating
         refresh_rate = self.config.get('refresh_rate', 0.5)
-        self.set_interval(refresh_rate, self._update)
-        
-    def _generate_ip(self) -> str:
-        """Generate random IP address"""
-        return f"{random.randint(1,255)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,255)}"
+        schedule_interval(self, refresh_rate, self._update)
+
+    def on_unmount(self):
+        if self.tailer is not None:
+            self.tailer.stop()
+        if self.replay is not None:
+            self.replay.close()
+        if self.history is not None:
+            self.history.close()
+
+    def add_logs(self, count: int):
+        """Add count new log entries in one batch"""
+        self._append(self.generator.lines(count))
+
+    def _append(self, lines: List[str]):
+        """Add lines to the history, highlighting the ones that will be visible"""
+        entries = [LogLine(line) for line in lines]
+        for entry in entries[-max(self.size.height, 1):]:
+            entry.segments = self.highlighter.segments(entry.text)
+        self.logs.extend(entries)
+        if self.history is not None:
+            self.history.extend(lines)
+        if self.filter is not None:
+            matches = term_matcher(self.filter)
+            self._filtered.extend(entry for entry in entries if matches(entry.text))
+
+    def set_filter(self, term: Optional[str]):
+        """Show only lines matching term; an empty term or None shows everything"""
+        if not term:
+            self.filter = None
+            self._filtered = deque()
+            self.refresh()
+            return
+
+        start = time.perf_counter()
+        limit = max(self.size.height, 1)
+        if self.history is not None:
+            matches = [text for _, text in self.history.search(term, limit)]
+        else:
+            line_matches = term_matcher(term)
+            matches = []
+            for entry in reversed(self.logs):
+                if line_matches(entry.text):
+                    matches.append(entry.text)
+                    if len(matches) >= limit:
+                        break
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self.filter = term
+        self._filtered = deque((LogLine(text) for text in reversed(matches)), maxlen=limit)
+        self.refresh()
+        searched = len(self.history) if self.history is not None else len(self.logs)
+        self.notify(f"Filter {term!r}: {len(matches)} recent matches in {searched} lines ({elapsed:.0f} ms)")
     
+    def seek(self, position: float):
+        """Jump a replay to position seconds into the recording"""
+        if self.replay is not None:
+            self.replay.seek(position)
+
     def _add_log(self):
         """Add a new log entry"""
-        template = random.choice(self.log_templates)
-        
-        # Replace placeholders
-        replacements = {
-            "{ip}": self._generate_ip(),
-            "{percent}": str(random.randint(80, 99)),
-            "{id}": str(random.randint(1000, 9999)),
-            "{user}": random.choice(["admin", "user1", "guest", "root", "service"]),
-            "{disk}": random.choice(["sda1", "sdb2", "nvme0n1", "hda3"]),
-            "{file}": random.choice(["/etc/config", "/var/log/app.log", "/tmp/data", "/home/user/file"]),
-            "{service}": random.choice(["nginx", "mysql", "redis", "docker", "sshd"]),
-            "{days}": str(random.randint(1, 30)),
-            "{ratio}": str(random.randint(0, 100)),
-            "{port}": str(random.choice([80, 443, 3306, 5432, 6379, 8080])),
-            "{count}": str(random.randint(1, 100)),
-            "{temp}": str(random.randint(60, 85)),
-            "{size}": str(random.randint(100, 2000)),
-        }
-        
-        log_text = template
-        for placeholder, value in replacements.items():
-            log_text = log_text.replace(placeholder, value)
-        
-        # Add timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {log_text}"
-        
-        self.logs.append(log_entry)
-        
-        # Keep only last 1000 logs
-        if len(self.logs) > 1000:
-            self.logs = self.logs[-1000:]
+        self.add_logs(1)
     
     def _update(self):
         """Add new log entries"""
-        # Random chance of adding 0-3 new logs
-        new_logs = random.choices([0, 1, 2, 3], weights=[0.3, 0.5, 0.15, 0.05])[0]
-        for _ in range(new_logs):
-            self._add_log()
-        self.refresh()
+        if self.tailer is not None:
+            lines = self.tailer.drain()
+            if lines:
+                self._append(lines)
+                self.refresh()
+            return
 
-    def render(self) -> str:
-        """Render the logs, showing only what fits."""
-        visible_lines = self.size.height
-        if visible_lines <= 0:
-            return ""
-            
-        # Take the last `visible_lines` entries
-        visible_logs = self.logs[-visible_lines:]
-        
-        # If we have fewer logs than lines, pad with empty lines at top
-        if len(visible_logs) < visible_lines:
-            padding = [""] * (visible_lines - len(visible_logs))
-            visible_logs = padding + visible_logs
-            
-        return "\n".join(visible_logs)
+        now = time.monotonic()
+        elapsed, self._last_update = now - self._last_update, now
+        rate = self.config.get('lines_per_second')
+        if rate:
+            # Use the real time since the last update, which may have been
+            # stretched by the governor; carry fractions over so low rates
+            # still average out, and don't catch up on more than a second
+            self._pending_lines += rate * min(elapsed, 1.0)
+            new_logs = int(self._pending_lines)
+            self._pending_lines -= new_logs
+        else:
+            # Random chance of adding 0-3 new logs
+            roll = self.entropy.random()
+            new_logs = 0 if roll < 0.3 else 1 if roll < 0.8 else 2 if roll < 0.95 else 3
+        if new_logs:
+            self.add_logs(new_logs)
+            self.refresh()
+
+    def _update_replay(self):
+        """Add the replayed lines that are due"""
+        now = time.monotonic()
+        elapsed, self._last_update = now - self._last_update, now
+        lines = self.replay.advance(elapsed)
+        if lines:
+            self._append(lines)
+            self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line; the newest log is at the bottom"""
+        base_style = self.rich_style
+        if base_style != self.highlighter.base_style:
+            # Not final until CSS has been applied; restyle the cached lines
+            self.highlighter.set_base_style(base_style)
+            for entry in self.logs:
+                entry.segments = entry.strip = None
+            for entry in self._filtered:
+                entry.segments = entry.strip = None
+
+        width = self.size.width
+        logs = self._filtered if self.filter is not None else self.logs
+        index = len(logs) - self.size.height + y
+        if index < 0 or index >= len(logs):
+            return Strip.blank(width, base_style)
+
+        entry = logs[index]
+        strip = entry.strip
+        if strip is None or strip.cell_length != width:
+            if entry.segments is None:
+                entry.segments = self.highlighter.segments(entry.text)
+            strip = Strip(entry.segments).crop_extend(0, width, base_style)
+            entry.strip = strip
+        return strip
 
 
 class LogScroll(BlinkenPlugin):
@@ -1,107 +1,247 @@
 # plugins/matrix_rain.py
-from textual.widgets import Static
-from textual.reactive import reactive
+from array import array
+from rich.segment import Segment
+from rich.style import Style
+from textual.geometry import Region
+from textual.strip import Strip
 from textual.widget import Widget
-from textual.app import ComposeResult
 from textual.events import Resize
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from ..base import BlinkenPlugin
-import random
+from ...core.frame_clock import schedule_interval
+from ...utils.entropy import EntropyPool, get_entropy
 
+CHARS = (
+    "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄ"  # Japanese katakana
+    "ﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ"  # plus numbers below
+    "0123456789"
+)
 
-class MatrixRainWidget(Static):
+# Glyph for each byte value stored in the grid
+GLYPHS = tuple(CHARS[i % len(CHARS)] for i in range(256))
+
+# Brightness levels of a lit cell: head, just behind the head, rest of the trail
+HEAD, BRIGHT, DIM = 3, 2, 1
+
+LEVEL_STYLES = {
+    HEAD: Style(bold=True, color="white"),
+    BRIGHT: Style(color="green"),
+    DIM: Style(dim=True, color="green"),
+}
+
+# What a row shows: (x, level, glyph byte) of each lit cell, left to right
+RowSignature = Tuple[Tuple[int, int, int], ...]
+
+
+class RainField:
+    """Simulation state of the rain, independent of any widget.
+
+    Drops are stored as parallel arrays (x, y, speed, length) rather than one
+    object per drop. Glyphs live in a persistent grid of one byte per cell:
+    a cell gets a new glyph only when a drop's head is on it, so a tick
+    touches a handful of cells per drop instead of regenerating every trail.
+    A field with no width (a widget before layout) has no drops until it
+    is resized.
+    """
+
+    def __init__(self, width: int, height: int, density: float, entropy: EntropyPool):
+        self.entropy = entropy
+        self.density = density
+        self.width = 0
+        self.height = 0
+        self.xs = array('i')
+        self.ys = array('d')
+        self.speeds = array('d')
+        self.lengths = array('i')
+        self.glyphs: List[bytearray] = []
+        self.resize(width, height)
+
+    def _spawn(self, i: int):
+        """Start drop i again above the top edge"""
+        self.xs[i] = self.entropy.randint(0, max(0, self.width - 1))
+        self.ys[i] = self.entropy.uniform(-self.height, 0)
+        self.speeds[i] = self.entropy.uniform(0.5, 2.0)
+        self.lengths[i] = self.entropy.randint(5, 15)
+
+    def resize(self, width: int, height: int):
+        """Adapt to a new size, keeping existing drops and glyphs"""
+        self.width = width
+        self.height = height
+
+        # Grid: crop or extend rows, add or drop rows at the bottom
+        self.glyphs = [
+            row[:width] + self.entropy.bytes(max(0, width - len(row)))
+            for row in self.glyphs[:height]
+        ]
+        while len(self.glyphs) < height:
+            self.glyphs.append(bytearray(self.entropy.bytes(width)))
+
+        # Drop count follows the width; drops outside the new width move
+        drop_count = max(1, int(width * self.density)) if width > 0 else 0
+        del self.xs[drop_count:], self.ys[drop_count:]
+        del self.speeds[drop_count:], self.lengths[drop_count:]
+        for i, x in enumerate(self.xs):
+            if x >= width:
+                self.xs[i] = self.entropy.randint(0, max(0, width - 1))
+        for i in range(len(self.xs), drop_count):
+            for column in (self.xs, self.ys, self.speeds, self.lengths):
+                column.append(0)
+            self._spawn(i)
+
+    def step(self):
+        """Advance every drop and give the cells under their heads new glyphs"""
+        if not self.width:
+            return
+        xs, ys, speeds, lengths = self.xs, self.ys, self.speeds, self.lengths
+        glyphs = self.glyphs
+        height = self.height
+        # At most 3 cells change per drop (speed < 2, plus the current head)
+        noise = self.entropy.bytes(3 * len(xs))
+        for i in range(len(xs)):
+            y0 = ys[i]
+            y1 = y0 + speeds[i]
+            if y1 - lengths[i] > height:
+                self._spawn(i)
+                continue
+            ys[i] = y1
+            x = xs[i]
+            for n, y in enumerate(range(max(int(y0), 0), min(int(y1), height - 1) + 1)):
+                glyphs[y][x] = noise[3 * i + n]
+
+    def lit_cells(self) -> Dict[int, Dict[int, int]]:
+        """Brightness of every lit cell, as {y: {x: level}}"""
+        lit: Dict[int, Dict[int, int]] = {}
+        height, width = self.height, self.width
+        for x, y, length in zip(self.xs, self.ys, self.lengths):
+            if x >= width:
+                continue
+            for k in range(length):
+                row = int(y - k)
+                if 0 <= row < height:
+                    lit.setdefault(row, {})[x] = HEAD if k == 0 else BRIGHT if k < 3 else DIM
+        return lit
+
+
+class RainRenderer:
+    """Turns a RainField into strips, keeping one cached strip per row.
+
+    Each row's strip is rebuilt only when the lit cells on it (position,
+    brightness or glyph) changed since the last update; adjacent lit cells
+    with the same brightness share one segment, and the gaps between them
+    are single blank segments. Styles are combined with the base style once
+    and reused for every segment.
+    """
+
+    def __init__(self, base_style: Style = Style()):
+        self.width = 0
+        self.strips: List[Strip] = []
+        self._signatures: List[Optional[RowSignature]] = []
+        self.set_base_style(base_style)
+
+    def set_base_style(self, base_style: Style):
+        """Change the style under the rain; every row is rebuilt on the next update"""
+        self.base_style = base_style
+        self.styles = {level: base_style + style for level, style in LEVEL_STYLES.items()}
+        self._signatures = []
+
+    def update(self, field: RainField) -> List[int]:
+        """Bring the strips up to date with field, returning the rows that changed"""
+        width, height = field.width, field.height
+        rebuild = width != self.width or len(self._signatures) != height
+        if rebuild:
+            self.width = width
+            self.blank = Strip([Segment(' ' * width, self.base_style)], width)
+            self.strips = [self.blank] * height
+            self._signatures = [None] * height
+
+        lit = field.lit_cells()
+        dirty = []
+        for y in range(height):
+            cells = lit.get(y)
+            signature = None
+            if cells:
+                row = field.glyphs[y]
+                signature = tuple(sorted((x, level, row[x]) for x, level in cells.items()))
+            if rebuild or signature != self._signatures[y]:
+                self._signatures[y] = signature
+                self.strips[y] = self._row_strip(signature) if signature else self.blank
+                dirty.append(y)
+        return dirty
+
+    def _row_strip(self, signature: RowSignature) -> Strip:
+        """Build a row as runs: blank gaps and same-brightness stretches of glyphs"""
+        base = self.base_style
+        styles = self.styles
+        segments = []
+        pos = 0
+        run_level = None
+        run: List[str] = []
+        for x, level, glyph in signature:
+            if x != pos or level != run_level:
+                if run:
+                    segments.append(Segment(''.join(run), styles[run_level]))
+                    run = []
+                if x > pos:
+                    segments.append(Segment(' ' * (x - pos), base))
+                run_level = level
+            run.append(GLYPHS[glyph])
+            pos = x + 1
+        if run:
+            segments.append(Segment(''.join(run), styles[run_level]))
+        if pos < self.width:
+            segments.append(Segment(' ' * (self.width - pos), base))
+        return Strip(segments, self.width)
+
+
+class MatrixRainWidget(Widget):
     """Matrix-style digital rain effect"""
-    drops = reactive([])
 
     def __init__(self, config: Dict[str, Any], **kwargs):
         super().__init__(**kwargs)
         self.config = config
-        self.width = 0
-        self.height = 0
-        self.drops = []
-        self.chars = (
-            "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄ"  # Japanese katakana
-            "ﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ"  # plus numbers below
-            "0123456789"
-        )
+        self.entropy = get_entropy(config.get('seed'))
+        self.field: Optional[RainField] = None
+        self.renderer = RainRenderer()
 
     def on_mount(self) -> None:
         """Initialize the rain effect and start updates"""
-        # Build drops data for current size
-        self._init_drops()
+        self.field = RainField(
+            self.size.width, self.size.height,
+            self.config.get('density', 0.1), self.entropy
+        )
         # Schedule regular updates
         refresh_rate = self.config.get('refresh_rate', 0.1)
-        self.set_interval(refresh_rate, self._update)
+        schedule_interval(self, refresh_rate, self._update)
         # Draw the first frame immediately
         self._update()
 
     def on_resize(self, event: Resize) -> None:
-        """Reinitialize drops when the widget is resized"""
-        self._init_drops()
-
-    def _init_drops(self) -> None:
-        """Initialize or reinitialize drop positions based on width/height"""
-        self.width = self.size.width
-        self.height = self.size.height
-        density = self.config.get('density', 0.1)
-        drop_count = max(1, int(self.width * density))
-        self.drops = []
-        for _ in range(drop_count):
-            self.drops.append({
-                'x': random.randint(0, max(0, self.width - 1)),
-                'y': random.uniform(-self.height, 0),
-                'speed': random.uniform(0.5, 2.0),
-                'length': random.randint(5, 15),
-                'chars': []
-            })
+        """Fit the rain to the new size, keeping the drops that are falling"""
+        if self.field is not None:
+            self.field.resize(self.size.width, self.size.height)
+            self.renderer.update(self.field)
+            self.refresh()
 
     def _update(self) -> None:
         """Update drop positions and characters"""
-        for drop in self.drops:
-            drop['y'] += drop['speed']
-            if drop['y'] - drop['length'] > self.height:
-                drop['y'] = random.uniform(-self.height, 0)
-                drop['x'] = random.randint(0, max(0, self.width - 1))
-                drop['speed'] = random.uniform(0.5, 2.0)
-                drop['length'] = random.randint(5, 15)
-            # Generate new chars
-            drop['chars'] = [random.choice(self.chars) for _ in range(drop['length'])]
-        # Trigger a render
-        self.refresh()
-
-    def render(self) -> str:
-        """Render the current rain frame as a text buffer"""
-        buffer = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        colors = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        for drop in self.drops:
-            x = int(drop['x'])
-            for i, char in enumerate(drop['chars']):
-                y = int(drop['y'] - i)
-                if 0 <= y < self.height and 0 <= x < self.width:
-                    buffer[y][x] = char
-                    if i == 0:
-                        colors[y][x] = 3  # brightest
-                    elif i < 3:
-                        colors[y][x] = 2  # bright
-                    else:
-                        colors[y][x] = 1  # dim
-        # Build lines with markup
-        lines = []
-        for y in range(self.height):
-            line = ''
-            for x in range(self.width):
-                c = buffer[y][x]
-                col = colors[y][x]
-                if col == 3:
-                    line += f"[bold white]{c}[/bold white]"
-                elif col == 2:
-                    line += f"[green]{c}[/green]"
-                elif col == 1:
-                    line += f"[dim green]{c}[/dim green]"
-                else:
-                    line += ' '
-            lines.append(line)
-        return '\n'.join(lines)
+        self.field.step()
+        # The widget's style isn't final until CSS has been applied, after mount
+        if self.rich_style != self.renderer.base_style:
+            self.renderer.set_base_style(self.rich_style)
+        dirty = self.renderer.update(self.field)
+        # Repaint only the rows that changed
+        if len(dirty) > self.size.height // 2:
+            self.refresh()
+        elif dirty:
+            width = self.size.width
+            self.refresh(*[Region(0, y, width, 1) for y in dirty])
+
+    def render_line(self, y: int) -> Strip:
+        """Render one row from the renderer's cache"""
+        strips = self.renderer.strips
+        if y < len(strips):
+            return strips[y]
+        return Strip.blank(self.size.width, self.rich_style)
 
 
 class MatrixRain(BlinkenPlugin):
@@ -3,6 +3,7 @@ from textual.widget import Widget
 from textual.reactive import reactive
 from typing import Dict, Any
 from ..base import BlinkenPlugin
+from ...core.frame_clock import schedule_interval
 import random
 import time
 
@@ -17,7 +18,7 @@ class NetworkDisplay(Widget):
 
     def on_mount(self):
         refresh_rate = self.config.get('refresh_rate', 1.0)
-        self.set_interval(refresh_rate, self.update_stats)
+        schedule_interval(self, refresh_rate, self.update_stats)
         self.update_stats()  # Initial update
 
     def update_stats(self):
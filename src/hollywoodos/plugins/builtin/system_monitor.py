@@ -1,14 +1,48 @@
 # src/hollywoodos/plugins/builtin/system_monitor.py
 
+from textual.timer import Timer
 from textual.widgets import Static
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from ..base import BlinkenPlugin
+from ...core.frame_clock import schedule_interval
+from ...utils.sysinfo import SystemSampler, SystemSnapshot, get_system_sampler
+from ...utils.timeseries import TieredHistory, braille, sparkline
 import random
 import time
 
+# Graphed metrics: stats key -> (label, fixed maximum or None to autoscale)
+GRAPH_METRICS: Dict[str, Tuple[str, Optional[float]]] = {
+    "cpu": ("CPU", 100.0),
+    "memory": ("Memory", 100.0),
+    "network_rx": ("Net RX", None),
+    "network_tx": ("Net TX", None),
+    "disk_read": ("Disk R", None),
+    "disk_write": ("Disk W", None),
+}
+
 
 class SystemMonitorWidget(Static):
-    """Fake system monitoring display"""
+    """System monitoring display.
+
+    ``metrics`` picks where the numbers come from: ``real`` reads them from
+    the shared SystemSampler, which samples /proc on its own thread every
+    ``sample_interval`` seconds (default: the refresh rate), however many
+    monitors are showing (hidden ones don't count); ``fake`` makes them up as random walks; ``auto``
+    (the default) is real where /proc is available and fake elsewhere.
+    Real metrics fall back to fake, with a notification, when /proc isn't
+    there or the sampler fails ``MAX_FAILURES`` times in a row.
+
+    The graphed metrics keep their history in TieredHistory ring buffers
+    (fixed memory however long it runs). Rows left below the readouts show
+    it: with ``graph: sparkline`` (the default) one sparkline per metric,
+    with ``graph: braille`` one braille plot of ``graph_metric`` (default
+    cpu) using every remaining row, with ``graph: none`` nothing. Graphs
+    span the tile's width, at ``graph_resolution`` seconds per point (1,
+    10 or 60).
+    """
+
+    # Failed samples in a row before switching to made-up metrics
+    MAX_FAILURES = 3
 
     def __init__(self, config: Dict[str, Any], **kwargs):
         # Disable markup parsing so [ and ] render literally
@@ -16,11 +50,63 @@ class SystemMonitorWidget(Static):
         self.config = config
         self.start_time = time.time()
         self.stats = self._generate_stats()
+        metrics = config.get('metrics', 'auto')
+        # Why real metrics were asked for but can't be shown
+        self._fallback: Optional[str] = None
+        if metrics in ('auto', 'real') and not SystemSampler.available():
+            if metrics == 'real':
+                self._fallback = "/proc is not available"
+            metrics = 'fake'
+        self.sampler: Optional[SystemSampler] = get_system_sampler() if metrics == 'real' else None
+        self._snapshot: Optional[SystemSnapshot] = None
+        # Our hold on the sampler while shown
+        self._sampler_token: Optional[object] = None
+        # Pending check for the sampler's first reading
+        self._retry: Optional[Timer] = None
+        self.history = {key: TieredHistory() for key in GRAPH_METRICS}
+        # Rendered graph rows by (key, width, rows), with the ring version drawn
+        self._graphs: Dict[Tuple[str, int, int], Tuple[int, List[str]]] = {}
+        self._graph_size: Tuple[int, int] = (0, 0)
 
     def on_mount(self):
         """Start updating when mounted"""
         refresh_rate = self.config.get('refresh_rate', 1.0)
-        self.set_interval(refresh_rate, self._update)
+        if self._fallback is not None:
+            self._notify_fallback()
+        self.acquire_sampler()
+        schedule_interval(self, refresh_rate, self._update)
+        self._update()
+
+    def on_unmount(self):
+        self.release_sampler()
+
+    def acquire_sampler(self):
+        """Have the shared sampler sample for this monitor"""
+        if self.sampler is not None and self._sampler_token is None:
+            interval = self.config.get('sample_interval', self.config.get('refresh_rate', 1.0))
+            self._sampler_token = self.sampler.acquire(interval)
+
+    def release_sampler(self):
+        """Stop needing samples, e.g. while hidden"""
+        if self.sampler is not None and self._sampler_token is not None:
+            self.sampler.release(self._sampler_token)
+            self._sampler_token = None
+
+    def _notify_fallback(self):
+        self.notify(f"System monitor: {self._fallback}; showing simulated metrics", severity="warning")
+
+    def _use_fake(self, reason: str):
+        """Stop using the sampler and make the metrics up from now on"""
+        self.release_sampler()
+        self.sampler = None
+        if self._retry is not None:
+            self._retry.stop()
+            self._retry = None
+        self._fallback = reason
+        self._notify_fallback()
+
+    def _retry_update(self):
+        self._retry = None
         self._update()
 
     def _generate_stats(self) -> Dict[str, Any]:
@@ -42,6 +128,44 @@ class SystemMonitorWidget(Static):
         }
 
     def _update(self) -> None:
+        """Update stats from the sampler, or with made-up variations"""
+        if self.sampler is None:
+            self._update_fake()
+            return
+        if self.sampler.failures >= self.MAX_FAILURES:
+            self._use_fake(f"cannot read system metrics ({self.sampler.error})")
+            self._update_fake()
+            return
+        snapshot = self.sampler.snapshot
+        if snapshot is None:
+            # The sampler's first reading isn't in yet; look again shortly,
+            # once however many ticks arrive before it is
+            if self._retry is None:
+                self._retry = self.set_timer(0.05, self._retry_update)
+            return
+        if snapshot is self._snapshot:
+            return
+        self._snapshot = snapshot
+        self.stats = {
+            "cpu": round(snapshot.cpu),
+            "memory": round(snapshot.memory),
+            "network_rx": snapshot.network_rx,
+            "network_tx": snapshot.network_tx,
+            "disk_read": snapshot.disk_read,
+            "disk_write": snapshot.disk_write,
+            "processes": snapshot.processes,
+            "threads": snapshot.threads,
+            "load_avg": snapshot.load_avg,
+            "swap": round(snapshot.swap),
+            "temp": round(snapshot.temp) if snapshot.temp is not None else None,
+            "cache": round(snapshot.cache),
+            "buffers": round(snapshot.buffers),
+            "kernel": round(snapshot.kernel),
+        }
+        self._record(snapshot.time)
+        self.refresh()
+
+    def _update_fake(self) -> None:
         """Update stats with realistic variations"""
         old = self.stats.copy()
         
@@ -71,9 +195,15 @@ class SystemMonitorWidget(Static):
         
         # Temperature changes slowly
         self.stats["temp"] = max(20, min(90, old["temp"] + random.randint(-2, 2)))
-        
+
+        self._record(time.time())
         self.refresh()
 
+    def _record(self, now: float):
+        """Add the current stats to the graphed histories"""
+        for key, history in self.history.items():
+            history.append(self.stats[key], now)
+
     def render(self) -> str:
         """Render dynamically sized display"""
         width = self.size.width
@@ -128,7 +258,8 @@ class SystemMonitorWidget(Static):
         
         # Temperature
         if width >= 15:
-            all_lines.append(f"CPU Temp: {self.stats['temp']}°C")
+            temp = self.stats['temp']
+            all_lines.append(f"CPU Temp: {temp}°C" if temp is not None else "CPU Temp: n/a")
         
         # Network
         if width >= 25:
@@ -148,11 +279,55 @@ class SystemMonitorWidget(Static):
         if width >= 20:
             all_lines.append(f"Up: {hours:02d}:{minutes:02d}:{seconds:02d}")
         
+        # Graphs in the rows that are left
+        if len(all_lines) < height:
+            all_lines.extend(self._graph_lines(height - len(all_lines), width))
+
         # Return only lines that fit in height
         if not all_lines:
             return ""
             
         return '\n'.join(all_lines[:height])
+
+    def _graph_lines(self, rows: int, width: int) -> List[str]:
+        """History graphs filling rows lines of width columns"""
+        mode = self.config.get('graph', 'sparkline')
+        if mode not in ('sparkline', 'braille') or rows < 2 or width < 20:
+            return []
+        resolution = self.config.get('graph_resolution', 1)
+        if (rows, width) != self._graph_size:
+            # Drop the rows drawn for the old size
+            self._graphs.clear()
+            self._graph_size = (rows, width)
+        lines = [f" History {resolution:g}s ".center(width, "━")]
+        rows -= 1
+
+        if mode == 'braille':
+            key = self.config.get('graph_metric', 'cpu')
+            if key not in GRAPH_METRICS:
+                key = 'cpu'
+            label, high = GRAPH_METRICS[key]
+            ring = self.history[key].ring(resolution)
+            graph_width = width - 8
+            cache_key = (key, graph_width, rows)
+            cached = self._graphs.get(cache_key)
+            if cached is None or cached[0] != ring.version:
+                cached = (ring.version, braille(ring.last(2 * graph_width), graph_width, rows, high))
+                self._graphs[cache_key] = cached
+            for row, graph in enumerate(cached[1]):
+                lines.append(f"{label if row == 0 else '':<7} {graph}")
+            return lines
+
+        graph_width = width - 8
+        for key, (label, high) in list(GRAPH_METRICS.items())[:rows]:
+            ring = self.history[key].ring(resolution)
+            cache_key = (key, graph_width, 1)
+            cached = self._graphs.get(cache_key)
+            if cached is None or cached[0] != ring.version:
+                cached = (ring.version, [sparkline(ring.last(graph_width), graph_width, high)])
+                self._graphs[cache_key] = cached
+            lines.append(f"{label:<7} {cached[1][0]}")
+        return lines
     
     def _make_bar(self, percentage: int, width: int) -> str:
         """Create a progress bar"""
@@ -174,3 +349,11 @@ class SystemMonitor(BlinkenPlugin):
 
     def create_widget(self) -> Static:
         return SystemMonitorWidget(self.config)
+
+    def on_suspend(self):
+        if self._widget is not None:
+            self._widget.release_sampler()
+
+    def on_resume(self):
+        if self._widget is not None:
+            self._widget.acquire_sampler()
@@ -4,6 +4,7 @@ from textual.widgets import Static
 from textual.widget import Widget
 from typing import Dict, Any, List, Tuple, Set
 from ..base import BlinkenPlugin
+from ...core.frame_clock import schedule_interval
 import random
 import time
 
@@ -176,7 +177,9 @@ class TacticalMapWidget(Static):
     def on_mount(self):
         """Start the display updates"""
         self._resize_map()
-        self.set_interval(0.1, self._update)  # Fast refresh for smooth animation
+        # Fast refresh for smooth animation
+        refresh_rate = self.config.get('refresh_rate', 0.1)
+        schedule_interval(self, refresh_rate, self._update)
         
     def on_resize(self):
         """Handle widget resize"""
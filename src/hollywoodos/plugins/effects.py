@@ -1,98 +1,503 @@
 # shared_effects.py
-from typing import Dict, Any, List, Callable
-from textual.timer import Timer
-import random
-import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, List, Optional, Sequence, Tuple, Type, Union
 import math
+from rich.cells import cell_len, get_character_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+from ..utils.entropy import get_entropy
+
+# Precomputed tables over one period, indexed by table_index(phase)
+TABLE_SIZE = 1024
+SINE_TABLE = tuple(math.sin(2 * math.pi * i / TABLE_SIZE) for i in range(TABLE_SIZE))
+
+
+def table_index(phase: float) -> int:
+    """Index into the precomputed tables for a phase in radians"""
+    return int(phase * (TABLE_SIZE / (2 * math.pi))) % TABLE_SIZE
+
+
+def sine(phase: float) -> float:
+    """Table lookup approximation of math.sin"""
+    return SINE_TABLE[table_index(phase)]
+
+
+# Marks a cell an effect leaves as it is
+KEEP = '\0'
+
+# Stands for the second cell of a double-width glyph in a row's glyphs
+WIDE_FILL = '\x01'
+
+
+def _to_cells(text: str) -> str:
+    """Text as one character per cell: wide glyphs are followed by WIDE_FILL,
+    zero-width characters are dropped"""
+    if text.isascii():
+        return text
+    cells = []
+    for char in text:
+        width = get_character_cell_size(char)
+        if width == 1:
+            cells.append(char)
+        elif width == 2:
+            cells.append(char + WIDE_FILL)
+    return ''.join(cells)
+
+
+def _from_cells(cells: str) -> str:
+    """Text for cells; a wide glyph that lost its second cell, or a second
+    cell that lost its glyph, becomes a blank so the width is unchanged"""
+    if cells.isascii() and WIDE_FILL not in cells:
+        return cells
+    text = []
+    index = 0
+    count = len(cells)
+    while index < count:
+        char = cells[index]
+        index += 1
+        if char == WIDE_FILL:
+            text.append(' ')
+        elif get_character_cell_size(char) == 2:
+            if index < count and cells[index] == WIDE_FILL:
+                text.append(char)
+                index += 1
+            else:
+                text.append(' ')
+        else:
+            text.append(char)
+    return ''.join(text)
+
+
+def _fade_glyph(value: float) -> str:
+    brightness = (value + 1) / 2
+    if brightness < 0.3:
+        return ' '
+    elif brightness < 0.6:
+        return '░'
+    elif brightness < 0.8:
+        return '▒'
+    return KEEP
+
+
+def _pulse_level(value: float) -> str:
+    brightness = (value + 1) / 2
+    if brightness < 0.3:
+        return "dim"
+    elif brightness < 0.7:
+        return ""
+    return "bold"
+
+
+FADE_TABLE = ''.join(_fade_glyph(value) for value in SINE_TABLE)
+PULSE_TABLE = tuple(_pulse_level(value) for value in SINE_TABLE)
+
+PULSE_STYLES = {
+    'dim': Style(dim=True),
+    'bold': Style(bold=True),
+}
+
+NULL_STYLE = Style()
+
+Run = Tuple[int, Style]
+
+
+class CellBuffer:
+    """Grid of cells (glyph + style) that effects edit in place.
+
+    Built from a list of strips. Each row keeps its glyphs as one string
+    with one character per cell (the second cell of a wide glyph holds
+    WIDE_FILL) and its styles as runs of (cells, style), as they come out
+    of the strip's segments, so effects work on whole rows and runs rather
+    than on one cell at a time, and columns line up whatever the glyphs.
+    Rows no effect touched come back out of to_strips as the original strip
+    objects; touched rows lose any zero-width characters.
+    """
+
+    def __init__(self, strips: Sequence[Strip]):
+        self.strips = list(strips)
+        self.height = len(self.strips)
+        self.glyphs = [_to_cells(strip.text) for strip in self.strips]
+        self.dirty = set()
+        self._runs: Dict[int, List[Run]] = {}
+
+    @classmethod
+    def from_text(cls, text: str, style: Style = NULL_STYLE) -> "CellBuffer":
+        return cls([Strip([Segment(line, style)]) for line in text.split('\n')])
+
+    def to_text(self) -> str:
+        return '\n'.join(_from_cells(glyphs) for glyphs in self.glyphs)
+
+    def runs(self, y: int) -> List[Run]:
+        """Style runs of a row"""
+        runs = self._runs.get(y)
+        if runs is None:
+            runs = [
+                (cell_len(segment.text), segment.style or NULL_STYLE)
+                for segment in self.strips[y] if not segment.control
+            ]
+            self._runs[y] = runs
+        return runs
+
+    def set_glyphs(self, y: int, glyphs: str):
+        """Replace the glyphs of a row, keeping its length and styles"""
+        self.glyphs[y] = glyphs
+        self.dirty.add(y)
+
+    def restyle(self, y: int, style: Style):
+        """Combine style into every cell of a row"""
+        self._runs[y] = [(length, base + style) for length, base in self.runs(y)]
+        self.dirty.add(y)
+
+    def shift(self, y: int, offset: int):
+        """Move a row right by offset cells, filling with blanks in its first style"""
+        glyphs = self.glyphs[y]
+        length = len(glyphs)
+        offset = min(offset, length)
+        if offset <= 0:
+            return
+        runs = self.runs(y)
+        shifted = [(offset, runs[0][1] if runs else NULL_STYLE)]
+        remaining = length - offset
+        for run_length, style in runs:
+            if remaining <= 0:
+                break
+            shifted.append((min(run_length, remaining), style))
+            remaining -= run_length
+        self.glyphs[y] = ' ' * offset + glyphs[:length - offset]
+        self._runs[y] = shifted
+        self.dirty.add(y)
+
+    def to_strips(self) -> List[Strip]:
+        """The buffer as strips; untouched rows are the original objects"""
+        strips = list(self.strips)
+        for y in self.dirty:
+            glyphs = self.glyphs[y]
+            segments = []
+            start = 0
+            for length, style in self.runs(y):
+                if length:
+                    segments.append(Segment(_from_cells(glyphs[start:start + length]), style))
+                    start += length
+            strips[y] = Strip(segments)
+        return strips
+
+
+class Effect(ABC):
+    """A visual effect applied to a CellBuffer.
+
+    Subclasses implement apply() and, when they are only visible on some
+    frames, active(); inactive effects are skipped without any work. An
+    effect whose output depends on less than the frame number returns
+    that from state(), so cached results are reused across frames;
+    random effects set ``deterministic`` to False and are never cached.
+    """
+
+    deterministic = True
+
+    def __init__(self, **params):
+        self.params = params
+        self.key = (type(self).__name__, _freeze(params))
+
+    def active(self, frame: int) -> bool:
+        return True
+
+    def state(self, frame: int) -> Hashable:
+        """What apply() output depends on besides the buffer and params"""
+        return frame
+
+    @abstractmethod
+    def apply(self, buffer: CellBuffer, frame: int):
+        """Change buffer in place for frame"""
+        pass
+
+
+class GlitchEffect(Effect):
+    """Random rows have random cells replaced by block characters"""
+
+    CHARS = '█▀▄░▒▓'
+    deterministic = False
+
+    def __init__(self, intensity: float = 0.1, seed: Optional[int] = None, **params):
+        super().__init__(intensity=intensity, **params)
+        self.intensity = intensity
+        self.threshold = int(intensity * 256)
+        self.entropy = get_entropy(seed)
+        self._frame = None
+        self._active = False
+
+    def active(self, frame: int) -> bool:
+        # Roll once per frame: a glitch hits on roughly `intensity` of frames
+        if frame != self._frame:
+            self._frame = frame
+            self._active = self.entropy.random() < self.intensity
+        return self._active
+
+    def apply(self, buffer: CellBuffer, frame: int):
+        threshold = self.threshold
+        entropy = self.entropy
+        for y, roll in enumerate(entropy.bytes(buffer.height)):
+            if roll >= threshold:
+                continue
+            glyphs = buffer.glyphs[y]
+            replacements = entropy.choice_string(self.CHARS, len(glyphs))
+            rolls = entropy.bytes(len(glyphs))
+            buffer.set_glyphs(y, ''.join(
+                new if cell_roll < threshold else old
+                for old, new, cell_roll in zip(glyphs, replacements, rolls)
+            ))
+
+
+class WaveEffect(Effect):
+    """Rows are shifted right along a sine wave"""
+
+    def __init__(self, speed: float = 0.1, amplitude: int = 3, **params):
+        super().__init__(speed=speed, amplitude=amplitude, **params)
+        self.speed = speed
+        self.amplitude = amplitude
+
+    def active(self, frame: int) -> bool:
+        return self.amplitude > 0
+
+    def apply(self, buffer: CellBuffer, frame: int):
+        phase = frame * self.speed
+        for y in range(buffer.height):
+            offset = int(self.amplitude * sine((phase + y) * 0.5))
+            if offset > 0:
+                buffer.shift(y, offset)
+
+
+class PulseEffect(Effect):
+    """The whole buffer dims and brightens over time"""
+
+    def __init__(self, speed: float = 0.1, **params):
+        super().__init__(speed=speed, **params)
+        self.speed = speed
+
+    def level(self, frame: int) -> str:
+        return PULSE_TABLE[table_index(frame * self.speed)]
+
+    def active(self, frame: int) -> bool:
+        return bool(self.level(frame))
+
+    def state(self, frame: int) -> Hashable:
+        return self.level(frame)
+
+    def apply(self, buffer: CellBuffer, frame: int):
+        style = PULSE_STYLES[self.level(frame)]
+        for y in range(buffer.height):
+            buffer.restyle(y, style)
+
+
+class MatrixFadeEffect(Effect):
+    """Diagonal bands of cells fade out through shade characters"""
+
+    def __init__(self, speed: float = 0.05, **params):
+        super().__init__(speed=speed, **params)
+        self.speed = speed
+
+    def apply(self, buffer: CellBuffer, frame: int):
+        if not buffer.height:
+            return
+        width = max(len(glyphs) for glyphs in buffer.glyphs)
+        phase = frame * self.speed
+        # Fade depends on x + y only: compute each diagonal once, then each
+        # row is a slice of the same band string
+        band = ''.join(
+            FADE_TABLE[table_index((phase + d) * 0.3)]
+            for d in range(width + buffer.height)
+        )
+        for y, glyphs in enumerate(buffer.glyphs):
+            fade = band[y:y + len(glyphs)]
+            if fade.count(KEEP) == len(glyphs):
+                continue
+            buffer.set_glyphs(y, ''.join(
+                old if new == KEEP else new for old, new in zip(glyphs, fade)
+            ))
+
+
+def _freeze(value) -> Hashable:
+    """Hashable form of effect parameters"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def content_key(strips: Sequence[Strip]) -> Optional[Tuple[Tuple[Segment, ...], ...]]:
+    """The segments of strips row by row, as a cache key, or None if they
+    can't be hashed.
+
+    The key is the content itself rather than its hash, so a cache lookup
+    compares it on a hash match, and rows keep their boundaries: the same
+    segments split into rows differently make a different key.
+    """
+    key = tuple(tuple(strip) for strip in strips)
+    try:
+        hash(key)
+    except TypeError:
+        # Control segments can carry unhashable codes
+        return None
+    return key
+
+
+class EffectCache:
+    """Bounded LRU of effect results, with hit/miss counts"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Strip, ...]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Strip, ...]]:
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: Tuple[Strip, ...]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+class EffectPipeline:
+    """An ordered list of effects applied to rendered strips.
+
+    Effects run in order on a shared CellBuffer. If no effect is active for
+    a frame the strips are returned as they are, without building a buffer.
+    With a cache, results are memoised by the active effects, their
+    parameters and state, and the input strips, so re-rendering the same
+    content (or another tile doing so) costs a lookup. Pipelines with a
+    random effect skip the cache, as should callers whose content changes
+    every frame, by passing cache=False: looking up content that is never
+    seen again only costs time.
+    """
+
+    def __init__(self, effects: Sequence[Effect] = (), cache: Optional[EffectCache] = None):
+        self.effects = list(effects)
+        self.cache = cache
+
+    def __bool__(self) -> bool:
+        return bool(self.effects)
+
+    def active(self, frame: int) -> List[Effect]:
+        return [effect for effect in self.effects if effect.active(frame)]
+
+    def apply(self, strips: Sequence[Strip], frame: int, cache: bool = True) -> List[Strip]:
+        """Apply the active effects to strips, returning the resulting strips"""
+        active = self.active(frame)
+        if not active:
+            return list(strips)
+
+        key = None
+        if cache and self.cache is not None and all(effect.deterministic for effect in active):
+            content = content_key(strips)
+            if content is not None:
+                key = (tuple((effect.key, effect.state(frame)) for effect in active), content)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return list(cached)
+
+        buffer = CellBuffer(strips)
+        for effect in active:
+            effect.apply(buffer, frame)
+        result = buffer.to_strips()
+        if key is not None:
+            self.cache.put(key, tuple(result))
+        return result
+
+
+EffectSpec = Union[str, Dict[str, Any]]
+
 
 class EffectRegistry:
-    """Registry for shared visual effects"""
-    
-    def __init__(self):
-        self._effects: Dict[str, Callable] = {}
+    """Registry for shared visual effects.
+
+    Pipelines built by a registry share its result cache; use
+    get_effect_registry() for the process-wide one.
+    """
+
+    CACHE_SIZE = 256
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self._effects: Dict[str, Type[Effect]] = {}
+        self.cache = EffectCache(cache_size)
         self._register_builtin_effects()
-        
+
     def _register_builtin_effects(self):
         """Register built-in effects"""
-        self.register("glitch", self.glitch_effect)
-        self.register("wave", self.wave_effect)
-        self.register("pulse", self.pulse_effect)
-        self.register("matrix_fade", self.matrix_fade_effect)
-        
-    def register(self, name: str, effect_func: Callable):
-        """Register an effect function"""
-        self._effects[name] = effect_func
-        
+        self.register("glitch", GlitchEffect)
+        self.register("wave", WaveEffect)
+        self.register("pulse", PulseEffect)
+        self.register("matrix_fade", MatrixFadeEffect)
+
+    def register(self, name: str, effect_class: Type[Effect]):
+        """Register an effect class"""
+        self._effects[name] = effect_class
+
+    def create(self, name: str, **params) -> Optional[Effect]:
+        """Create an effect by name, or None if it is unknown"""
+        effect_class = self._effects.get(name)
+        return effect_class(**params) if effect_class else None
+
+    def pipeline(self, specs: Optional[Sequence[EffectSpec]]) -> EffectPipeline:
+        """Build a pipeline from config: names, or {name: {param: value}} entries"""
+        effects = []
+        for spec in specs or []:
+            items = spec.items() if isinstance(spec, dict) else [(spec, None)]
+            for name, params in items:
+                effect = self.create(name, **(params or {}))
+                if effect is not None:
+                    effects.append(effect)
+        return EffectPipeline(effects, self.cache)
+
     def apply(self, name: str, text: str, frame: int = 0, **kwargs) -> str:
-        """Apply an effect to text"""
-        if name in self._effects:
-            return self._effects[name](text, frame, **kwargs)
-        return text
-        
-    @staticmethod
-    def glitch_effect(text: str, frame: int, intensity: float = 0.1) -> str:
-        """Apply glitch effect to text"""
-        if random.random() > intensity:
-            return text
-            
-        lines = text.split('\n')
-        glitched_lines = []
-        
-        for line in lines:
-            if random.random() < intensity:
-                # Random character replacement
-                chars = list(line)
-                for i in range(len(chars)):
-                    if random.random() < intensity:
-                        chars[i] = random.choice('█▀▄░▒▓')
-                glitched_lines.append(''.join(chars))
-            else:
-                glitched_lines.append(line)
-                
-        return '\n'.join(glitched_lines)
-        
-    @staticmethod
-    def wave_effect(text: str, frame: int, speed: float = 0.1) -> str:
-        """Apply wave effect to text"""
-        lines = text.split('\n')
-        waved_lines = []
-        
-        for i, line in enumerate(lines):
-            offset = int(3 * math.sin((frame * speed + i) * 0.5))
-            padding = ' ' * max(0, offset)
-            waved_lines.append(padding + line)
-            
-        return '\n'.join(waved_lines)
-        
-    @staticmethod
-    def pulse_effect(text: str, frame: int, speed: float = 0.1) -> str:
-        """Apply pulse effect to text brightness"""
-        brightness = (math.sin(frame * speed) + 1) / 2
-        
-        if brightness < 0.3:
-            return f"[dim]{text}[/dim]"
-        elif brightness < 0.7:
+        """Apply an effect to plain text (glyph changes only)"""
+        effect = self.create(name, **kwargs)
+        if effect is None or not effect.active(frame):
             return text
-        else:
-            return f"[bold]{text}[/bold]"
-            
+        buffer = CellBuffer.from_text(text)
+        effect.apply(buffer, frame)
+        return buffer.to_text()
+
     @staticmethod
-    def matrix_fade_effect(text: str, frame: int, speed: float = 0.05) -> str:
-        """Apply matrix-style fade effect"""
-        lines = text.split('\n')
-        faded_lines = []
-        
-        for y, line in enumerate(lines):
-            chars = list(line)
-            for x in range(len(chars)):
-                fade = (math.sin((frame * speed + x + y) * 0.3) + 1) / 2
-                if fade < 0.3:
-                    chars[x] = ' '
-                elif fade < 0.6:
-                    chars[x] = '░'
-                elif fade < 0.8:
-                    chars[x] = '▒'
-                    
-            faded_lines.append(''.join(chars))
-            
-        return '\n'.join(faded_lines)
\ No newline at end of file
+    def pulse_level(frame: int, speed: float = 0.1) -> str:
+        """Brightness of the pulse at a frame: 'dim', '' (normal) or 'bold'"""
+        return PULSE_TABLE[table_index(frame * speed)]
+
+
+_shared: Optional[EffectRegistry] = None
+
+
+def get_effect_registry() -> EffectRegistry:
+    """Return the process-wide effect registry"""
+    global _shared
+    if _shared is None:
+        _shared = EffectRegistry()
+    return _shared
@@ -1,74 +1,245 @@
 # plugin_registry.py
+import ast
 import importlib
 import importlib.util
-import inspect
+import json
 from pathlib import Path
-from typing import Dict, Type, Optional, List
+from typing import Any, Dict, Type, Optional, List, Tuple
 from .base import BlinkenPlugin
+from ..utils.helpers import cache_dir
+
+# Built-in plugins: name -> (module relative to this package, class name)
+BUILTIN_PLUGINS: Dict[str, Tuple[str, str]] = {
+    "HexScroll": (".builtin.hex_scroll", "HexScroll"),
+    "MatrixRain": (".builtin.matrix_rain", "MatrixRain"),
+    "SystemMonitor": (".builtin.system_monitor", "SystemMonitor"),
+    "LogScroll": (".builtin.log_scroll", "LogScroll"),
+    "NetworkMonitor": (".builtin.network_monitor", "NetworkMonitor"),
+    "TacticalMap": (".builtin.tactical_map", "TacticalMap"),
+}
+
+# Entry point group packaged plugins register under
+ENTRY_POINT_GROUP = "hollywoodos.plugins"
+
+MANIFEST_CACHE = "plugin_manifest.json"
+
 
 class PluginRegistry:
-    """Central registry for all available plugins"""
-    
-    def __init__(self):
+    """Central registry for all available plugins.
+
+    Plugins are listed from a manifest (built-ins, entry points and the
+    class names found in ``plugins/*.py``) and only imported the first time
+    get_plugin asks for them.
+    """
+
+    def __init__(self, plugin_dir: str = "plugins"):
+        self.plugin_dir = Path(plugin_dir)
         self._plugins: Dict[str, Type[BlinkenPlugin]] = {}
+        # name -> ("module", module, class), ("entry_point", ep) or ("file", path, class)
+        self._manifest: Dict[str, Tuple[Any, ...]] = {}
+        self._file_modules: Dict[Path, Any] = {}
         self._scan_plugins()
-        
+
     def _scan_plugins(self):
         """Scan for all available plugins"""
         # Built-in plugins
         self._register_builtin_plugins()
-        
+
+        # Packaged plugins
+        self._register_entry_points()
+
         # Scan plugins directory
-        plugin_dir = Path("plugins")
-        if plugin_dir.exists():
-            for file in plugin_dir.glob("*.py"):
+        if self.plugin_dir.exists():
+            cache = self._load_manifest_cache()
+            entries = {}
+            for file in sorted(self.plugin_dir.glob("*.py")):
                 if file.name.startswith("_"):
                     continue
-                self._load_plugin_file(file)
-                
+                key = str(file.resolve())
+                entries[key] = self._scan_plugin_file(file, cache.get(key))
+            if entries != cache:
+                self._save_manifest_cache(entries)
+
     def _register_builtin_plugins(self):
         """Register built-in plugins"""
-        # Import built-in plugins
+        for name, (module, class_name) in BUILTIN_PLUGINS.items():
+            self._manifest[name] = ("module", module, class_name)
+
+    def _register_entry_points(self):
+        """Register plugins advertised by installed packages"""
         try:
-            from .builtin.hex_scroll import HexScroll
-            from .builtin.matrix_rain import MatrixRain
-            from .builtin.system_monitor import SystemMonitor
-            from .builtin.log_scroll import LogScroll
-            from .builtin.network_monitor import NetworkMonitor
-            from .builtin.tactical_map import TacticalMap
-            
-            self.register("HexScroll", HexScroll)
-            self.register("MatrixRain", MatrixRain)
-            self.register("SystemMonitor", SystemMonitor)
-            self.register("LogScroll", LogScroll)
-            self.register("NetworkMonitor", NetworkMonitor)
-            self.register("TacticalMap", TacticalMap)
-        except ImportError:
+            from importlib.metadata import entry_points
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                self._manifest[entry_point.name] = ("entry_point", entry_point)
+        except Exception as e:
+            print(f"Error reading plugin entry points: {e}")
+
+    def _scan_plugin_file(self, file: Path, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Find the plugin classes in a file, reusing cached results if unchanged"""
+        stat = file.stat()
+        if self._cache_valid(cached, stat):
+            entry = cached
+        else:
+            classes = self._find_plugin_classes(file)
+            if classes is None:
+                # The scan can't tell; import the file and look
+                classes = self._import_plugin_classes(file)
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "classes": classes,
+            }
+        for class_name in entry["classes"]:
+            self._manifest[class_name] = ("file", file, class_name)
+        return entry
+
+    @staticmethod
+    def _cache_valid(cached: Any, stat) -> bool:
+        """Whether a cache entry is well formed and matches the file"""
+        return (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("size") == stat.st_size
+            and isinstance(cached.get("classes"), list)
+            and all(isinstance(name, str) for name in cached["classes"])
+        )
+
+    @staticmethod
+    def _find_plugin_classes(file: Path) -> Optional[List[str]]:
+        """List BlinkenPlugin subclasses defined in a file without importing it.
+
+        Bases are recognised by name: BlinkenPlugin, the built-in plugins,
+        aliases they are imported under and classes defined earlier in the
+        file. Returns None when a class derives from some other imported
+        name, which may or may not be a plugin.
+        """
+        try:
+            tree = ast.parse(file.read_text(), filename=str(file))
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"Error loading plugin {file}: {e}")
+            return []
+
+        plugin_bases = {"BlinkenPlugin", *BUILTIN_PLUGINS}
+        imported = set()
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    name = alias.asname or alias.name
+                    if alias.name in plugin_bases:
+                        plugin_bases.add(name)
+                    else:
+                        imported.add(name)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported.add((alias.asname or alias.name).partition(".")[0])
+
+        classes = []
+        unsure = False
+        # Classes can derive from plugin classes defined earlier in the file
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            maybe_plugin = False
+            for base in node.bases:
+                if isinstance(base, ast.Attribute):
+                    base_name = base.attr
+                    root = base.value
+                    while isinstance(root, ast.Attribute):
+                        root = root.value
+                    origin = getattr(root, "id", None)
+                else:
+                    base_name = origin = getattr(base, "id", None)
+                if base_name in plugin_bases:
+                    plugin_bases.add(node.name)
+                    classes.append(node.name)
+                    break
+                if origin in imported:
+                    maybe_plugin = True
+            else:
+                unsure = unsure or maybe_plugin
+        return None if unsure else classes
+
+    def _import_plugin_classes(self, file: Path) -> List[str]:
+        """List BlinkenPlugin subclasses defined in a file by importing it"""
+        try:
+            module = self._load_plugin_file(file)
+        except Exception as e:
+            print(f"Error loading plugin {file}: {e}")
+            return []
+        return [
+            name for name, value in vars(module).items()
+            if isinstance(value, type) and issubclass(value, BlinkenPlugin)
+            and value is not BlinkenPlugin and value.__module__ == module.__name__
+        ]
+
+    def _load_manifest_cache(self) -> Dict[str, Any]:
+        try:
+            with open(cache_dir() / MANIFEST_CACHE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Anything else was written by something other than us
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_manifest_cache(self, entries: Dict[str, Any]):
+        try:
+            path = cache_dir() / MANIFEST_CACHE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(entries, f)
+        except OSError:
+            # Caching is an optimisation only
             pass
-            
+
     def _load_plugin_file(self, file: Path):
-        """Load a plugin from a file"""
-        try:
+        """Load (once) the module of a plugin file"""
+        module = self._file_modules.get(file)
+        if module is None:
             spec = importlib.util.spec_from_file_location(file.stem, file)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Find all plugin classes in the module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if issubclass(obj, BlinkenPlugin) and obj != BlinkenPlugin:
-                        self.register(name, obj)
+            if not (spec and spec.loader):
+                raise ImportError(f"cannot load {file}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._file_modules[file] = module
+        return module
+
+    def _import_plugin(self, name: str) -> Optional[Type[BlinkenPlugin]]:
+        """Import the class behind a manifest entry"""
+        entry = self._manifest[name]
+        kind = entry[0]
+        try:
+            if kind == "module":
+                module = importlib.import_module(entry[1], __package__)
+                plugin_class = getattr(module, entry[2])
+            elif kind == "entry_point":
+                plugin_class = entry[1].load()
+            else:
+                plugin_class = getattr(self._load_plugin_file(entry[1]), entry[2])
         except Exception as e:
-            print(f"Error loading plugin {file}: {e}")
-            
+            print(f"Error loading plugin {name}: {e}")
+            return None
+
+        if not (isinstance(plugin_class, type) and issubclass(plugin_class, BlinkenPlugin)):
+            print(f"Error loading plugin {name}: not a BlinkenPlugin")
+            return None
+        return plugin_class
+
     def register(self, name: str, plugin_class: Type[BlinkenPlugin]):
         """Register a plugin class"""
         self._plugins[name] = plugin_class
-        
+
     def get_plugin(self, name: str) -> Optional[Type[BlinkenPlugin]]:
-        """Get a plugin class by name"""
-        return self._plugins.get(name)
-        
+        """Get a plugin class by name, importing it on first use"""
+        plugin_class = self._plugins.get(name)
+        if plugin_class is None and name in self._manifest:
+            plugin_class = self._import_plugin(name)
+            if plugin_class is not None:
+                self.register(name, plugin_class)
+            else:
+                # Don't retry a broken plugin on every tile
+                del self._manifest[name]
+        return plugin_class
+
     def list_plugins(self) -> List[str]:
         """List all available plugin names"""
-        return list(self._plugins.keys())
\ No newline at end of file
+        return list(dict.fromkeys([*self._manifest, *self._plugins]))
@@ -3,9 +3,8 @@
 Utility functions and helpers for HollywoodOS.
 """
 
-# Empty for now, but could contain:
-# from .helpers import some_utility_function
+from .helpers import cache_dir
 
 __all__ = [
-    # "some_utility_function",
+    "cache_dir",
 ]
\ No newline at end of file
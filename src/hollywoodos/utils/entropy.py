@@ -0,0 +1,117 @@
+# entropy.py
+import random
+import threading
+from typing import Dict, List, Optional, Sequence
+
+
+class EntropyPool:
+    """Pre-generated random bytes handed out to plugins in bulk.
+
+    Random data is produced a block at a time and sliced into bytes, ints,
+    floats and character choices, instead of one ``random`` call per value.
+    The next block is generated by a background thread while the current
+    one is consumed. Blocks come from a single seedable generator in a fixed
+    order, so a seeded pool always yields the same stream.
+
+    Values are derived by modulo reduction and are slightly biased for
+    ranges that don't divide 256**k evenly; fine for visuals, not for
+    anything security related.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = BLOCK_SIZE):
+        self.block_size = block_size
+        self._rng = random.Random(seed)
+        self._block = self._rng.randbytes(block_size)
+        self._pos = 0
+        self._next: Optional[bytes] = None
+        self._ready = threading.Event()
+        self._prefetch = threading.Thread(target=self._generate_next, daemon=True)
+        self._prefetch.start()
+        # Translation tables for choice_string, per character set
+        self._tables: Dict[str, Dict[int, str]] = {}
+
+    def _generate_next(self):
+        self._next = self._rng.randbytes(self.block_size)
+        self._ready.set()
+
+    def _swap_block(self):
+        """Switch to the prefetched block and start generating the one after"""
+        self._ready.wait()
+        self._block = self._next
+        self._pos = 0
+        self._ready.clear()
+        self._prefetch = threading.Thread(target=self._generate_next, daemon=True)
+        self._prefetch.start()
+
+    def bytes(self, n: int) -> bytes:
+        """Return n random bytes"""
+        if n > self.block_size:
+            chunks = [self.bytes(self.block_size) for _ in range(n // self.block_size)]
+            chunks.append(self.bytes(n % self.block_size))
+            return b"".join(chunks)
+        end = self._pos + n
+        if end <= len(self._block):
+            data = self._block[self._pos:end]
+            self._pos = end
+            return data
+        head = self._block[self._pos:]
+        self._swap_block()
+        return head + self.bytes(n - len(head))
+
+    def randint(self, low: int, high: int) -> int:
+        """Random integer in [low, high], like random.randint"""
+        span = high - low + 1
+        if span <= 256:
+            return low + self.bytes(1)[0] % span
+        return low + int.from_bytes(self.bytes(8), "little") % span
+
+    def randints(self, n: int, low: int, high: int) -> List[int]:
+        """n random integers in [low, high]"""
+        span = high - low + 1
+        if span <= 256:
+            return [low + b % span for b in self.bytes(n)]
+        data = memoryview(self.bytes(8 * n)).cast("Q")
+        return [low + v % span for v in data]
+
+    def random(self) -> float:
+        """Random float in [0, 1)"""
+        return (int.from_bytes(self.bytes(8), "little") >> 11) * (1.0 / (1 << 53))
+
+    def uniform(self, a: float, b: float) -> float:
+        """Random float between a and b"""
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence):
+        """Random element of a non-empty sequence"""
+        return seq[self.randint(0, len(seq) - 1)]
+
+    def choices(self, seq: Sequence, n: int) -> list:
+        """n random elements of a non-empty sequence"""
+        return [seq[i] for i in self.randints(n, 0, len(seq) - 1)]
+
+    def choice_string(self, chars: str, n: int) -> str:
+        """String of n characters drawn from chars (at most 256 distinct)"""
+        table = self._tables.get(chars)
+        if table is None:
+            table = str.maketrans({i: chars[i % len(chars)] for i in range(256)})
+            self._tables[chars] = table
+        return self.bytes(n).decode("latin-1").translate(table)
+
+
+_shared: Optional[EntropyPool] = None
+
+
+def get_entropy(seed: Optional[int] = None) -> EntropyPool:
+    """Return the pool a plugin should draw from.
+
+    Without a seed this is the process-wide shared pool; with one, a private
+    pool that reproduces the same sequence on every run.
+    """
+    global _shared
+    if seed is not None:
+        return EntropyPool(seed)
+    if _shared is None:
+        _shared = EntropyPool()
+    return _shared
@@ -0,0 +1,9 @@
+# helpers.py
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Directory for HollywoodOS on-disk caches (XDG cache dir aware)"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "hollywoodos"
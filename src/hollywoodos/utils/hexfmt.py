@@ -0,0 +1,113 @@
+# hexfmt.py
+from array import array
+from typing import List, Optional
+
+# Printable ASCII maps to itself, everything else to '.'
+ASCII_GUTTER = bytes(b if 0x20 <= b < 0x7f else 0x2e for b in range(256))
+
+# array typecode for each word size, used to byte-swap little-endian groups
+WORD_TYPECODES = {array(code).itemsize: code for code in "QLIH"}
+
+GROUP_SIZES = (1, 2, 4, 8)
+
+
+class HexFormatter:
+    """Formats byte chunks into hex dump rows in bulk.
+
+    A whole chunk is hex-encoded with a single ``bytes.hex`` call (grouped
+    into 1/2/4/8-byte words, little-endian words byte-swapped with one
+    ``array.byteswap``) and the ASCII gutter with a single ``translate``;
+    rows are then fixed-width slices of those two strings. Only the offset
+    column is formatted per row.
+
+    Rows look like ``OFFSET: HEX  ASCII``; ``offset_width=0`` drops the
+    offset column and ``gutter=False`` the ASCII gutter.
+    """
+
+    def __init__(self, group: int = 1, endian: str = "big", uppercase: bool = True,
+                 offset_width: int = 8, gutter: bool = True):
+        if group not in GROUP_SIZES:
+            raise ValueError(f"group must be one of {GROUP_SIZES}, not {group}")
+        if endian not in ("big", "little"):
+            raise ValueError(f"endian must be 'big' or 'little', not {endian!r}")
+        self.group = group
+        self.endian = endian
+        self.uppercase = uppercase
+        self.offset_width = offset_width
+        self.gutter = gutter
+        self._offset_format = f"{{:0{offset_width}{'X' if uppercase else 'x'}}}: "
+
+    def hex_width(self, bytes_per_row: int) -> int:
+        """Width of the hex part of a full row"""
+        groups = -(-bytes_per_row // self.group)
+        return bytes_per_row * 2 + groups - 1
+
+    def row_width(self, bytes_per_row: int) -> int:
+        """Width of a full row, offset column and gutter included"""
+        width = self.hex_width(bytes_per_row)
+        if self.offset_width:
+            width += self.offset_width + 2
+        if self.gutter:
+            width += 2 + bytes_per_row
+        return width
+
+    def fit(self, width: int, limit: Optional[int] = None) -> int:
+        """Most bytes per row (a whole number of groups) that fit in width"""
+        fixed = (self.offset_width + 2 if self.offset_width else 0) + (2 if self.gutter else 0)
+        # Per group: 2 chars per byte, one separator, one gutter char per byte
+        per_group = self.group * (3 if self.gutter else 2) + 1
+        groups = (width - fixed + 1) // per_group
+        if limit is not None:
+            groups = min(groups, limit // self.group)
+        return max(1, groups) * self.group
+
+    def hex(self, data) -> str:
+        """Grouped hex of a whole chunk, groups separated by single spaces"""
+        group = self.group
+        if self.endian == "little" and group > 1:
+            full = len(data) - len(data) % group
+            words = array(WORD_TYPECODES[group])
+            words.frombytes(data[:full])
+            words.byteswap()
+            data = words.tobytes() + bytes(data[full:])[::-1]
+        text = data.hex(" ", -group)
+        return text.upper() if self.uppercase else text
+
+    def ascii(self, data) -> str:
+        """ASCII gutter text of a whole chunk"""
+        return bytes(data).translate(ASCII_GUTTER).decode("ascii")
+
+    def format_rows(self, data, bytes_per_row: int, offset: int = 0) -> List[str]:
+        """Split data into rows of bytes_per_row bytes, formatted in bulk.
+
+        bytes_per_row should be a multiple of the group size (as returned by
+        fit); the last row may be short and is padded to full width.
+        """
+        if not data:
+            return []
+        hex_width = self.hex_width(bytes_per_row)
+        stride = hex_width + 1
+        text = self.hex(data)
+        count = -(-len(data) // bytes_per_row)
+        rows = [text[i * stride:i * stride + hex_width] for i in range(count)]
+        if len(rows[-1]) < hex_width:
+            rows[-1] = rows[-1].ljust(hex_width)
+
+        if self.gutter:
+            gutter = self.ascii(data).ljust(count * bytes_per_row)
+            rows = [
+                f"{row}  {gutter[i * bytes_per_row:(i + 1) * bytes_per_row]}"
+                for i, row in enumerate(rows)
+            ]
+        if self.offset_width:
+            offset_format = self._offset_format.format
+            rows = [
+                offset_format(offset + i * bytes_per_row) + row
+                for i, row in enumerate(rows)
+            ]
+        return rows
+
+    def format_row(self, data, offset: int = 0, bytes_per_row: Optional[int] = None) -> str:
+        """Format a single row; bytes_per_row sets the padded width of a short one"""
+        rows = self.format_rows(data, bytes_per_row or len(data), offset)
+        return rows[0] if rows else ""
@@ -0,0 +1,116 @@
+# highlight.py
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from rich.errors import StyleSyntaxError
+from rich.segment import Segment
+from rich.style import Style
+
+# Built-in rules: config key -> [(pattern, style)]
+BUILTIN_RULES: Dict[str, List[Tuple[str, str]]] = {
+    "timestamps": [(r"^\[[^\]]*\]", "dim")],
+    "levels": [
+        (r"\b(?:ERROR|CRITICAL|FATAL)\b", "bold red"),
+        (r"\bWARN(?:ING)?\b", "bold yellow"),
+        (r"\bINFO\b", "green"),
+        (r"\bDEBUG\b", "dim cyan"),
+    ],
+    "ips": [(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b", "cyan")],
+    "paths": [(r"(?<![\w/.])/[\w.\-/]+", "blue")],
+}
+
+# Leading global flags, which the alternation needs scoped to the rule
+GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+# \1, (?P=name) and (?(1)...) refer to groups by a number or name that
+# changes once the rule is one group among many
+BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=|\(\?\()")
+
+
+class Highlighter:
+    """Styles text with a set of regex rules in a single pass.
+
+    All rules are compiled into one alternation with a named group per rule,
+    so a line is scanned once whatever the number of rules; where rules
+    overlap, the earliest match wins, and at the same position the first
+    rule listed. User rules come before the built-in ones.
+
+    Config (all optional)::
+
+        levels: true        # ERROR / WARNING / INFO / DEBUG keywords
+        ips: true
+        paths: true
+        timestamps: true    # leading [...] block
+        rules:
+          - pattern: "timeout|refused"
+            style: "bold magenta"
+
+    A rule's leading global flags, like ``(?i)``, apply to that rule only.
+    Backreferences aren't supported. Invalid patterns or styles are
+    skipped and listed in ``errors``; the other rules still apply.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.errors: List[str] = []
+        rules: List[Tuple[str, str]] = [
+            (rule.get("pattern", ""), rule.get("style", "bold"))
+            for rule in config.get("rules", [])
+        ]
+        for key, builtin in BUILTIN_RULES.items():
+            if config.get(key, True):
+                rules.extend(builtin)
+
+        patterns = []
+        self.styles: Dict[str, Style] = {}
+        for index, (pattern, style) in enumerate(rules):
+            if not pattern:
+                continue
+            name = f"_rule{index}"
+            if BACKREFERENCE.search(pattern):
+                self.errors.append(f"{pattern!r}: backreferences are not supported")
+                continue
+            body = pattern
+            flags = GLOBAL_FLAGS.match(pattern)
+            if flags:
+                body = f"(?{flags.group(1)}:{pattern[flags.end():]})"
+            grouped = f"(?P<{name}>{body})"
+            try:
+                parsed = Style.parse(style)
+                # Compiled as it will be used, so a rule that only breaks in
+                # the alternation (e.g. a group name another rule has) is
+                # the one dropped
+                re.compile("|".join(patterns + [grouped]))
+            except (re.error, StyleSyntaxError) as e:
+                self.errors.append(f"{pattern!r}: {e}")
+                continue
+            patterns.append(grouped)
+            self.styles[name] = parsed
+        self.matcher = re.compile("|".join(patterns)) if patterns else None
+        self._combined: Dict[str, Style] = dict(self.styles)
+        self.base_style = Style()
+
+    def set_base_style(self, base_style: Style):
+        """Style every segment is drawn on top of"""
+        self.base_style = base_style
+        self._combined = {name: base_style + style for name, style in self.styles.items()}
+
+    def segments(self, text: str) -> List[Segment]:
+        """Split text into styled segments"""
+        base = self.base_style
+        if self.matcher is None:
+            return [Segment(text, base)]
+        combined = self._combined
+        segments = []
+        pos = 0
+        for match in self.matcher.finditer(text):
+            start, end = match.span()
+            if start == end:
+                continue
+            if start > pos:
+                segments.append(Segment(text[pos:start], base))
+            # The rule's own group is the outermost, so it is the last to close
+            segments.append(Segment(text[start:end], combined[match.lastgroup]))
+            pos = end
+        if pos < len(text):
+            segments.append(Segment(text[pos:], base))
+        return segments
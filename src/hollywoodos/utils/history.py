@@ -0,0 +1,268 @@
+# history.py
+import mmap
+import re
+import shutil
+import tempfile
+import threading
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Iterable, List, Optional, Tuple
+
+# Index tokens: words, and dotted runs like IPs, versions and file names
+TOKEN = re.compile(r"\w+(?:\.\w+)*")
+
+TAG_MASK = 0xFFFFFFFF
+
+
+def term_matcher(term: str) -> Callable[[str], bool]:
+    """Test for lines matching a search term, case-insensitively.
+
+    A line matches when it contains term as a substring and every word of
+    term is a whole word of the line, so "rror" does not match "ERROR"
+    but "connect to" matches "failed to connect to db". LogHistory.search
+    and the unindexed filter in LogScroll both match this way.
+    """
+    needle = term.lower()
+    tokens = set(TOKEN.findall(needle))
+
+    def matches(text: str) -> bool:
+        lowered = text.lower()
+        return needle in lowered and tokens.issubset(TOKEN.findall(lowered))
+
+    return matches
+
+
+class _Segment:
+    """A block of consecutive lines: UTF-8 text, line offsets and a token index.
+
+    The index maps hash(token) into a fixed number of buckets. Each bucket
+    holds two parallel arrays: the line numbers containing a token of that
+    bucket, and 32 more bits of each token's hash. Searches pick out the
+    postings whose tag matches with array.index, which scans in C, so a
+    term sharing a bucket with a token on every line (a timestamp field,
+    a log level) still costs little more than its own matches; only those
+    lines are decoded and checked.
+    """
+
+    __slots__ = ("base", "data", "offsets", "lines", "tags", "shift", "path", "_file", "_writer")
+
+    def __init__(self, base: int, bucket_count: int):
+        self.base = base
+        self.data = bytearray()
+        self.offsets = array("I", [0])
+        self.lines = [array("I") for _ in range(bucket_count)]
+        self.tags = [array("I") for _ in range(bucket_count)]
+        # Tags are the hash bits above the ones picking the bucket
+        self.shift = bucket_count.bit_length() - 1
+        self.path: Optional[Path] = None
+        self._file = None
+        self._writer: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, line: str):
+        index = len(self.offsets) - 1
+        self.data += line.encode("utf-8", "replace")
+        self.offsets.append(len(self.data))
+        mask = len(self.lines) - 1
+        shift = self.shift
+        for token in set(TOKEN.findall(line.lower())):
+            h = hash(token)
+            self.lines[h & mask].append(index)
+            self.tags[h & mask].append((h >> shift) & TAG_MASK)
+
+    def line(self, index: int) -> str:
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]]).decode("utf-8", "replace")
+
+    def postings(self, token: str) -> List[int]:
+        """Line numbers indexed under token's hash, oldest first"""
+        h = hash(token)
+        bucket = h & (len(self.lines) - 1)
+        lines, tags = self.lines[bucket], self.tags[bucket]
+        tag = (h >> self.shift) & TAG_MASK
+        found = []
+        position = 0
+        try:
+            while True:
+                position = tags.index(tag, position)
+                found.append(lines[position])
+                position += 1
+        except ValueError:
+            return found
+
+    def candidates(self, tokens: List[str]) -> Iterable[int]:
+        """Line numbers that may contain all tokens, newest first"""
+        if not tokens:
+            return range(len(self) - 1, -1, -1)
+        postings = sorted((self.postings(token) for token in set(tokens)), key=len)
+        if len(postings) == 1:
+            return reversed(postings[0])
+        lines = set(postings[0])
+        for posting in postings[1:]:
+            lines.intersection_update(posting)
+        return sorted(lines, reverse=True)
+
+    def spill(self, path: Path):
+        """Move the text to a file on a background thread.
+
+        The segment must be sealed (no more appends). Until the file is
+        written and mapped back in read-only, lines are read from memory;
+        if it can't be written they stay there.
+        """
+        self.path = path
+        self._writer = threading.Thread(target=self._write, args=(path,), name="LogHistory", daemon=True)
+        self._writer.start()
+
+    def _write(self, path: Path):
+        try:
+            path.write_bytes(self.data)
+            if self.data:
+                self._file = open(path, "rb")
+                # Swapping the reference is atomic; readers see either copy
+                self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.data = b""
+        except (OSError, ValueError):
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def wait(self):
+        """Wait for a spill in progress to finish"""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def close(self):
+        self.wait()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.path is not None:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+            self.path = None
+
+
+class LogHistory:
+    """Append-only store for very long log histories, searchable by term.
+
+    Lines are kept in segments of segment_lines lines, each storing its text
+    as one UTF-8 blob with an offset array and a small hashed token index.
+    Once a segment is full it is sealed; with a path, sealed segments are
+    written to files in a private directory under it, on a background
+    thread, and memory-mapped, so only the index stays in memory. When more than max_lines are stored the oldest segment is
+    dropped, which keeps memory (and disk) bounded however long it runs.
+
+    Lines are numbered from 0 in arrival order; numbers of dropped lines are
+    not reused.
+    """
+
+    SEGMENT_LINES = 65536
+    BUCKETS = 4096
+
+    def __init__(self, max_lines: int = 1_000_000, path: Optional[str] = None,
+                 segment_lines: int = SEGMENT_LINES, buckets: int = BUCKETS):
+        self.max_lines = max_lines
+        self.segment_lines = segment_lines
+        # Bucket count must be a power of two to index with a mask
+        self.bucket_count = 1 << max(0, buckets - 1).bit_length()
+        self.path: Optional[Path] = None
+        if path:
+            root = Path(path).expanduser()
+            root.mkdir(parents=True, exist_ok=True)
+            # Histories sharing a path each get their own directory
+            self.path = Path(tempfile.mkdtemp(prefix="history-", dir=root))
+        self.segments: Deque[_Segment] = deque([_Segment(0, self.bucket_count)])
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def first_index(self) -> int:
+        """Number of the oldest line still stored"""
+        return self.segments[0].base
+
+    @property
+    def next_index(self) -> int:
+        """Number the next appended line will get"""
+        return self.segments[-1].base + len(self.segments[-1])
+
+    def append(self, line: str):
+        segment = self.segments[-1]
+        if len(segment) >= self.segment_lines:
+            self._seal(segment)
+            segment = _Segment(segment.base + len(segment), self.bucket_count)
+            self.segments.append(segment)
+        segment.append(line)
+        self._length += 1
+        if self._length - len(self.segments[0]) >= self.max_lines and len(self.segments) > 1:
+            self._length -= len(self.segments[0])
+            self.segments.popleft().close()
+
+    def extend(self, lines: Iterable[str]):
+        for line in lines:
+            self.append(line)
+
+    def _seal(self, segment: _Segment):
+        if self.path is not None:
+            segment.spill(self.path / f"segment-{segment.base:012d}.log")
+
+    def flush(self):
+        """Wait until every sealed segment has been written out"""
+        for segment in self.segments:
+            segment.wait()
+
+    def line(self, index: int) -> str:
+        """The line with a given number"""
+        for segment in self.segments:
+            if segment.base <= index < segment.base + len(segment):
+                return segment.line(index - segment.base)
+        raise IndexError(index)
+
+    def search(self, term: str, limit: int = 1000, before: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Newest lines matching term, as (number, line).
+
+        Lines match as with term_matcher(): the words of term are looked
+        up in the index, so they only match whole words of a line ("rror"
+        does not find "ERROR"). Only lines numbered below before are
+        considered, so passing the oldest number of one page of results
+        fetches the next page.
+        """
+        tokens = TOKEN.findall(term.lower())
+        matches = term_matcher(term)
+        results = []
+        for segment in reversed(self.segments):
+            base = segment.base
+            if before is not None and base >= before:
+                continue
+            for index in segment.candidates(tokens):
+                number = base + index
+                if before is not None and number >= before:
+                    continue
+                text = segment.line(index)
+                if matches(text):
+                    results.append((number, text))
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def close(self):
+        """Release mapped segments and delete their files and directory.
+
+        The history stays usable, in memory only.
+        """
+        for segment in self.segments:
+            segment.close()
+        self.segments = deque([_Segment(self.next_index, self.bucket_count)])
+        self._length = 0
+        if self.path is not None:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path = None
@@ -0,0 +1,73 @@
+# mmap_reader.py
+import mmap
+import os
+from typing import Optional, Tuple
+
+
+class MappedFileReader:
+    """Sequential reader over a memory-mapped file.
+
+    Chunks are returned as memoryview slices of the mapping, so nothing is
+    copied and memory use doesn't depend on the file size. A returned slice
+    is only valid until the next call that may remap the file; format it
+    right away.
+
+    At the end of the file the reader either wraps back to the start offset
+    (loop), waits for the file to grow (follow), or stops. Files other than
+    followed ones are assumed not to shrink while mapped.
+    """
+
+    def __init__(self, path: str, offset: int = 0, loop: bool = True, follow: bool = False):
+        self.path = path
+        self.start_offset = max(0, offset)
+        self.loop = loop
+        self.follow = follow
+        self._file = open(path, 'rb')
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self.size = 0
+        self._remap()
+        self.position = min(self.start_offset, self.size)
+
+    def _remap(self):
+        """(Re)map the whole file at its current size"""
+        self._unmap()
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size:
+            # Empty files can't be mapped; they simply have nothing to read yet
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+
+    def _unmap(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def read(self, n: int) -> Tuple[int, memoryview]:
+        """Return (offset, up to n bytes) and advance; empty when nothing is available"""
+        if self.follow:
+            # Check every read: touching pages past a truncated end of file
+            # would raise SIGBUS, and growth should show up promptly
+            size = os.fstat(self._file.fileno()).st_size
+            if size != self.size:
+                self._remap()
+                if size < self.position:
+                    # Truncated: start over from the top
+                    self.position = 0
+        elif self.position >= self.size and self.loop and self.size:
+            self.position = self.start_offset if self.start_offset < self.size else 0
+
+        if self.position >= self.size:
+            return self.position, memoryview(b"")
+
+        offset = self.position
+        chunk = self._view[offset:offset + n]
+        self.position = offset + len(chunk)
+        return offset, chunk
+
+    def close(self):
+        self._unmap()
+        self._file.close()
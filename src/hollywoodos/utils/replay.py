@@ -0,0 +1,154 @@
+# replay.py
+import re
+from datetime import date
+from typing import Dict, Generator, List, Optional, Tuple
+
+# "2024-05-01 12:34:56", "2024-05-01T12:34:56.789", "[2024-05-01 12:34:56,789]"
+TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:[.,](\d+))?")
+
+# How far into a line a timestamp is looked for
+TIMESTAMP_WINDOW = 64
+
+
+def _seconds(match: "re.Match[str]", days: Dict[str, float]) -> Optional[float]:
+    """Seconds since year 1 of a TIMESTAMP match, or None if it isn't a real
+    date and time (e.g. MySQL's 0000-00-00 00:00:00)"""
+    day, hours, minutes, seconds, fraction = match.groups()
+    hours, minutes, seconds = int(hours), int(minutes), int(seconds)
+    # 60 allows for leap seconds
+    if hours > 23 or minutes > 59 or seconds > 60:
+        return None
+    day_seconds = days.get(day)
+    if day_seconds is None:
+        try:
+            day_seconds = date.fromisoformat(day).toordinal() * 86400.0
+        except ValueError:
+            return None
+        days[day] = day_seconds
+    t = day_seconds + hours * 3600 + minutes * 60 + seconds
+    if fraction:
+        t += int(fraction) / 10 ** len(fraction)
+    return t
+
+
+def timed_lines(path: str, max_gap: Optional[float] = None) -> Generator[Tuple[float, str], None, None]:
+    """Lazily read (seconds, line) pairs from a log file.
+
+    Seconds come from the first timestamp near the start of each line;
+    lines without one (stack traces, wrapped messages) get the time of the
+    line before, and any before the first timestamp (headers, comments)
+    get that first timestamp. Timestamps that aren't a real date and time
+    count as no timestamp. A file without timestamps comes out at time
+    0. With max_gap, longer pauses in the recording are shortened to
+    max_gap seconds.
+    """
+    days: Dict[str, float] = {}
+    last = None
+    shift = 0.0
+    # Lines seen before the first timestamp
+    leading: List[str] = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            match = TIMESTAMP.search(line, 0, TIMESTAMP_WINDOW)
+            t = _seconds(match, days) if match is not None else None
+            if t is None:
+                if last is None:
+                    leading.append(line)
+                else:
+                    yield last, line
+                continue
+            t -= shift
+            if last is not None and max_gap is not None and t - last > max_gap:
+                shift += t - last - max_gap
+                t = last + max_gap
+            last = t
+            for held in leading:
+                yield t, held
+            leading.clear()
+            yield t, line
+    for held in leading:
+        yield 0.0, held
+
+
+class LogReplay:
+    """Plays a recorded log back on its original timing.
+
+    The position is the time into the recording, measured from its first
+    timestamp; advance() moves it on by real seconds times speed and returns
+    the lines whose time has come. The file is read lazily, one line ahead
+    of the position, so recordings of any size can be replayed. Seeking
+    forward skips lines without returning them; seeking back reopens the
+    file. With loop, playback starts over after the last line; a pass
+    lasts at least min_pass seconds of recording time, so a recording
+    whose lines all share one timestamp isn't replayed on every call.
+    """
+
+    MIN_PASS = 1.0
+
+    def __init__(self, path: str, speed: float = 1.0, start: float = 0.0,
+                 loop: bool = True, max_gap: Optional[float] = None,
+                 min_pass: float = MIN_PASS):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.max_gap = max_gap
+        self.min_pass = min_pass
+        self._lines: Optional[Generator[Tuple[float, str], None, None]] = None
+        self._open()
+        if start > 0:
+            self.seek(start)
+
+    def _open(self):
+        if self._lines is not None:
+            self._lines.close()
+        self._lines = timed_lines(self.path, self.max_gap)
+        self._next = next(self._lines, None)
+        self.origin = self._next[0] if self._next is not None else 0.0
+        self._last = self.origin
+        self.position = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self._next is None
+
+    def seek(self, position: float):
+        """Jump to a time into the recording, skipping the lines before it"""
+        if position < self.position:
+            self._open()
+        self.position = max(0.0, position)
+        self._skip(self.origin + self.position)
+        if self._next is None and self.loop:
+            # Past the end; start over
+            self._open()
+
+    def _skip(self, until: float):
+        lines, pending = self._lines, self._next
+        while pending is not None and pending[0] < until:
+            pending = next(lines, None)
+        self._next = pending
+
+    def advance(self, seconds: float) -> List[str]:
+        """Move on by seconds of real time and return the lines now due"""
+        self.position += seconds * self.speed
+        due = self.origin + self.position
+        lines = []
+        pending = self._next
+        while pending is not None and pending[0] <= due:
+            self._last = pending[0]
+            lines.append(pending[1])
+            pending = next(self._lines, None)
+        self._next = pending
+        if pending is None and self.loop and lines:
+            # Start over, keeping the time run past the last line so each
+            # pass takes exactly as long as the recording; a negative
+            # overshoot holds the next pass back until min_pass is up
+            end = max(self._last - self.origin, self.min_pass)
+            overshoot = self.position - end
+            self._open()
+            self.position = overshoot
+        return lines
+
+    def close(self):
+        """Close the file being read"""
+        self._lines.close()
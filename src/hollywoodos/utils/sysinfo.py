@@ -0,0 +1,281 @@
+# sysinfo.py
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+SECTOR_SIZE = 512
+
+# Block devices that aren't disks
+VIRTUAL_DISKS = ("loop", "ram", "zram", "dm-", "md", "sr")
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """One published sample of system metrics.
+
+    Percentages are 0-100, rates are per second over the last interval
+    (zero in the first snapshot). temp is None without thermal zones.
+    """
+
+    time: float
+    cpu: float
+    kernel: float
+    memory: float
+    swap: float
+    cache: float
+    buffers: float
+    load_avg: Tuple[float, float, float]
+    processes: int
+    threads: int
+    temp: Optional[float]
+    disk_read: float
+    disk_write: float
+    network_rx: float
+    network_tx: float
+
+
+class _Counters:
+    """Cumulative counters read in one pass, to be differenced"""
+
+    __slots__ = ("time", "cpu_total", "cpu_idle", "cpu_kernel",
+                 "disk_read", "disk_write", "network_rx", "network_tx")
+
+    def __init__(self):
+        self.time = time.monotonic()
+        self.cpu_total = self.cpu_idle = self.cpu_kernel = 0
+        self.disk_read = self.disk_write = 0
+        self.network_rx = self.network_tx = 0
+
+
+class SystemSampler:
+    """Samples /proc on a background thread and publishes SystemSnapshots.
+
+    Every interval the thread reads /proc/stat, /proc/meminfo,
+    /proc/loadavg, /proc/diskstats, /proc/net/dev and the thermal zones,
+    turns the counters into percentages and rates against the previous
+    sample, and replaces ``snapshot`` with a new frozen SystemSnapshot.
+    Readers just take the attribute: swapping the reference is atomic, so
+    no lock is needed and reading never waits on the sampler.
+
+    Widgets share one sampler through get_system_sampler(), calling
+    acquire() when shown and release() with the token it returned when
+    hidden or unmounted; the thread runs while anyone holds it, at the
+    shortest interval any current holder asked for. ``snapshot``
+    is None until the thread's first sample is in; ``failures`` counts
+    the samples in a row that couldn't be read, and ``error`` is the last
+    reason.
+    """
+
+    def __init__(self, interval: float = 1.0, proc: str = "/proc", sys: str = "/sys"):
+        self.interval = self.default_interval = interval
+        self.proc = proc
+        self.sys = sys
+        self.snapshot: Optional[SystemSnapshot] = None
+        self.failures = 0
+        self.error: Optional[Exception] = None
+        # Holder tokens and the interval each asked for, if any
+        self._holders: Dict[object, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self._stop: Optional[threading.Event] = None
+        self._previous: Optional[_Counters] = None
+        self._disks: Optional[Set[str]] = None
+        self._thermal: Optional[List[str]] = None
+
+    @classmethod
+    def available(cls, proc: str = "/proc") -> bool:
+        """Whether this system has a readable /proc to sample"""
+        return os.access(os.path.join(proc, "stat"), os.R_OK)
+
+    def acquire(self, interval: Optional[float] = None) -> object:
+        """Register a holder, starting the thread for the first one.
+
+        Returns the token to pass to release().
+        """
+        token = object()
+        with self._lock:
+            self._holders[token] = interval if interval is not None and interval > 0 else None
+            self._update_interval()
+            if self._stop is None:
+                self._stop = threading.Event()
+                threading.Thread(target=self._run, args=(self._stop,), name="SystemSampler", daemon=True).start()
+        return token
+
+    def release(self, token: object):
+        """Unregister a holder, stopping the thread after the last one"""
+        with self._lock:
+            if self._holders.pop(token, False) is False:
+                return
+            self._update_interval()
+            if not self._holders and self._stop is not None:
+                # Not joined: the thread notices at its next wake-up
+                self._stop.set()
+                self._stop = None
+
+    def _update_interval(self):
+        intervals = [interval for interval in self._holders.values() if interval is not None]
+        self.interval = min(intervals) if intervals else self.default_interval
+
+    def _run(self, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                self.sample()
+            except (OSError, ValueError, IndexError) as e:
+                # Keep the last snapshot; /proc may be readable next time
+                self.error = e
+                self.failures += 1
+            else:
+                self.error = None
+                self.failures = 0
+            stop.wait(self.interval)
+
+    def sample(self) -> SystemSnapshot:
+        """Read everything once and publish a new snapshot"""
+        counters = _Counters()
+        processes = self._read_stat(counters)
+        memory = self._read_meminfo()
+        load_avg, threads = self._read_loadavg()
+        self._read_diskstats(counters)
+        self._read_net_dev(counters)
+
+        previous = self._previous or counters
+        elapsed = counters.time - previous.time
+
+        def rate(name: str) -> float:
+            if elapsed <= 0:
+                return 0.0
+            return max(0, getattr(counters, name) - getattr(previous, name)) / elapsed
+
+        if previous is counters:
+            # No previous sample; use the averages since boot
+            total, idle, kernel = counters.cpu_total, counters.cpu_idle, counters.cpu_kernel
+        else:
+            total = counters.cpu_total - previous.cpu_total
+            idle = counters.cpu_idle - previous.cpu_idle
+            kernel = counters.cpu_kernel - previous.cpu_kernel
+        self._previous = counters
+
+        mem_total = memory.get("MemTotal", 0) or 1
+        swap_total = memory.get("SwapTotal", 0)
+        available = memory.get("MemAvailable", memory.get("MemFree", 0))
+        snapshot = SystemSnapshot(
+            time=time.time(),
+            cpu=100.0 * (total - idle) / total if total > 0 else 0.0,
+            kernel=100.0 * kernel / total if total > 0 else 0.0,
+            memory=100.0 * (mem_total - available) / mem_total,
+            swap=100.0 * (swap_total - memory.get("SwapFree", 0)) / swap_total if swap_total else 0.0,
+            cache=100.0 * memory.get("Cached", 0) / mem_total,
+            buffers=100.0 * memory.get("Buffers", 0) / mem_total,
+            load_avg=load_avg,
+            processes=processes,
+            threads=threads,
+            temp=self._read_thermal(),
+            disk_read=rate("disk_read"),
+            disk_write=rate("disk_write"),
+            network_rx=rate("network_rx"),
+            network_tx=rate("network_tx"),
+        )
+        self.snapshot = snapshot
+        return snapshot
+
+    def _read_stat(self, counters: _Counters) -> int:
+        """CPU time counters; returns the number of processes"""
+        processes = 0
+        with open(os.path.join(self.proc, "stat")) as f:
+            for line in f:
+                if line.startswith("cpu "):
+                    # user nice system idle iowait irq softirq steal
+                    values = [int(value) for value in line.split()[1:9]]
+                    counters.cpu_total = sum(values)
+                    counters.cpu_idle = values[3] + values[4]
+                    counters.cpu_kernel = values[2] + values[5] + values[6]
+                    break
+        for name in os.listdir(self.proc):
+            if name.isdigit():
+                processes += 1
+        return processes
+
+    def _read_meminfo(self) -> Dict[str, int]:
+        memory = {}
+        with open(os.path.join(self.proc, "meminfo")) as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                fields = value.split()
+                if fields:
+                    memory[key] = int(fields[0])
+        return memory
+
+    def _read_loadavg(self) -> Tuple[Tuple[float, float, float], int]:
+        """Load averages and the number of threads"""
+        with open(os.path.join(self.proc, "loadavg")) as f:
+            fields = f.read().split()
+        threads = int(fields[3].partition("/")[2]) if len(fields) > 3 else 0
+        return (float(fields[0]), float(fields[1]), float(fields[2])), threads
+
+    def _read_diskstats(self, counters: _Counters):
+        """Bytes read and written by whole physical disks"""
+        if self._disks is None:
+            block = os.path.join(self.sys, "block")
+            try:
+                names = os.listdir(block)
+            except OSError:
+                names = []
+            self._disks = {name for name in names if not name.startswith(VIRTUAL_DISKS)}
+        try:
+            f = open(os.path.join(self.proc, "diskstats"))
+        except OSError:
+            return
+        with f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 10 or fields[2] not in self._disks:
+                    continue
+                counters.disk_read += int(fields[5]) * SECTOR_SIZE
+                counters.disk_write += int(fields[9]) * SECTOR_SIZE
+
+    def _read_net_dev(self, counters: _Counters):
+        """Bytes received and sent on all interfaces but loopback"""
+        try:
+            f = open(os.path.join(self.proc, "net", "dev"))
+        except OSError:
+            return
+        with f:
+            for line in f:
+                name, colon, values = line.partition(":")
+                fields = values.split()
+                if not colon or name.strip() == "lo" or len(fields) < 9:
+                    continue
+                counters.network_rx += int(fields[0])
+                counters.network_tx += int(fields[8])
+
+    def _read_thermal(self) -> Optional[float]:
+        """Hottest thermal zone in degrees C"""
+        if self._thermal is None:
+            thermal = os.path.join(self.sys, "class", "thermal")
+            try:
+                zones = sorted(name for name in os.listdir(thermal) if name.startswith("thermal_zone"))
+            except OSError:
+                zones = []
+            self._thermal = [os.path.join(thermal, zone, "temp") for zone in zones]
+        hottest = None
+        for path in self._thermal:
+            try:
+                with open(path) as f:
+                    value = int(f.read()) / 1000
+            except (OSError, ValueError):
+                continue
+            if hottest is None or value > hottest:
+                hottest = value
+        return hottest
+
+
+_shared: Optional[SystemSampler] = None
+
+
+def get_system_sampler() -> SystemSampler:
+    """Return the process-wide system sampler"""
+    global _shared
+    if _shared is None:
+        _shared = SystemSampler()
+    return _shared
@@ -0,0 +1,180 @@
+# tail.py
+import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Sequence
+
+
+class _Source:
+    """One followed file: open handle, identity and unfinished last line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+        self.identity = None
+        self.partial = b""
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.identity = None
+        self.partial = b""
+
+
+class FileTailer:
+    """Follows files like ``tail -F`` on a background thread.
+
+    Every poll_interval the thread reads whatever was appended to each file
+    in chunk_size reads and queues the complete lines, so lines from several
+    files come out merged in the order they were read. Files that don't
+    exist yet are waited for; a file replaced at its path (rotation) is read
+    to the end and then reopened from the start, and a truncated file is
+    read again from the start.
+
+    At most max_pending lines are queued. When the reader outpaces drain(),
+    the oldest lines are dropped and counted, and drain() reports how many
+    were lost with a marker line. Runs of identical lines are coalesced
+    into one line with a repeat count. A line longer than chunk_size (or
+    data without newlines) is passed on in pieces as soon as it outgrows
+    chunk_size, so an unterminated line never takes more memory than that.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        poll_interval: float = 0.25,
+        chunk_size: int = 64 * 1024,
+        max_pending: int = 1000,
+        backlog: int = 0,
+    ):
+        self.sources = [_Source(os.path.expanduser(path)) for path in paths]
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self.backlog = backlog
+        self.dropped = 0
+        self._pending: Deque[str] = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="FileTailer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for source in self.sources:
+            source.close()
+
+    def drain(self) -> List[str]:
+        """Take every queued line, with drops and repeats summarised"""
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            dropped, self.dropped = self.dropped, 0
+
+        result = [f"... {dropped} lines dropped ..."] if dropped else []
+        previous = None
+        repeats = 0
+        for line in lines:
+            if line == previous:
+                repeats += 1
+                continue
+            if repeats:
+                result[-1] = f"{previous} (repeated {repeats + 1} times)"
+            result.append(line)
+            previous = line
+            repeats = 0
+        if repeats:
+            result[-1] = f"{previous} (repeated {repeats + 1} times)"
+        return result
+
+    def _run(self):
+        first = True
+        while not self._stop.is_set():
+            for source in self.sources:
+                try:
+                    self._poll(source, first)
+                except OSError:
+                    # Unreadable for now; try again from scratch next poll
+                    source.close()
+            first = False
+            self._stop.wait(self.poll_interval)
+
+    def _poll(self, source: _Source, first: bool):
+        if source.file is None:
+            if not os.path.exists(source.path):
+                return
+            self._open(source, at_end=first)
+
+        stat = os.fstat(source.file.fileno())
+        if stat.st_size < source.file.tell():
+            # Truncated in place
+            source.file.seek(0)
+            source.partial = b""
+        self._read(source)
+
+        # Rotated: the path now names a different file. The old one has been
+        # read to its end above; continue with the new one from the start.
+        try:
+            current = os.stat(source.path)
+        except FileNotFoundError:
+            return
+        if (current.st_dev, current.st_ino) != source.identity:
+            self._flush_partial(source)
+            source.close()
+            self._open(source, at_end=False)
+            self._read(source)
+
+    def _open(self, source: _Source, at_end: bool):
+        """Open a source; files present at startup start at their end"""
+        source.file = open(source.path, "rb")
+        stat = os.fstat(source.file.fileno())
+        source.identity = (stat.st_dev, stat.st_ino)
+        if at_end:
+            if self.backlog > 0:
+                # Show the last few lines that are already there, and carry
+                # on from where that read stopped
+                start = max(0, stat.st_size - self.chunk_size)
+                source.file.seek(start)
+                lines = source.file.read(stat.st_size - start).split(b"\n")
+                # The unterminated end is finished by later reads
+                source.partial = lines.pop()
+                # The line cut by the seek point is incomplete
+                if start:
+                    lines = lines[1:]
+                self._queue(lines[-self.backlog:])
+            else:
+                source.file.seek(0, os.SEEK_END)
+
+    def _read(self, source: _Source):
+        """Queue the complete lines appended since the last read"""
+        while not self._stop.is_set():
+            chunk = source.file.read(self.chunk_size)
+            if not chunk:
+                return
+            lines = (source.partial + chunk).split(b"\n")
+            source.partial = lines.pop()
+            if len(source.partial) > self.chunk_size:
+                lines.append(source.partial)
+                source.partial = b""
+            self._queue(lines)
+
+    def _flush_partial(self, source: _Source):
+        if source.partial:
+            self._queue([source.partial])
+            source.partial = b""
+
+    def _queue(self, lines: List[bytes]):
+        decoded = [line.rstrip(b"\r").decode("utf-8", "replace") for line in lines]
+        with self._lock:
+            overflow = len(self._pending) + len(decoded) - self._pending.maxlen
+            if overflow > 0:
+                self.dropped += overflow
+            self._pending.extend(decoded)
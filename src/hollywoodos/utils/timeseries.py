@@ -0,0 +1,150 @@
+# timeseries.py
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+# Sparkline levels, lowest to highest
+SPARK_CHARS = " ▁▂▃▄▅▆▇█"
+
+# Braille dot bits for a column filled n dots up from the bottom
+BRAILLE_LEFT = (0x00, 0x40, 0x44, 0x46, 0x47)
+BRAILLE_RIGHT = (0x00, 0x80, 0xA0, 0xB0, 0xB8)
+BRAILLE_BASE = 0x2800
+
+
+class RingBuffer:
+    """Fixed-size float ring buffer whose latest values are always contiguous.
+
+    Every value is written twice, at its slot and capacity slots further
+    on, so the newest n values are one slice of the backing array and can
+    be read as a memoryview without copying or reordering. Appending is
+    O(1) and the memory used never changes.
+    """
+
+    __slots__ = ("capacity", "data", "head", "count", "version")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = array("f", bytes(2 * capacity * array("f").itemsize))
+        self.head = 0
+        self.count = 0
+        # Bumped on every append, so readers can tell when to redraw
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: float):
+        head = self.head
+        self.data[head] = self.data[head + self.capacity] = value
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+        self.version += 1
+
+    def last(self, n: int) -> memoryview:
+        """The newest n values (fewer if not that many yet), oldest first"""
+        n = max(0, min(n, self.count))
+        end = self.head + self.capacity
+        return memoryview(self.data)[end - n:end]
+
+
+class _Tier:
+    """A ring of per-bucket means and the bucket being accumulated"""
+
+    __slots__ = ("resolution", "ring", "bucket", "total", "count")
+
+    def __init__(self, resolution: float, capacity: int):
+        self.resolution = resolution
+        self.ring = RingBuffer(capacity)
+        self.bucket: Optional[int] = None
+        self.total = 0.0
+        self.count = 0
+
+
+class TieredHistory:
+    """A metric's history at several time resolutions.
+
+    Each tier holds the means of consecutive resolution-second buckets in
+    its own RingBuffer of capacity points: by default one point per
+    second, per 10 seconds and per minute. Tiers are updated as samples
+    arrive, O(number of tiers) per sample, so no tier is ever recomputed
+    from another; a bucket's mean is appended once a sample from a later
+    bucket arrives.
+    """
+
+    RESOLUTIONS = (1.0, 10.0, 60.0)
+    CAPACITY = 512
+
+    def __init__(self, capacity: int = CAPACITY, resolutions: Sequence[float] = RESOLUTIONS):
+        self.tiers: Dict[float, _Tier] = {
+            float(resolution): _Tier(float(resolution), capacity) for resolution in resolutions
+        }
+
+    def append(self, value: float, now: float):
+        """Add a sample taken at time now (seconds)"""
+        for tier in self.tiers.values():
+            bucket = int(now // tier.resolution)
+            if bucket != tier.bucket:
+                if tier.count:
+                    tier.ring.append(tier.total / tier.count)
+                tier.bucket = bucket
+                tier.total = 0.0
+                tier.count = 0
+            tier.total += value
+            tier.count += 1
+
+    def ring(self, resolution: float) -> RingBuffer:
+        """The tier closest to resolution seconds per point"""
+        tier = self.tiers.get(float(resolution))
+        if tier is None:
+            tier = min(self.tiers.values(), key=lambda tier: abs(tier.resolution - resolution))
+        return tier.ring
+
+
+def sparkline(values: Sequence[float], width: int, high: Optional[float] = None) -> str:
+    """One row of block characters for the newest width values.
+
+    Values are scaled from 0 to high (their maximum if not given); fewer
+    values than width are right-aligned.
+    """
+    if width <= 0:
+        return ""
+    if high is None:
+        high = max(values, default=0.0)
+    top = len(SPARK_CHARS) - 1
+    scale = top / high if high > 0 else 0.0
+    chars = SPARK_CHARS
+    line = "".join([chars[min(top, max(0, int(value * scale + 0.5)))] for value in values[-width:]])
+    return line.rjust(width)
+
+
+def braille(values: Sequence[float], width: int, height: int, high: Optional[float] = None) -> List[str]:
+    """Rows of braille characters plotting the newest 2 * width values.
+
+    Each character cell shows two samples side by side at four levels
+    each, so a graph has twice the horizontal and four times the vertical
+    resolution of a sparkline. Rows are returned top first.
+    """
+    if width <= 0 or height <= 0:
+        return []
+    values = values[-2 * width:]
+    if high is None:
+        high = max(values, default=0.0)
+    dots = 4 * height
+    scale = dots / high if high > 0 else 0.0
+    levels = [min(dots, max(0, int(value * scale + 0.5))) for value in values]
+    if len(levels) % 2:
+        levels.insert(0, 0)
+    pad = width - len(levels) // 2
+
+    rows = []
+    for row in range(height):
+        base = (height - 1 - row) * 4
+        cells = [
+            chr(BRAILLE_BASE
+                | BRAILLE_LEFT[min(4, max(0, left - base))]
+                | BRAILLE_RIGHT[min(4, max(0, right - base))])
+            for left, right in zip(levels[0::2], levels[1::2])
+        ]
+        rows.append(" " * pad + "".join(cells))
+    return rows
@@ -0,0 +1,89 @@
+# tests/test_config.py
+import json
+
+import pytest
+
+from hollywoodos.core.config_manager import ConfigManager
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def write_config(directory, text):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "config.yaml"
+    path.write_text(text)
+    return path
+
+
+def test_plugin_paths_are_relative_to_config_file(tmp_path, monkeypatch):
+    path = write_config(tmp_path / "conf", """
+windows:
+- id: data
+  plugins:
+  - type: HexScroll
+    config:
+      source: ../data/dump.bin
+  - type: LogScroll
+    config:
+      sources: [app.log, /var/log/syslog]
+      replay: ~/recorded.log
+""")
+    monkeypatch.chdir(tmp_path)
+    manager = ConfigManager(str(path))
+    hex_plugin, log_plugin = manager.windows[0].plugins
+    hex_config = manager.get_plugin_config(hex_plugin.type, hex_plugin.config)
+    log_config = manager.get_plugin_config(log_plugin.type, log_plugin.config)
+
+    assert hex_config["source"] == str(tmp_path / "data" / "dump.bin")
+    assert log_config["sources"] == [str(tmp_path / "conf" / "app.log"), "/var/log/syslog"]
+    assert not log_config["replay"].startswith("~")
+    assert "retention_path" not in log_config
+
+
+def test_cached_config_is_the_same(tmp_path):
+    path = write_config(tmp_path, """
+windows:
+- id: data
+  plugins:
+  - type: HexScroll
+    config:
+      source: dump.bin
+""")
+    first = ConfigManager(str(path))
+    second = ConfigManager(str(path))
+    plugin = second.windows[0].plugins[0]
+    assert second.get_plugin_config(plugin.type, plugin.config)["source"] == str(tmp_path / "dump.bin")
+    assert [w.id for w in first.windows] == [w.id for w in second.windows]
+
+
+def test_snapshot_is_json_and_skipped_when_json_changes_the_config(tmp_path):
+    path = write_config(tmp_path, """
+windows:
+- id: data
+  plugins:
+  - type: LogScroll
+    config:
+      sources: [app.log]
+""")
+    ConfigManager(str(path))
+    snapshots = list((tmp_path / "cache").rglob("config-*"))
+    assert [snapshot.suffix for snapshot in snapshots] == [".json"]
+    assert json.loads(snapshots[0].read_text())["config"]["windows"][0]["id"] == "data"
+
+    # Integer keys would come back from JSON as strings
+    write_config(tmp_path, """
+windows:
+- id: data
+  plugins:
+  - type: HexScroll
+    config:
+      colors: {1: red}
+""")
+    manager = ConfigManager(str(path))
+    assert manager.windows[0].plugins[0].config["colors"] == {1: "red"}
+    assert len(list((tmp_path / "cache").rglob("config-*"))) == 1
+    again = ConfigManager(str(path))
+    assert again.windows[0].plugins[0].config["colors"] == {1: "red"}
@@ -0,0 +1,126 @@
+# tests/test_effects.py
+import pytest
+from rich.cells import cell_len
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from hollywoodos.plugins.effects import (
+    CellBuffer,
+    Effect,
+    EffectCache,
+    EffectPipeline,
+    GlitchEffect,
+    MatrixFadeEffect,
+    PulseEffect,
+    WaveEffect,
+    content_key,
+)
+
+RED = Style(color="red")
+
+
+def strips_of(*rows):
+    return [Strip([Segment(text, RED)]) for text in rows]
+
+
+def split_rows(*rows):
+    """Strips with one segment per character"""
+    return [Strip([Segment(char, RED) for char in text]) for text in rows]
+
+
+def test_content_key_keeps_row_boundaries():
+    # The same segments in the same order, split into rows differently
+    assert content_key(split_rows("ab", "c")) != content_key(split_rows("a", "bc"))
+    assert content_key(split_rows("ab", "c")) == content_key(split_rows("ab", "c"))
+
+
+def test_cache_returns_result_for_same_content_only():
+    cache = EffectCache()
+    pipeline = EffectPipeline([MatrixFadeEffect()], cache)
+    first = pipeline.apply(strips_of("abcdef", "ghijkl"), frame=3)
+    again = pipeline.apply(strips_of("abcdef", "ghijkl"), frame=3)
+    assert [strip.text for strip in again] == [strip.text for strip in first]
+    assert cache.hits == 1
+
+    first = pipeline.apply(split_rows("abcdefg", "hijkl"), frame=3)
+    other = pipeline.apply(split_rows("abcdef", "ghijkl"), frame=3)
+    assert cache.hits == 1
+    assert [strip.cell_length for strip in first] == [7, 5]
+    assert [strip.cell_length for strip in other] == [6, 6]
+
+
+def test_cache_is_bounded():
+    cache = EffectCache(maxsize=2)
+    for key in range(5):
+        cache.put(key, ())
+    assert cache.stats()["size"] == 2
+    assert cache.get(0) is None
+    assert cache.get(4) == ()
+
+
+def test_inactive_pipeline_passes_strips_through():
+    strips = strips_of("abc")
+    pipeline = EffectPipeline([PulseEffect(speed=0.0)])
+    # At phase 0 the pulse is at normal brightness
+    assert pipeline.apply(strips, frame=0)[0] is strips[0]
+
+
+def test_wide_glyphs_take_two_cells():
+    buffer = CellBuffer(strips_of("日本ab"))
+    assert len(buffer.glyphs[0]) == 6
+    assert buffer.runs(0) == [(6, RED)]
+    assert buffer.to_text() == "日本ab"
+
+
+def test_effects_keep_cell_width_with_wide_glyphs():
+    rows = ["日本語のログ ok", "plain ascii row", "emoji 🚀 here"]
+    widths = [cell_len(row) for row in rows]
+    for effect in [WaveEffect(amplitude=3), MatrixFadeEffect(), GlitchEffect(intensity=1.0, seed=1)]:
+        for frame in range(0, 40, 7):
+            buffer = CellBuffer(strips_of(*rows))
+            effect.apply(buffer, frame)
+            assert [strip.cell_length for strip in buffer.to_strips()] == widths
+
+
+def test_split_wide_glyph_becomes_blank():
+    buffer = CellBuffer(strips_of("a日b"))
+    buffer.shift(0, 2)
+    # The shift cuts 日 in half at the end of the row
+    assert [strip.text for strip in buffer.to_strips()] == ["  a "]
+
+
+def test_effect_without_apply_cannot_be_created():
+    class Unfinished(Effect):
+        pass
+
+    with pytest.raises(TypeError):
+        Unfinished()
+
+
+def test_random_effects_are_not_cached():
+    cache = EffectCache()
+    pipeline = EffectPipeline([GlitchEffect(intensity=1.0, seed=1)], cache)
+    for _ in range(3):
+        pipeline.apply(strips_of("abcdef"), frame=0)
+    assert cache.hits == cache.misses == 0
+
+
+def test_callers_can_skip_the_cache():
+    cache = EffectCache()
+    pipeline = EffectPipeline([MatrixFadeEffect()], cache)
+    pipeline.apply(strips_of("abcdef"), frame=3, cache=False)
+    assert cache.stats()["size"] == 0
+
+
+def test_cached_results_are_reused_across_frames_with_the_same_state():
+    cache = EffectCache()
+    pulse = PulseEffect(speed=0.05)
+    pipeline = EffectPipeline([pulse], cache)
+    frames = [frame for frame in range(200) if pulse.active(frame)]
+    for frame in frames:
+        result = pipeline.apply(strips_of("abcdef"), frame)
+        assert result == EffectPipeline([pulse]).apply(strips_of("abcdef"), frame)
+    # One miss per pulse level
+    assert cache.misses == 2
+    assert cache.hits == len(frames) - 2
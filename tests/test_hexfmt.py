@@ -0,0 +1,57 @@
+# tests/test_hexfmt.py
+import pytest
+
+from hollywoodos.utils.hexfmt import HexFormatter
+
+
+def per_byte_row(data, offset, bytes_per_row):
+    """Reference formatting, one byte at a time"""
+    hex_part = " ".join(f"{b:02X}" for b in data).ljust(bytes_per_row * 3 - 1)
+    ascii_part = "".join(chr(b) if 0x20 <= b < 0x7f else "." for b in data)
+    return f"{offset:08X}: {hex_part}  {ascii_part}"
+
+
+def test_matches_per_byte_formatting():
+    data = bytes(range(256)) * 2
+    rows = HexFormatter().format_rows(data, 16, offset=0x100)
+    assert len(rows) == 32
+    for i, row in enumerate(rows):
+        assert row == per_byte_row(data[i * 16:(i + 1) * 16], 0x100 + i * 16, 16)
+
+
+def test_short_last_row_is_padded():
+    formatter = HexFormatter()
+    rows = formatter.format_rows(b"abcdefghij", 8)
+    assert rows[1] == per_byte_row(b"ij", 8, 8).ljust(formatter.row_width(8))
+    assert len(rows[0]) == len(rows[1]) == formatter.row_width(8)
+
+
+def test_groups_and_endianness():
+    data = bytes([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08])
+    assert HexFormatter(group=4).hex(data) == "01020304 05060708"
+    assert HexFormatter(group=4, endian="little").hex(data) == "04030201 08070605"
+    assert HexFormatter(group=2, endian="little", uppercase=False).hex(b"\xab\xcd") == "cdab"
+
+
+def test_fit_fills_width_in_whole_groups():
+    for group in (1, 2, 4, 8):
+        formatter = HexFormatter(group=group)
+        for width in (40, 80, 200):
+            fitted = formatter.fit(width)
+            assert fitted % group == 0
+            assert formatter.row_width(fitted) <= width or fitted == group
+            assert formatter.row_width(fitted + group) > width
+    assert HexFormatter().fit(200, limit=16) == 16
+
+
+def test_without_offset_and_gutter():
+    formatter = HexFormatter(offset_width=0, gutter=False)
+    assert formatter.format_rows(b"\x00\xff", 2) == ["00 FF"]
+    assert formatter.format_row(b"") == ""
+
+
+def test_rejects_bad_options():
+    with pytest.raises(ValueError):
+        HexFormatter(group=3)
+    with pytest.raises(ValueError):
+        HexFormatter(endian="middle")
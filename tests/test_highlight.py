@@ -0,0 +1,84 @@
+# tests/test_highlight.py
+from rich.style import Style
+
+from hollywoodos.utils.highlight import Highlighter
+
+
+def styled(highlighter, text):
+    return [(segment.text, segment.style) for segment in highlighter.segments(text)]
+
+
+def test_builtin_rules():
+    highlighter = Highlighter()
+    segments = dict(styled(highlighter, "[2024-05-01 12:00:00] ERROR: refused 10.0.0.1:80 for /etc/config"))
+    assert segments["[2024-05-01 12:00:00]"] == Style.parse("dim")
+    assert segments["ERROR"] == Style.parse("bold red")
+    assert segments["10.0.0.1:80"] == Style.parse("cyan")
+    assert segments["/etc/config"] == Style.parse("blue")
+
+
+def test_segments_cover_the_whole_text():
+    highlighter = Highlighter()
+    text = "INFO: user admin logged in from 192.168.1.20"
+    assert "".join(part for part, _ in styled(highlighter, text)) == text
+
+
+def test_user_rules_come_first_and_builtins_can_be_disabled():
+    highlighter = Highlighter({
+        "levels": False,
+        "rules": [{"pattern": "timeout|refused", "style": "bold magenta"}],
+    })
+    segments = dict(styled(highlighter, "ERROR: connection refused"))
+    assert segments["refused"] == Style.parse("bold magenta")
+    assert "ERROR" not in segments
+
+
+def test_base_style_is_combined():
+    highlighter = Highlighter()
+    base = Style(bgcolor="black")
+    highlighter.set_base_style(base)
+    segments = dict(styled(highlighter, "x WARNING y"))
+    assert segments["WARNING"] == base + Style.parse("bold yellow")
+    assert segments["x "] == base
+
+
+def test_invalid_rules_are_reported_and_skipped():
+    highlighter = Highlighter({"rules": [
+        {"pattern": "(unclosed", "style": "red"},
+        {"pattern": "ok", "style": "not a style at all"},
+    ]})
+    assert len(highlighter.errors) == 2
+    assert "".join(part for part, _ in styled(highlighter, "ok (unclosed")) == "ok (unclosed"
+
+
+def test_no_rules_is_one_plain_segment():
+    off = {"levels": False, "ips": False, "paths": False, "timestamps": False}
+    assert styled(Highlighter(off), "ERROR /etc") == [("ERROR /etc", Style())]
+
+
+def test_leading_flags_apply_to_their_rule_only():
+    highlighter = Highlighter({"rules": [
+        {"pattern": "(?i)timeout", "style": "magenta"},
+        {"pattern": "ok", "style": "green"},
+    ]})
+    assert not highlighter.errors
+    segments = dict(styled(highlighter, "TimeOut OK ok"))
+    assert segments["TimeOut"] == Style.parse("magenta")
+    assert segments["ok"] == Style.parse("green")
+    assert segments[" OK "] == Style()
+
+
+def test_bad_rule_is_dropped_alone():
+    highlighter = Highlighter({"rules": [
+        {"pattern": r"(\w)\1", "style": "red"},
+        {"pattern": r"(?P<word>a)(?P=word)", "style": "red"},
+        {"pattern": r"(?P<x>one)", "style": "red"},
+        {"pattern": r"(?P<x>two)", "style": "red"},
+        {"pattern": r"\\1", "style": "yellow"},
+    ]})
+    assert len(highlighter.errors) == 3
+    segments = dict(styled(highlighter, r"one two \1 ERROR"))
+    assert segments["one"] == Style.parse("red")
+    assert segments["\\1"] == Style.parse("yellow")
+    assert segments["ERROR"] == Style.parse("bold red")
+    assert "two" not in segments
@@ -0,0 +1,86 @@
+# tests/test_history.py
+from hollywoodos.utils.history import LogHistory, term_matcher
+
+
+def make_history(count, **kwargs):
+    history = LogHistory(**kwargs)
+    history.extend(f"[2024-05-01 12:00:{i % 60:02d}] INFO request {i} from 10.0.0.{i % 256}" for i in range(count))
+    return history
+
+
+def test_search_returns_newest_first():
+    history = make_history(1000, segment_lines=128)
+    results = history.search("10.0.0.7")
+    assert [number for number, _ in results] == sorted((i for i in range(1000) if i % 256 == 7), reverse=True)
+    assert all("10.0.0.7" in line for _, line in results)
+
+
+def test_search_limit_and_paging():
+    history = make_history(1000, segment_lines=128)
+    first = history.search("INFO", limit=10)
+    assert [number for number, _ in first] == list(range(999, 989, -1))
+    second = history.search("INFO", limit=10, before=first[-1][0])
+    assert [number for number, _ in second] == list(range(989, 979, -1))
+
+
+def test_missing_term_finds_nothing():
+    history = make_history(1000, segment_lines=128, buckets=4)
+    # With four buckets every term collides with the timestamp fields
+    assert history.search("zz894") == []
+    assert history.search("request 5000") == []
+
+
+def test_whole_words_only():
+    history = LogHistory()
+    history.extend(["ERROR: failed to connect to db", "connected"])
+    assert history.search("rror") == []
+    assert history.search("error") == [(0, "ERROR: failed to connect to db")]
+    assert history.search("connect to") == [(0, "ERROR: failed to connect to db")]
+    assert history.search("to connect") == [(0, "ERROR: failed to connect to db")]
+    assert history.search("connect db") == []
+
+
+def test_matcher_agrees_with_search():
+    lines = ["ERROR: failed to connect to db", "connected", "WARNING: disk /dev/sda1 low"]
+    history = LogHistory()
+    history.extend(lines)
+    for term in ["rror", "error", "connect", "sda1", "/dev/sda1", "disk /dev", "low"]:
+        matches = term_matcher(term)
+        expected = [(i, line) for i, line in enumerate(lines) if matches(line)]
+        assert history.search(term) == expected[::-1]
+
+
+def test_oldest_segments_are_dropped():
+    history = make_history(1000, max_lines=300, segment_lines=100)
+    assert len(history) <= 300
+    assert history.first_index == 700
+    assert history.next_index == 1000
+    assert history.line(999).startswith("[2024-05-01 12:00:39] INFO request 999 ")
+    assert all(number >= 700 for number, _ in history.search("INFO", limit=1000))
+
+
+def test_spilled_segments_are_searchable_and_removed(tmp_path):
+    history = make_history(500, path=str(tmp_path), segment_lines=100)
+    # Searchable while the segments are still being written
+    assert [number for number, _ in history.search("request 42")] == [42]
+    history.flush()
+    assert len(list(history.path.iterdir())) == 4
+    assert history.line(42).startswith("[2024-05-01 12:00:42] INFO request 42 ")
+    assert [number for number, _ in history.search("request 42")] == [42]
+    history.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_histories_sharing_a_path_keep_their_own_files(tmp_path):
+    first = make_history(300, path=str(tmp_path), segment_lines=100)
+    second = LogHistory(path=str(tmp_path), segment_lines=100)
+    second.extend(f"other {i}" for i in range(300))
+    first.flush()
+    second.flush()
+    assert first.path != second.path
+    assert first.line(150).startswith("[2024-05-01 12:00:30] INFO request 150 ")
+    assert second.line(150) == "other 150"
+    first.close()
+    assert second.line(150) == "other 150"
+    second.close()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,41 @@
+# tests/test_integration.py
+import asyncio
+
+import pytest
+
+from hollywoodos.app import HollywoodOS
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def layout(windows):
+    text = "layout:\n  type: 2x2\nwindows:\n"
+    for window_id, plugin in windows:
+        text += f"- id: {window_id}\n  plugins:\n  - type: {plugin}\n"
+    return text
+
+
+def test_reload_can_move_window_ids_between_tiles(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(layout([("a", "MatrixRain"), ("b", "HexScroll"), ("c", "MatrixRain"), ("d", "MatrixRain")]))
+
+    async def run():
+        app = HollywoodOS(str(path))
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.pause()
+            # a and b swap places, d changes plugin, c stays as it is
+            unchanged = app.window_manager.tiles[2]
+            path.write_text(layout([("b", "HexScroll"), ("a", "MatrixRain"), ("c", "MatrixRain"), ("d", "SystemMonitor")]))
+            app.action_reload_config()
+            await pilot.pause(0.2)
+            tiles = app.window_manager.tiles
+            rows = [[tile.id for tile in row.children] for row in app.window_manager.children]
+            return [tile.id for tile in tiles], rows, tiles[2] is unchanged
+
+    ids, rows, kept = asyncio.run(run())
+    assert ids == ["b", "a", "c", "d"]
+    assert rows == [["b", "a"], ["c", "d"]]
+    assert kept
@@ -0,0 +1,29 @@
+# tests/test_matrix_rain.py
+from hollywoodos.plugins.builtin.matrix_rain import RainField, RainRenderer
+from hollywoodos.utils.entropy import EntropyPool
+
+
+def test_field_without_width_waits_for_a_size():
+    field = RainField(0, 20, 0.1, EntropyPool(seed=0))
+    assert len(field.xs) == 0
+    for _ in range(50):
+        field.step()
+    renderer = RainRenderer()
+    renderer.update(field)
+    assert all(strip.cell_length == 0 for strip in renderer.strips)
+
+    field.resize(30, 20)
+    assert len(field.xs) == 3
+    for _ in range(50):
+        field.step()
+    assert all(0 <= x < 30 for x in field.xs)
+
+
+def test_rows_are_redrawn_only_when_they_change():
+    field = RainField(40, 10, 0.2, EntropyPool(seed=1))
+    renderer = RainRenderer()
+    assert renderer.update(field) == list(range(10))
+    assert renderer.update(field) == []
+    field.step()
+    dirty = renderer.update(field)
+    assert all(renderer.strips[y].cell_length == 40 for y in dirty)
@@ -0,0 +1,106 @@
+# tests/test_plugins.py
+import json
+import sys
+import textwrap
+
+import pytest
+
+from hollywoodos.plugins.registry import MANIFEST_CACHE, PluginRegistry
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    return directory
+
+
+def write_plugin(directory, name, source):
+    (directory / name).write_text(textwrap.dedent(source))
+
+
+def test_builtins_are_listed_without_importing():
+    registry = PluginRegistry(plugin_dir="/nonexistent")
+    assert {"HexScroll", "LogScroll", "SystemMonitor"} <= set(registry.list_plugins())
+
+
+def test_finds_subclasses_of_base_builtins_and_aliases(plugin_dir):
+    write_plugin(plugin_dir, "mine.py", """
+        from hollywoodos.plugins.base import BlinkenPlugin as Base
+        from hollywoodos.plugins.builtin.hex_scroll import HexScroll
+        from hollywoodos.plugins.builtin import log_scroll
+
+        class Plain(Base):
+            pass
+
+        class MyHex(HexScroll):
+            pass
+
+        class MyLog(log_scroll.LogScroll):
+            pass
+
+        class Deeper(MyHex):
+            pass
+
+        class NotAPlugin:
+            pass
+    """)
+    registry = PluginRegistry(plugin_dir=str(plugin_dir))
+    names = registry.list_plugins()
+    assert {"Plain", "MyHex", "MyLog", "Deeper"} <= set(names)
+    assert "NotAPlugin" not in names
+    # Found by the scan alone
+    assert registry._file_modules == {}
+
+
+def test_imports_file_when_scan_is_unsure(plugin_dir, monkeypatch):
+    helpers = plugin_dir.parent / "helpers"
+    helpers.mkdir()
+    (helpers / "shared_bases.py").write_text(
+        "from hollywoodos.plugins.builtin.matrix_rain import MatrixRain as Rain\n"
+        "SharedBase = Rain\n"
+    )
+    monkeypatch.syspath_prepend(str(helpers))
+    write_plugin(plugin_dir, "fancy.py", """
+        from shared_bases import SharedBase
+
+        class Fancy(SharedBase):
+            pass
+    """)
+    registry = PluginRegistry(plugin_dir=str(plugin_dir))
+    assert "Fancy" in registry.list_plugins()
+    assert registry.get_plugin("Fancy").__name__ == "Fancy"
+    sys.modules.pop("shared_bases", None)
+
+
+def test_bad_cache_entries_are_misses(plugin_dir, tmp_path):
+    write_plugin(plugin_dir, "mine.py", """
+        from hollywoodos.plugins.base import BlinkenPlugin
+
+        class Mine(BlinkenPlugin):
+            pass
+    """)
+    cache = tmp_path / "cache" / "hollywoodos" / MANIFEST_CACHE
+    cache.parent.mkdir(parents=True)
+    key = str((plugin_dir / "mine.py").resolve())
+    for entry in [{"classes": ["Stale"]}, ["not", "a", "dict"], {"mtime_ns": 1, "size": "x"}]:
+        cache.write_text(json.dumps({key: entry}))
+        registry = PluginRegistry(plugin_dir=str(plugin_dir))
+        assert "Mine" in registry.list_plugins()
+        assert "Stale" not in registry.list_plugins()
+
+
+def test_cache_that_is_not_a_mapping_is_ignored(plugin_dir, tmp_path):
+    write_plugin(plugin_dir, "mine.py", """
+        from hollywoodos.plugins.base import BlinkenPlugin
+
+        class Mine(BlinkenPlugin):
+            pass
+    """)
+    cache = tmp_path / "cache" / "hollywoodos" / MANIFEST_CACHE
+    cache.parent.mkdir(parents=True)
+    for content in ["[1, 2]", "null", '"text"', "42"]:
+        cache.write_text(content)
+        registry = PluginRegistry(plugin_dir=str(plugin_dir))
+        assert "Mine" in registry.list_plugins()
@@ -0,0 +1,109 @@
+# tests/test_replay.py
+from hollywoodos.utils.replay import LogReplay, timed_lines
+
+
+def write_log(tmp_path, text):
+    path = tmp_path / "recorded.log"
+    path.write_text(text)
+    return str(path)
+
+
+def test_timed_lines_parses_fractions_and_continuations(tmp_path):
+    path = write_log(tmp_path, (
+        "2024-05-01 12:00:00,250 INFO a\n"
+        "  at frame 1\n"
+        "[2024-05-01T12:00:01.5] WARN b\n"
+    ))
+    lines = list(timed_lines(path))
+    start = lines[0][0]
+    assert [(t - start, line) for t, line in lines] == [
+        (0.0, "2024-05-01 12:00:00,250 INFO a"),
+        (0.0, "  at frame 1"),
+        (1.25, "[2024-05-01T12:00:01.5] WARN b"),
+    ]
+
+
+def test_lines_before_first_timestamp_get_its_time(tmp_path):
+    path = write_log(tmp_path, (
+        "# recorded on host x\n"
+        "\n"
+        "2024-05-01 12:00:00 INFO a\n"
+        "2024-05-01 12:00:01 INFO b\n"
+    ))
+    times = [t for t, _ in timed_lines(path)]
+    assert times[0] == times[1] == times[2]
+
+    replay = LogReplay(path, loop=False)
+    assert replay.advance(0) == ["# recorded on host x", "", "2024-05-01 12:00:00 INFO a"]
+    assert replay.advance(1.0) == ["2024-05-01 12:00:01 INFO b"]
+    replay.close()
+
+
+def test_file_without_timestamps(tmp_path):
+    path = write_log(tmp_path, "one\ntwo\n")
+    assert list(timed_lines(path)) == [(0.0, "one"), (0.0, "two")]
+
+
+def test_max_gap_shortens_pauses(tmp_path):
+    path = write_log(tmp_path, (
+        "2024-05-01 12:00:00 a\n"
+        "2024-05-01 13:00:00 b\n"
+        "2024-05-01 13:00:02 c\n"
+    ))
+    times = [t for t, _ in timed_lines(path, max_gap=5)]
+    assert [t - times[0] for t in times] == [0.0, 5.0, 7.0]
+
+
+def test_advance_scales_by_speed(tmp_path):
+    path = write_log(tmp_path, "".join(f"2024-05-01 12:00:{i:02d} line {i}\n" for i in range(10)))
+    replay = LogReplay(path, speed=2.0, loop=False)
+    assert replay.advance(0) == ["2024-05-01 12:00:00 line 0"]
+    assert len(replay.advance(1.0)) == 2
+    assert replay.advance(0.25) == []
+    replay.close()
+
+
+def test_seek_skips_forward_and_reopens_backwards(tmp_path):
+    path = write_log(tmp_path, "".join(f"2024-05-01 12:00:{i:02d} line {i}\n" for i in range(10)))
+    replay = LogReplay(path, start=5.0, loop=False)
+    assert replay.advance(0) == ["2024-05-01 12:00:05 line 5"]
+    replay.seek(2.0)
+    assert replay.advance(0) == ["2024-05-01 12:00:02 line 2"]
+    replay.close()
+
+
+def test_loop_keeps_recording_length(tmp_path):
+    path = write_log(tmp_path, "2024-05-01 12:00:00 a\n2024-05-01 12:00:02 b\n")
+    replay = LogReplay(path)
+    assert replay.advance(0) == ["2024-05-01 12:00:00 a"]
+    assert replay.advance(2.5) == ["2024-05-01 12:00:02 b"]
+    # Half a second into the second pass
+    assert replay.advance(0) == ["2024-05-01 12:00:00 a"]
+    replay.close()
+
+
+def test_zero_length_recording_waits_between_passes(tmp_path):
+    path = write_log(tmp_path, "2024-05-01 12:00:00 only\n")
+    replay = LogReplay(path, min_pass=1.0)
+    emitted = [line for _ in range(30) for line in replay.advance(0.05)]
+    # One and a half seconds at one pass per second
+    assert emitted == ["2024-05-01 12:00:00 only"] * 2
+    replay.close()
+
+
+def test_invalid_timestamps_count_as_untimed(tmp_path):
+    path = write_log(tmp_path, (
+        "0000-00-00 00:00:00 header from mysql\n"
+        "2024-05-01 12:00:00 INFO a\n"
+        "2024-13-01 12:00:00 bad month\n"
+        "2024-05-01 99:00:00 bad hour\n"
+        "2024-05-01 12:00:02 INFO b\n"
+    ))
+    lines = list(timed_lines(path))
+    start = lines[0][0]
+    assert [t - start for t, _ in lines] == [0.0, 0.0, 0.0, 0.0, 2.0]
+
+    replay = LogReplay(path, loop=False)
+    assert len(replay.advance(0)) == 4
+    assert replay.advance(2.0) == ["2024-05-01 12:00:02 INFO b"]
+    replay.close()
@@ -0,0 +1,173 @@
+# tests/test_sysinfo.py
+import dataclasses
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from hollywoodos.plugins.builtin.system_monitor import SystemMonitor, SystemMonitorWidget
+from hollywoodos.utils.sysinfo import SystemSampler
+
+MEMINFO = """MemTotal:       1000 kB
+MemFree:         300 kB
+MemAvailable:    400 kB
+Buffers:          50 kB
+Cached:          200 kB
+SwapTotal:       100 kB
+SwapFree:         75 kB
+"""
+
+
+def fake_system(tmp_path, cpu, sectors, rx):
+    proc = tmp_path / "proc"
+    sys = tmp_path / "sys"
+    (proc / "net").mkdir(parents=True, exist_ok=True)
+    for pid in ("1", "42"):
+        (proc / pid).mkdir(exist_ok=True)
+    (proc / "stat").write_text(f"cpu  {cpu}\ncpu0 {cpu}\n")
+    (proc / "meminfo").write_text(MEMINFO)
+    (proc / "loadavg").write_text("0.50 0.25 0.10 2/120 999\n")
+    (proc / "diskstats").write_text(
+        f"   8       0 sda 1 0 {sectors} 0 1 0 {sectors} 0 0 0 0\n"
+        f"   8       1 sda1 1 0 {sectors} 0 1 0 {sectors} 0 0 0 0\n"
+        f"   7       0 loop0 1 0 {sectors} 0 1 0 {sectors} 0 0 0 0\n"
+    )
+    (proc / "net" / "dev").write_text(
+        "Inter-|   Receive\n face |bytes\n"
+        f"    lo: {rx} 0 0 0 0 0 0 0 {rx} 0 0 0 0 0 0 0\n"
+        f"  eth0: {rx} 0 0 0 0 0 0 0 {rx // 2} 0 0 0 0 0 0 0\n"
+    )
+    for name in ("sda", "loop0"):
+        (sys / "block" / name).mkdir(parents=True, exist_ok=True)
+    zone = sys / "class" / "thermal" / "thermal_zone0"
+    zone.mkdir(parents=True, exist_ok=True)
+    (zone / "temp").write_text("45500\n")
+    return SystemSampler(proc=str(proc), sys=str(sys))
+
+
+def test_first_snapshot(tmp_path):
+    sampler = fake_system(tmp_path, "10 0 10 80 0 0 0 0", 0, 0)
+    snapshot = sampler.sample()
+    assert sampler.snapshot is snapshot
+    assert snapshot.cpu == 20.0
+    assert snapshot.kernel == 10.0
+    assert snapshot.memory == 60.0
+    assert snapshot.swap == 25.0
+    assert snapshot.cache == 20.0
+    assert snapshot.buffers == 5.0
+    assert snapshot.load_avg == (0.5, 0.25, 0.1)
+    assert (snapshot.processes, snapshot.threads) == (2, 120)
+    assert snapshot.temp == 45.5
+    assert snapshot.disk_read == snapshot.network_rx == 0.0
+
+
+def test_rates_are_deltas_between_samples(tmp_path):
+    sampler = fake_system(tmp_path, "10 0 10 80 0 0 0 0", 0, 0)
+    sampler.sample()
+    fake_system(tmp_path, "60 0 10 130 0 0 0 0", 1000, 10000)
+    snapshot = sampler.sample()
+    # 50 of the last 100 ticks were busy
+    assert snapshot.cpu == 50.0
+    assert snapshot.kernel == 0.0
+    # Only the whole physical disk and non-loopback interfaces count
+    elapsed_read = 1000 * 512 / snapshot.disk_read
+    assert abs(snapshot.network_rx * elapsed_read - 10000) < 1
+    assert abs(snapshot.network_tx * elapsed_read - 5000) < 1
+
+
+def test_snapshots_are_immutable(tmp_path):
+    snapshot = fake_system(tmp_path, "10 0 10 80 0 0 0 0", 0, 0).sample()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.cpu = 0
+
+
+def test_thread_runs_while_acquired(tmp_path):
+    sampler = fake_system(tmp_path, "10 0 10 80 0 0 0 0", 0, 0)
+    fast = sampler.acquire(0.01)
+    slow = sampler.acquire(0.5)
+    assert sampler.interval == 0.01
+    sampler.release(fast)
+    assert sampler._stop is not None
+    # Back to the interval of the holders left
+    assert sampler.interval == 0.5
+    sampler.release(fast)
+    assert sampler._stop is not None
+    sampler.release(slow)
+    assert sampler._stop is None
+    assert sampler.interval == sampler.default_interval
+
+
+def test_failed_samples_are_counted(tmp_path):
+    sampler = SystemSampler(proc=str(tmp_path / "missing"), sys=str(tmp_path / "sys"))
+    token = sampler.acquire(0.01)
+    try:
+        for _ in range(200):
+            if sampler.failures >= 2:
+                break
+            time.sleep(0.01)
+    finally:
+        sampler.release(token)
+    assert sampler.failures >= 2
+    assert isinstance(sampler.error, OSError)
+    assert sampler.snapshot is None
+
+
+class Monitor(SystemMonitorWidget):
+    """Records timers and notifications instead of needing a running app"""
+
+    def __init__(self, config, sampler):
+        super().__init__(config)
+        self.sampler = sampler
+        self.timers = []
+        self.notes = []
+
+    def set_timer(self, delay, callback):
+        timer = SimpleNamespace(stop=lambda: None)
+        self.timers.append(timer)
+        return timer
+
+    def notify(self, message, **kwargs):
+        self.notes.append(message)
+
+    def refresh(self, *args, **kwargs):
+        return self
+
+
+def test_monitor_keeps_one_retry_and_falls_back(tmp_path):
+    sampler = SystemSampler(proc=str(tmp_path / "missing"))
+    monitor = Monitor({"metrics": "real"}, sampler)
+    monitor.acquire_sampler()
+    for _ in range(5):
+        monitor._update()
+    assert len(monitor.timers) == 1
+    assert not monitor.notes
+
+    sampler.failures = SystemMonitorWidget.MAX_FAILURES
+    sampler.error = FileNotFoundError("stat")
+    monitor._update()
+    assert monitor.sampler is None
+    assert sampler._stop is None
+    assert len(monitor.notes) == 1
+
+
+def test_real_metrics_without_proc_are_made_up(monkeypatch):
+    monkeypatch.setattr(SystemSampler, "available", classmethod(lambda cls, proc="/proc": False))
+    monitor = SystemMonitorWidget({"metrics": "real"})
+    assert monitor.sampler is None
+    assert monitor._fallback is not None
+
+
+def test_hidden_monitors_release_the_sampler(tmp_path):
+    sampler = fake_system(tmp_path, "10 0 10 80 0 0 0 0", 0, 0)
+    plugin = SystemMonitor({"metrics": "real", "refresh_rate": 0.2})
+    plugin._widget = Monitor(plugin.config, sampler)
+    plugin._widget.acquire_sampler()
+    other = sampler.acquire(2.0)
+    assert sampler.interval == 0.2
+    plugin.on_suspend()
+    assert sampler.interval == 2.0
+    plugin.on_resume()
+    assert sampler.interval == 0.2
+    plugin._widget.release_sampler()
+    sampler.release(other)
+    assert sampler._stop is None
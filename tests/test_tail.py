@@ -0,0 +1,106 @@
+# tests/test_tail.py
+import os
+import time
+
+import pytest
+
+from hollywoodos.utils.tail import FileTailer
+
+
+@pytest.fixture
+def tailers():
+    started = []
+
+    def start(paths, **kwargs):
+        tailer = FileTailer([str(path) for path in paths], poll_interval=0.01, **kwargs)
+        tailer.start()
+        started.append(tailer)
+        return tailer
+
+    yield start
+    for tailer in started:
+        tailer.stop()
+
+
+def collect(tailer, count, timeout=2.0):
+    """Drain until count lines have arrived"""
+    lines = []
+    deadline = time.monotonic() + timeout
+    while len(lines) < count and time.monotonic() < deadline:
+        lines.extend(tailer.drain())
+        time.sleep(0.01)
+    return lines
+
+
+def append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_follows_appended_lines(tmp_path, tailers):
+    path = tmp_path / "app.log"
+    path.write_text("old\n")
+    tailer = tailers([path])
+    time.sleep(0.05)
+    append(path, "one\ntwo\n")
+    assert collect(tailer, 2) == ["one", "two"]
+
+
+def test_backlog_keeps_position_and_unterminated_line(tmp_path, tailers):
+    path = tmp_path / "app.log"
+    path.write_text("a\nb\nc\npartial")
+    tailer = tailers([path], backlog=2)
+    assert collect(tailer, 2) == ["b", "c"]
+    append(path, " line\nnext\n")
+    assert collect(tailer, 2) == ["partial line", "next"]
+
+
+def test_waits_for_missing_file(tmp_path, tailers):
+    path = tmp_path / "later.log"
+    tailer = tailers([path])
+    time.sleep(0.05)
+    path.write_text("hello\n")
+    assert collect(tailer, 1) == ["hello"]
+
+
+def test_rotation_reads_old_file_then_new(tmp_path, tailers):
+    path = tmp_path / "app.log"
+    path.write_text("")
+    tailer = tailers([path])
+    time.sleep(0.05)
+    append(path, "before\n")
+    assert collect(tailer, 1) == ["before"]
+    os.rename(path, tmp_path / "app.log.1")
+    path.write_text("after\n")
+    assert collect(tailer, 1) == ["after"]
+
+
+def test_truncation_starts_again(tmp_path, tailers):
+    path = tmp_path / "app.log"
+    path.write_text("")
+    tailer = tailers([path])
+    time.sleep(0.05)
+    append(path, "first line\n")
+    assert collect(tailer, 1) == ["first line"]
+    with open(path, "w") as f:
+        f.write("new\n")
+    assert collect(tailer, 1) == ["new"]
+
+
+def test_line_without_newline_is_bounded(tmp_path, tailers):
+    path = tmp_path / "blob.bin"
+    path.write_text("")
+    tailer = tailers([path], chunk_size=16)
+    time.sleep(0.05)
+    append(path, "0123456789" * 10)
+    lines = collect(tailer, 3)
+    assert len(lines) == 3 and all(len(line) <= 32 for line in lines)
+    assert len(tailer.sources[0].partial) <= 16
+
+
+def test_drops_and_repeats_are_summarised(tmp_path):
+    path = tmp_path / "app.log"
+    tailer = FileTailer([str(path)], max_pending=3)
+    tailer._queue([b"a", b"b", b"b", b"b", b"c"])
+    assert tailer.drain() == ["... 2 lines dropped ...", "b (repeated 2 times)", "c"]
+    assert tailer.drain() == []
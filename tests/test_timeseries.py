@@ -0,0 +1,54 @@
+# tests/test_timeseries.py
+from hollywoodos.utils.timeseries import RingBuffer, TieredHistory, braille, sparkline
+
+
+def test_ring_buffer_keeps_newest_in_order():
+    ring = RingBuffer(4)
+    assert list(ring.last(4)) == []
+    for value in range(10):
+        ring.append(value)
+    assert len(ring) == 4
+    assert list(ring.last(4)) == [6.0, 7.0, 8.0, 9.0]
+    assert list(ring.last(2)) == [8.0, 9.0]
+    assert list(ring.last(100)) == [6.0, 7.0, 8.0, 9.0]
+    assert ring.version == 10
+
+
+def test_ring_buffer_memory_is_fixed():
+    ring = RingBuffer(16)
+    size = ring.data.buffer_info()[1]
+    for value in range(10000):
+        ring.append(value)
+    assert ring.data.buffer_info()[1] == size
+
+
+def test_tiers_average_buckets():
+    history = TieredHistory(capacity=100)
+    for second in range(125):
+        history.append(second % 20, second + 0.5)
+    assert len(history.ring(1)) == 100
+    # Complete 10 s buckets alternate between the means of 0-9 and 10-19
+    assert list(history.ring(10).last(4)) == [4.5, 14.5, 4.5, 14.5]
+    assert list(history.ring(60).last(2)) == [9.5, 9.5]
+
+
+def test_ring_picks_nearest_tier():
+    history = TieredHistory()
+    assert history.ring(30) is history.ring(10)
+    assert history.ring(600) is history.ring(60)
+
+
+def test_sparkline_fills_width():
+    assert sparkline([0, 50, 100], 3, 100) == " ▄█"
+    assert sparkline([100, 100], 5, 100) == "   ██"
+    assert sparkline([2, 4, 6], 3) == "▃▅█"
+    assert sparkline([], 4) == "    "
+
+
+def test_braille_rows():
+    rows = braille([0, 4, 8, 4], 2, 2, 8)
+    assert len(rows) == 2 and all(len(row) == 2 for row in rows)
+    # Levels 0, 4, 8, 4 of 8 dots: only the third sample reaches the top row
+    assert rows[0] == "⠀⡇"
+    assert rows[1] == "⢸⣿"
+    assert braille([1.0], 3, 1, 1.0)[0] == "  ⢸"